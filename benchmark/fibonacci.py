@@ -0,0 +1,75 @@
+import io
+import os
+import sys
+import time
+
+# Interpret is imported from the root directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from program import createSource  # noqa: E402
+from src.Interpret.Runner import run  # noqa: E402
+
+
+def createProgram(n: int, locals: int) -> str:
+    """
+    Creates a naive recursive Fibonacci program (CALL, PUSHFRAME, POPFRAME for each call).
+
+    :param n:      Computed Fibonacci number
+    :param locals: Number of additional local variables of function
+    :return: XML source of program.
+    """
+    code = [
+        'CREATEFRAME', 'DEFVAR TF@n', 'MOVE TF@n int@' + str(n), 'CALL fib',
+        'DEFVAR GF@result', 'POPS GF@result', 'WRITE GF@result', 'JUMP end',
+        'LABEL fib', 'PUSHFRAME', 'DEFVAR LF@a', 'DEFVAR LF@b', 'DEFVAR LF@c',
+    ]
+    code += ['DEFVAR LF@local' + str(index) for index in range(locals)]
+    code += [
+        'LT LF@c LF@n int@2', 'JUMPIFEQ base LF@c bool@true',
+        'CREATEFRAME', 'DEFVAR TF@n', 'SUB TF@n LF@n int@1', 'CALL fib',
+        'CREATEFRAME', 'DEFVAR TF@n', 'SUB TF@n LF@n int@2', 'CALL fib',
+        'POPS LF@a', 'POPS LF@b', 'ADD LF@a LF@a LF@b', 'PUSHS LF@a', 'POPFRAME', 'RETURN',
+        'LABEL base', 'PUSHS LF@n', 'POPFRAME', 'RETURN',
+        'LABEL end',
+    ]
+
+    return createSource(code)
+
+
+def fibonacci(n: int) -> tuple:
+    """
+    Computes Fibonacci number and number of calls of naive implementation.
+
+    :param n: Computed Fibonacci number
+    :return: Fibonacci number and number of calls.
+    """
+    numbers, calls = [0, 1], [1, 1]
+    for index in range(2, n + 1):
+        numbers.append(numbers[-1] + numbers[-2])
+        calls.append(calls[-1] + calls[-2] + 1)
+    return numbers[n], calls[n]
+
+
+def main(n: int = 20):
+    """
+    Prints time of program and time per call for both engines and different number of local variables.
+
+    :param n: Computed Fibonacci number
+    """
+    expected, calls = fibonacci(n)
+    for locals in [0, 50]:
+        source = createProgram(n, locals)
+        for engine in ['reference', 'compiled']:
+            output = io.StringIO()
+            start = time.perf_counter()
+            code = run(io.StringIO(source), io.StringIO(), output, engine=engine)
+            elapsed = time.perf_counter() - start
+            if code != 0 or output.getvalue() != str(expected):
+                print('fib(%d) failed with code %d' % (n, code))
+                sys.exit(1)
+            print('fib(%d) %-9s locals: %2d  %7.3f s  %6.2f us per call'
+                  % (n, engine, locals + 3, elapsed, elapsed / calls * 1e6))
+
+
+if __name__ == '__main__':
+    main(*[int(argument) for argument in sys.argv[1:]])
@@ -0,0 +1,67 @@
+import io
+import os
+import sys
+import time
+
+# Interpret is imported from the root directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from program import createSource  # noqa: E402
+from src.Interpret.Cache import MemoryCache  # noqa: E402
+from src.Interpret.Runner import run  # noqa: E402
+
+
+def createProgram(length: int) -> str:
+    """
+    Creates a program which jumps over dead instructions into a loop (LABEL, ADD, JUMPIFNEQ).
+    Number of iterations is read from input.
+
+    :param length: Number of dead instructions
+    :return: XML source of program.
+    """
+    code = ['DEFVAR GF@i', 'DEFVAR GF@n', 'READ GF@n int', 'MOVE GF@i int@0', 'JUMP loop']
+    code += ['MOVE GF@i int@0'] * length
+    code += ['LABEL loop', 'ADD GF@i GF@i int@1', 'JUMPIFNEQ loop GF@i GF@n']
+    return createSource(code)
+
+
+def measure(source: str, engine: str, cache: MemoryCache, iterations: int) -> float:
+    """
+    Runs the program.
+
+    :param source:     XML source of program
+    :param engine:     Execution engine
+    :param cache:      Cache of program images (the program is loaded only once)
+    :param iterations: Number of iterations of loop
+    :return: Time of run in seconds.
+    """
+    start = time.perf_counter()
+    code = run(io.StringIO(source), io.StringIO(str(iterations)), io.StringIO(), engine=engine, cache=cache)
+    elapsed = time.perf_counter() - start
+    if code != 0:
+        print('program failed with code %d' % code)
+        sys.exit(1)
+    return elapsed
+
+
+def main(iterations: int = 100000):
+    """
+    Prints time per executed instruction for programs from 100 to 100k instructions.
+    Time of loading and setup is cancelled out by the difference of two runs with different number of iterations.
+
+    :param iterations: Number of iterations of loop in the shorter run
+    """
+    for length in [100, 1000, 10000, 100000]:
+        for engine in ['reference', 'compiled']:
+            cache = MemoryCache()
+            source = createProgram(length)
+            # The best of runs (the first run also loads the program into cache)
+            elapsed = min(measure(source, engine, cache, iterations * 2) for _ in range(3)) \
+                - min(measure(source, engine, cache, iterations) for _ in range(3))
+            # LABEL, ADD and JUMPIFNEQ are executed in each iteration
+            print('%6d instructions  %-9s  %6.3f us per instruction'
+                  % (length, engine, elapsed / (iterations * 3) * 1e6))
+
+
+if __name__ == '__main__':
+    main(*[int(argument) for argument in sys.argv[1:]])
@@ -0,0 +1,44 @@
+import os
+import sys
+import tempfile
+import time
+
+# Interpret is imported from the root directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from program import createSource  # noqa: E402
+from src.Interpret.Loader import Loader  # noqa: E402
+
+# Instructions of benchmark program (repeated), all kinds of operands are validated
+program = [
+    'DEFVAR GF@x', 'MOVE GF@x int@-42', 'ADD GF@x GF@x int@1', 'CONCAT GF@s string@a\\032b GF@s',
+    'JUMPIFNEQ loop GF@x nil@nil', 'LABEL loop', 'READ GF@b bool', 'EQ GF@b bool@true GF@b',
+    'PUSHS GF@x', 'WRITE string@hello',
+]
+
+
+def main(count: int = 500000):
+    """
+    Generates XML source of given number of instructions and prints time of its loading
+    (parsing and validation of instructions by Parser).
+
+    :param count: Number of instructions
+    """
+    code = [program[index % len(program)] for index in range(count)]
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'program.xml')
+        with open(path, 'w') as file:
+            file.write(createSource(code))
+
+        start = time.perf_counter()
+        image = Loader().load(path)
+        elapsed = time.perf_counter() - start
+        if len(image) != count:
+            print('source was not loaded')
+            sys.exit(1)
+
+    print('load: %7.3f s  %6.2f us per instruction (%d instructions)' % (elapsed, elapsed / count * 1e6, count))
+
+
+if __name__ == '__main__':
+    main(*[int(argument) for argument in sys.argv[1:]])
@@ -0,0 +1,85 @@
+import gc
+import os
+import sys
+import tracemalloc
+
+# Interpret is imported from the root directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.Interpret.Instruction import Instruction, Argument  # noqa: E402
+from src.Interpret.Storage import Variables  # noqa: E402
+
+# Instructions of benchmark program (repeated)
+program = [
+    ('MOVE', (('var', 'GF@counter'), ('int', '0'))),
+    ('ADD', (('var', 'GF@counter'), ('var', 'GF@counter'), ('int', '1'))),
+    ('CONCAT', (('var', 'GF@text'), ('var', 'GF@text'), ('string', 'a\\032b'))),
+    ('JUMPIFNEQ', (('label', 'loop'), ('var', 'GF@counter'), ('int', '100'))),
+    ('WRITE', (('var', 'GF@text'),)),
+]
+
+
+def createInstructions(count: int) -> list:
+    """
+    Creates instructions of program (as Interpret does for the program image).
+
+    :param count: Number of instructions
+    :return: List of instructions.
+    """
+    instructions = list()
+    for order in range(1, count + 1):
+        opcode, args = program[order % len(program)]
+        instruction = Instruction()
+        instruction.setOrder(str(order))
+        instruction.setOpcode(opcode)
+        for argType, value in args:
+            instruction.setArg(argType, value)
+        instructions.append(instruction)
+    return instructions
+
+
+def createVariables(count: int) -> Variables:
+    """
+    Registers variables into a frame and initializes them.
+
+    :param count: Number of variables
+    :return: Frame with variables.
+    """
+    variables = Variables()
+    for index in range(count):
+        variable = variables.register(Argument('var', 'GF@variable' + str(index)))
+        variable.value = index
+        variable.type = 'int'
+    return variables
+
+
+def measure(create, count: int) -> float:
+    """
+    Measures memory of created objects by tracemalloc.
+
+    :param create: Function which creates objects
+    :param count:  Number of objects
+    :return: Bytes per object.
+    """
+    gc.collect()
+    tracemalloc.start()
+    objects = create(count)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return size / count
+
+
+def main(instructions: int = 1000000, variables: int = 100000):
+    """
+    Prints memory footprint of instruction and variable.
+
+    :param instructions: Number of instructions of program
+    :param variables:    Number of variables
+    """
+    print('instruction: %7.1f B (%d instructions)' % (measure(createInstructions, instructions), instructions))
+    print('variable:    %7.1f B (%d variables)' % (measure(createVariables, variables), variables))
+
+
+if __name__ == '__main__':
+    main(*[int(argument) for argument in sys.argv[1:]])
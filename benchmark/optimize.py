@@ -0,0 +1,57 @@
+import io
+import os
+import sys
+import time
+
+# Interpret is imported from the root directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from program import createSource  # noqa: E402
+from src.Interpret.Runner import run  # noqa: E402
+
+
+def createProgram(iterations: int) -> str:
+    """
+    Creates a loop in the style of generated code (temporary variables, compare and branch, PUSHS/POPS).
+
+    :param iterations: Number of iterations of loop
+    :return: XML source of program.
+    """
+    code = [
+        'DEFVAR GF@i', 'MOVE GF@i int@0', 'DEFVAR GF@sum', 'MOVE GF@sum int@0', 'DEFVAR GF@tmp',
+        'LABEL loop',
+        'LT GF@tmp GF@i int@' + str(iterations), 'JUMPIFEQ end GF@tmp bool@false',
+        'PUSHS GF@i', 'POPS GF@tmp',
+        'ADD GF@sum GF@sum GF@tmp',
+        'ADD GF@i GF@i int@1',
+        'JUMP loop',
+        'LABEL end',
+        'WRITE GF@sum',
+    ]
+
+    return createSource(code)
+
+
+def main(iterations: int = 100000):
+    """
+    Prints time of loop for both engines with and without peephole optimizer.
+
+    :param iterations: Number of iterations of loop
+    """
+    expected = str(iterations * (iterations - 1) // 2)
+    source = createProgram(iterations)
+    for engine in ['reference', 'compiled']:
+        for optimize in [False, True]:
+            output = io.StringIO()
+            start = time.perf_counter()
+            code = run(io.StringIO(source), io.StringIO(), output, engine=engine, optimize=optimize)
+            elapsed = time.perf_counter() - start
+            if code != 0 or output.getvalue() != expected:
+                print('program failed with code %d' % code)
+                sys.exit(1)
+            print('%-9s optimize: %-5s  %7.3f s  %6.3f us per iteration'
+                  % (engine, optimize, elapsed, elapsed / iterations * 1e6))
+
+
+if __name__ == '__main__':
+    main(*[int(argument) for argument in sys.argv[1:]])
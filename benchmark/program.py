@@ -0,0 +1,27 @@
+# Instructions with label as the first operand
+labelled = ('CALL', 'JUMP', 'LABEL', 'JUMPIFEQ', 'JUMPIFNEQ', 'JUMPIFEQS', 'JUMPIFNEQS')
+
+
+def createSource(code: list) -> str:
+    """
+    Creates XML source of benchmark program from IPPcode21 lines (operands are separated by spaces).
+
+    :param code: Lines of program without the header, e.g. 'ADD GF@i GF@i int@1'
+    :return: XML source of program.
+    """
+    xml = '<?xml version="1.0" encoding="UTF-8"?>\n<program language="IPPcode21">\n'
+    for order, line in enumerate(code, 1):
+        opcode, *args = line.split()
+        xml += '<instruction order="' + str(order) + '" opcode="' + opcode + '">'
+        for index, arg in enumerate(args, 1):
+            if opcode in labelled and index == 1:
+                argType, value = 'label', arg
+            elif opcode == 'READ' and index == 2:
+                argType, value = 'type', arg
+            elif arg[:3] in ('GF@', 'LF@', 'TF@'):
+                argType, value = 'var', arg
+            else:
+                argType, value = arg.split('@', 1)
+            xml += '<arg' + str(index) + ' type="' + argType + '">' + value + '</arg' + str(index) + '>'
+        xml += '</instruction>\n'
+    return xml + '</program>\n'
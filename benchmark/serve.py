@@ -0,0 +1,69 @@
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+# Interpret is imported from the root directory
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, root)
+
+from program import createSource  # noqa: E402
+from src.Interpret.Server import submit  # noqa: E402
+
+
+def createProgram() -> bytes:
+    """
+    Creates a short program which reads a number and writes its square.
+
+    :return: XML source of program.
+    """
+    code = ['DEFVAR GF@x', 'READ GF@x int', 'MUL GF@x GF@x GF@x', 'WRITE GF@x']
+    return createSource(code).encode('utf-8')
+
+
+def main(requests: int = 100):
+    """
+    Prints time of a short program run by a new process and by the server.
+
+    :param requests: Number of runs
+    """
+    source = createProgram()
+    interpret = os.path.join(root, 'interpret.py')
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'program.xml')
+        with open(path, 'wb') as file:
+            file.write(source)
+
+        start = time.perf_counter()
+        for number in range(requests):
+            result = subprocess.run([sys.executable, interpret, '--source=' + path], input=str(number).encode(),
+                                    capture_output=True)
+            if result.returncode != 0 or result.stdout != str(number * number).encode():
+                print('program failed with code %d' % result.returncode)
+                sys.exit(1)
+        elapsed = time.perf_counter() - start
+        print('process  %7.3f s  %7.3f ms per request' % (elapsed, elapsed / requests * 1e3))
+
+        socket = os.path.join(directory, 'interpret.sock')
+        server = subprocess.Popen([sys.executable, interpret, '--serve=' + socket, '--jobs=1'])
+        try:
+            while not os.path.exists(socket):
+                time.sleep(0.01)
+
+            start = time.perf_counter()
+            for number in range(requests):
+                stdout, stderr, code = submit(socket, source, str(number).encode())
+                if code != 0 or stdout != str(number * number):
+                    print('program failed with code %d' % code)
+                    sys.exit(1)
+            elapsed = time.perf_counter() - start
+            print('server   %7.3f s  %7.3f ms per request' % (elapsed, elapsed / requests * 1e3))
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == '__main__':
+    main(*[int(argument) for argument in sys.argv[1:]])
@@ -0,0 +1,107 @@
+import gc
+import io
+import os
+import sys
+import time
+import tracemalloc
+
+# Interpret is imported from the root directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from program import createSource  # noqa: E402
+from src.Interpret.Runner import run  # noqa: E402
+from src.Interpret.Storage import DataStack  # noqa: E402
+from src.Interpret.Value import INT  # noqa: E402
+
+
+def createProgram(depth: int, rounds: int) -> str:
+    """
+    Creates a program which pushes numbers into a stack and pops them back (sums them up).
+
+    :param depth:  Number of pushed values in each round
+    :param rounds: Number of rounds
+    :return: XML source of program.
+    """
+    code = [
+        'DEFVAR GF@round', 'DEFVAR GF@index', 'DEFVAR GF@value', 'DEFVAR GF@sum',
+        'MOVE GF@round int@0', 'MOVE GF@sum int@0',
+        'LABEL round', 'MOVE GF@index int@0',
+        'LABEL push', 'PUSHS GF@index', 'ADD GF@index GF@index int@1',
+        'JUMPIFNEQ push GF@index int@' + str(depth),
+        'LABEL pop', 'POPS GF@value', 'ADD GF@sum GF@sum GF@value', 'SUB GF@index GF@index int@1',
+        'JUMPIFNEQ pop GF@index int@0',
+        'ADD GF@round GF@round int@1', 'JUMPIFNEQ round GF@round int@' + str(rounds),
+        'WRITE GF@sum',
+    ]
+
+    return createSource(code)
+
+
+def pushDictionaries(count: int) -> list:
+    """
+    Pushes values as dictionaries (previous representation of stack items).
+
+    :param count: Number of pushed values
+    :return: Stack.
+    """
+    registry = list()
+    for index in range(count):
+        registry.append({'value': index, 'type': INT})
+    return registry
+
+
+def pushValues(count: int) -> DataStack:
+    """
+    Pushes values into a data stack.
+
+    :param count: Number of pushed values
+    :return: Stack.
+    """
+    stack = DataStack()
+    for index in range(count):
+        stack.push(index, INT)
+    return stack
+
+
+def measure(push, count: int) -> float:
+    """
+    Measures memory of pushed items by tracemalloc (values themselves are included in both cases).
+
+    :param push:  Function which pushes values into a stack
+    :param count: Number of pushed values
+    :return: Bytes per item.
+    """
+    gc.collect()
+    tracemalloc.start()
+    stack = push(count)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del stack
+    return size / count
+
+
+def main(depth: int = 1000, rounds: int = 100):
+    """
+    Prints memory per stack item and time of PUSHS/POPS program for both engines.
+
+    :param depth:  Number of pushed values in each round
+    :param rounds: Number of rounds
+    """
+    print('dictionary item: %6.1f B' % measure(pushDictionaries, depth * rounds))
+    print('data stack item: %6.1f B' % measure(pushValues, depth * rounds))
+
+    expected = str(depth * (depth - 1) // 2 * rounds)
+    source = createProgram(depth, rounds)
+    for engine in ['reference', 'compiled']:
+        output = io.StringIO()
+        start = time.perf_counter()
+        code = run(io.StringIO(source), io.StringIO(), output, engine=engine)
+        elapsed = time.perf_counter() - start
+        if code != 0 or output.getvalue() != expected:
+            print('program failed with code %d' % code)
+            sys.exit(1)
+        print('%-9s %7.3f s  %6.3f us per PUSHS/POPS pair' % (engine, elapsed, elapsed / (depth * rounds) * 1e6))
+
+
+if __name__ == '__main__':
+    main(*[int(argument) for argument in sys.argv[1:]])
@@ -0,0 +1,71 @@
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+# Target of import time (cumulative time of interpret modules) with cached program image in milliseconds
+TARGET = 15
+
+# Root directory of the interpret
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+source = '<?xml version="1.0" encoding="UTF-8"?>\n' \
+         '<program language="IPPcode21">\n' \
+         '<instruction order="1" opcode="WRITE"><arg1 type="string">hello</arg1></instruction>\n' \
+         '</program>\n'
+
+
+def measure(arguments: list, environment: dict) -> tuple:
+    """
+    Runs the interpret with -X importtime.
+
+    :param arguments:   Arguments of interpret
+    :param environment: Environment of process
+    :return: Import time of interpret (in ms) and wall time of process (in ms).
+    """
+    start = time.perf_counter()
+    process = subprocess.run([sys.executable, '-X', 'importtime', os.path.join(root, 'interpret.py')] + arguments,
+                             cwd=tempfile.gettempdir(), env=environment, stdin=subprocess.DEVNULL,
+                             stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    wall = (time.perf_counter() - start) * 1000
+
+    imports = 0
+    for line in process.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if line.startswith('import time:') and line.split('|')[2].strip() == 'src.Interpret.App':
+            imports = int(line.split('|')[1]) / 1000
+    return imports, wall
+
+
+def main(runs: int = 20):
+    """
+    Measures the cold start of interpret (median of runs) and checks the target.
+
+    :param runs: Number of runs of each case
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'hello.src')
+        with open(path, 'w') as file:
+            file.write(source)
+
+        # Separate cache directory, bytecode has to be written (as in installed interpret)
+        environment = dict(os.environ, HOME=directory)
+        environment.pop('PYTHONDONTWRITEBYTECODE', None)
+        arguments = ['--source=' + path, '--input=' + os.devnull]
+        measure(arguments, environment)
+
+        results = dict()
+        for name, extra in [('cached', []), ('no-cache', ['--no-cache'])]:
+            samples = [measure(arguments + extra, environment) for _ in range(runs)]
+            results[name] = (statistics.median(sample[0] for sample in samples),
+                             statistics.median(sample[1] for sample in samples))
+            print('%-9s imports: %6.2f ms  process: %6.2f ms' % ((name,) + results[name]))
+
+    print('target:   imports: %6.2f ms (cached)' % TARGET)
+    sys.exit(0 if results['cached'][0] <= TARGET else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,5 @@
 import sys
 from src.Interpret.App import App
-from src.Support.ErrorHandler import ErrorHandler
-
-handler = ErrorHandler()
 
 # Create Application instance
 app = App()
@@ -10,14 +7,24 @@ app = App()
 # Register arguments
 app.registerArguments([
     "--source=file",
-    "--input=file"
+    "--input=file",
+    "--output=file",
+    "--engine=name",
+    "--no-cache",
+    "--optimize",
+    "--analyze",
+    "--profile=file",
+    "--max-steps=n",
+    "--max-memory=MB",
+    "--checkpoint=file",
+    "--checkpoint-every=n",
+    "--resume=file",
+    "--batch=path",
+    "--jobs=n",
+    "--timeout=seconds",
+    "--report=file",
+    "--serve=path"
 ])
 
-# Listen for arguments
-app.listen(sys.argv)
-
-# Run interpret
-app.runInterpret()
-
-# Terminate app
-app.terminate()
+# Listen for arguments, run interpret and terminate app with its exit code
+app.terminate(app.execute(sys.argv))
@@ -0,0 +1,219 @@
+import operator
+
+from src.Interpret.Instruction import Instruction, Argument
+from src.Interpret.Value import INT, BOOL, STRING, typeName, represent, divide
+
+
+class Analyzer:
+    # Operations folded when all operands are constants of valid types
+    arithmetic = {'ADD': operator.add, 'SUB': operator.sub, 'MUL': operator.mul, 'IDIV': divide}
+    relations = {'LT': operator.lt, 'GT': operator.gt, 'EQ': operator.eq}
+    logic = {'AND': lambda first, second: first and second, 'OR': lambda first, second: first or second,
+             'NOT': operator.not_}
+
+    # Instructions after which the control never continues with the next instruction
+    terminators = ('JUMP', 'RETURN', 'EXIT')
+
+    def __init__(self):
+        """
+        Initializes the static analyzer of program.
+        """
+        self.blocks = 0
+        self.removed = list()
+        self.folded = list()
+        self.unusedLabels = list()
+        self.unusedVariables = list()
+
+    def analyze(self, instructions: list) -> list:
+        """
+        Analyzes the program and reduces it (removes unreachable blocks and folds constant operations).
+        Instructions have to be sorted and have resolved successors and targets, positions of the reduced
+        program have to be resolved again.
+
+        :param instructions: Instructions sorted by order
+        :return: Reduced list of instructions.
+        """
+        blocks = self.createBlocks(instructions)
+        self.blocks = len(blocks)
+
+        reachable = self.__findReachable(instructions, blocks)
+        program = list()
+        for index, (start, end) in enumerate(blocks):
+            if index in reachable:
+                program += instructions[start:end]
+            else:
+                self.removed.append(instructions[start:end])
+
+        for position, instruction in enumerate(program):
+            folded = self.__fold(instruction)
+            if folded is not None:
+                self.folded.append((instruction, folded))
+                program[position] = folded
+
+        self.__findUnused(program)
+        return program
+
+    def report(self) -> str:
+        """
+        Creates a text report of analysis.
+
+        :return: Report of removed, folded and unused parts of program.
+        """
+        string = "========== Analysis ==========\n" \
+                 "Blocks: " + str(self.blocks) + ' (' + str(len(self.removed)) + ' unreachable)\n' \
+                 "Removed instructions: " + str(sum(len(block) for block in self.removed)) + '\n' \
+                 "Folded instructions: " + str(len(self.folded)) + '\n'
+
+        string += '---------- Removed ----------\n'
+        for block in self.removed:
+            first, last = block[0], block[-1]
+            label = ' (' + first.getArg(0).value + ')' if first.isLabel() else ''
+            string += 'orders ' + str(first.order) + '-' + str(last.order) + ': ' + str(len(block)) \
+                + ' instructions' + label + '\n'
+
+        string += '---------- Folded ----------\n'
+        for instruction, folded in self.folded:
+            constant = folded.getArg(1)
+            string += str(instruction.order) + ' ' + instruction.opcode + ' -> MOVE ' \
+                + typeName(constant.type) + '@' + represent(constant.value) + '\n'
+
+        string += '---------- Unused labels ----------\n'
+        for instruction in self.unusedLabels:
+            string += str(instruction.order) + ' ' + instruction.getArg(0).value + '\n'
+
+        string += '---------- Unused variables ----------\n'
+        for instruction in self.unusedVariables:
+            var = instruction.getArg(0)
+            string += str(instruction.order) + ' ' + var.frame + '@' + var.value + '\n'
+        return string + "=============================="
+
+    @staticmethod
+    def createBlocks(instructions: list) -> list:
+        """
+        Splits instructions into basic blocks.
+        Block starts by LABEL or by the instruction after the instruction which transfers control.
+
+        :param instructions: Instructions sorted by order
+        :return: List of blocks as ranges (start, end) of positions.
+        """
+        leaders = [0]
+        for position, instruction in enumerate(instructions):
+            if instruction.isLabel() and position != leaders[-1]:
+                leaders.append(position)
+            if instruction.isJump() or instruction.opcode in Analyzer.terminators:
+                leaders.append(position + 1)
+        return [(start, end) for start, end in zip(leaders, leaders[1:] + [len(instructions)]) if start < end]
+
+    def __findReachable(self, instructions: list, blocks: list) -> set:
+        """
+        Finds blocks reachable from the start of program.
+        Called function returns after its CALL, so the next instruction is reachable from CALL.
+
+        :param instructions: Instructions sorted by order
+        :param blocks:       Basic blocks
+        :return: Indexes of reachable blocks.
+        """
+        if not blocks:
+            return set()
+
+        starts = {start: index for index, (start, end) in enumerate(blocks)}
+        reachable = {0}
+        pending = [0]
+        while pending:
+            start, end = blocks[pending.pop()]
+            last = instructions[end - 1]
+            successors = list()
+            if last.isJump() and last.target is not None:
+                successors.append(last.target)
+            if last.opcode not in self.terminators:
+                successors.append(end)
+            for position in successors:
+                index = starts.get(position)
+                if index is not None and index not in reachable:
+                    reachable.add(index)
+                    pending.append(index)
+        return reachable
+
+    def __fold(self, instruction: Instruction) -> Instruction or None:
+        """
+        Folds an operation with constant operands into MOVE of its result.
+        Operations which would end with an error at runtime are not folded.
+
+        :param instruction: Instruction of program
+        :return: MOVE instruction or None if the instruction can not be folded.
+        """
+        opcode = instruction.opcode
+        operands = instruction.args[1:]
+        if not operands or any(operand.isVar() for operand in operands):
+            return None
+        values = [operand.value for operand in operands]
+        types = set(operand.type for operand in operands)
+        # Int literal which is not a number is left for the runtime
+        if INT in types and any(type(value) is not int for value in values):
+            return None
+
+        if opcode in self.arithmetic:
+            if types != {INT}:
+                return None
+            if opcode == 'IDIV' and values[1] == 0:
+                return None
+            try:
+                return self.__createMove(instruction, 'int', str(self.arithmetic[opcode](*values)))
+            except ValueError:
+                # Result has more digits than can be converted to string, it is left for the runtime
+                return None
+        if opcode in self.relations:
+            if len(types) != 1 or not types <= {INT, BOOL, STRING}:
+                return None
+            return self.__createMove(instruction, 'bool', represent(self.relations[opcode](*values)))
+        if opcode in self.logic:
+            if types != {BOOL}:
+                return None
+            return self.__createMove(instruction, 'bool', represent(self.logic[opcode](*values)))
+        return None
+
+    @staticmethod
+    def __createMove(instruction: Instruction, argType: str, value: str) -> Instruction:
+        """
+        Creates MOVE of constant into the variable of instruction (with the same order).
+
+        :param instruction: Folded instruction
+        :param argType:     Type of constant
+        :param value:       Constant as it is written in IPPcode21
+        :return: MOVE instruction.
+        """
+        move = Instruction()
+        move.setOrder(instruction.order)
+        move.setOpcode('MOVE')
+        move.args = [instruction.getArg(0), Argument(argType, value)]
+        return move
+
+    def __findUnused(self, program: list):
+        """
+        Finds labels which are never jumped to and variables which are defined but never used.
+
+        :param program: Reduced list of instructions
+        """
+        labels = set()
+        variables = set()
+        for instruction in program:
+            if instruction.isJump():
+                labels.add(instruction.getArg(0).value)
+            if instruction.opcode != 'DEFVAR':
+                variables.update(self.__variableKey(arg) for arg in instruction.args if arg.isVar())
+
+        for instruction in program:
+            if instruction.isLabel() and instruction.getArg(0).value not in labels:
+                self.unusedLabels.append(instruction)
+            elif instruction.opcode == 'DEFVAR' and self.__variableKey(instruction.getArg(0)) not in variables:
+                self.unusedVariables.append(instruction)
+
+    @staticmethod
+    def __variableKey(var: Argument) -> tuple:
+        """
+        Creates a key of variable, variable of temporary frame is used as local one after PUSHFRAME.
+
+        :param var: Argument of variable
+        :return: Frame (GF or LF) and name of variable.
+        """
+        return 'GF' if var.frame == 'GF' else 'LF', var.value
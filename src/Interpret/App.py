@@ -1,8 +1,11 @@
 import sys
 
 from src.Interpret.Argument import Argument
+from src.Interpret.Cache import Cache
 from src.Interpret.Core import Interpret
+from src.Interpret.Runner import run
 from src.Support.ErrorHandler import ErrorHandler
+from src.Support.Exception import InterpretException
 
 
 class App:
@@ -34,10 +37,31 @@ class App:
 
         self.parseArguments(arguments)
 
-    def runInterpret(self):
+    def execute(self, arguments: list) -> int:
+        """
+        Listens for arguments and runs the interpret.
+
+        :param arguments: The entered arguments
+        :return: Exit code of application.
+        """
+        try:
+            self.listen(arguments)
+            return self.runInterpret()
+        except InterpretException as exception:
+            return exception.code
+
+    def runInterpret(self) -> int:
         """
         Runs the interpret
+
+        :return: Exit code of program.
         """
+        if self.Argument.isSet('batch'):
+            return self.runBatch()
+
+        if self.Argument.isSet('serve'):
+            return self.runServer()
+
         if self.Argument.isSet('source'):
             sourceFile = self.Argument.getPath('source')
             if not self.Argument.isValidPath(sourceFile):
@@ -52,7 +76,145 @@ class App:
         else:
             inputFile = sys.stdin
 
-        Interpret(sourceFile, inputFile)
+        engine = self.Argument.getValue('engine') if self.Argument.isSet('engine') else 'reference'
+
+        outputFile = self.Argument.getPath('output') if self.Argument.isSet('output') else None
+
+        cache = None if self.Argument.isSet('no-cache') else Cache()
+
+        profileFile = self.Argument.getPath('profile') if self.Argument.isSet('profile') else None
+
+        optimize = self.Argument.isSet('optimize')
+
+        analyze = self.Argument.isSet('analyze')
+
+        budget = self.createBudget(self.getLimit('timeout', float))
+
+        snapshot = self.createSnapshot()
+
+        resumeFile = None
+        if self.Argument.isSet('resume'):
+            resumeFile = self.Argument.getPath('resume')
+            if not self.Argument.isValidPath(resumeFile):
+                self.handler.terminateProgram(11, 'File ' + resumeFile + ' is invalid.')
+
+        return run(sourceFile, inputFile, outputFile, engine=engine, cache=cache, profile=profileFile,
+                   optimize=optimize, analyze=analyze, budget=budget, snapshot=snapshot, resume=resumeFile)
+
+    def runBatch(self) -> int:
+        """
+        Runs the batch of test cases
+
+        :return: 0 if all test cases passed otherwise 1.
+        """
+        for name in ['source', 'input', 'output', 'profile', 'checkpoint', 'checkpoint-every', 'resume']:
+            if self.Argument.isSet(name):
+                self.handler.terminateProgram(10, 'Can not use --' + name + ' with --batch argument.')
+
+        path = self.Argument.getPath('batch')
+        if not self.Argument.isValidPath(path):
+            self.handler.terminateProgram(11, 'File ' + path + ' is invalid.')
+
+        engine = self.Argument.getValue('engine') if self.Argument.isSet('engine') else 'reference'
+        if engine not in Interpret.engines:
+            self.handler.terminateProgram(10, 'Engine ' + engine + ' is invalid.')
+
+        jobs = None
+        if self.Argument.isSet('jobs'):
+            jobs = self.Argument.getValue('jobs')
+            if not jobs.isdigit() or int(jobs) < 1:
+                self.handler.terminateProgram(10, 'Number of jobs ' + jobs + ' is invalid.')
+            jobs = int(jobs)
+
+        # Time limit of test case is enforced by the worker (also when the program waits)
+        timeout = self.getLimit('timeout', float)
+        budget = self.createBudget(None)
+
+        # Process pool is not imported for a single program
+        from src.Interpret.Batch import Batch
+
+        batch = Batch(path, jobs, timeout, engine, not self.Argument.isSet('no-cache'), self.Argument.isSet('optimize'),
+                      self.Argument.isSet('analyze'), budget)
+        report = batch.run()
+        batch.write(report, self.Argument.getPath('report') if self.Argument.isSet('report') else None)
+
+        return 0 if report['summary']['failed'] == 0 else 1
+
+    def runServer(self) -> int:
+        """
+        Runs the server of worker processes on a Unix socket
+
+        :return: 0 when the server is stopped.
+        """
+        for name in ['source', 'input', 'output', 'profile', 'checkpoint', 'checkpoint-every', 'resume', 'report']:
+            if self.Argument.isSet(name):
+                self.handler.terminateProgram(10, 'Can not use --' + name + ' with --serve argument.')
+
+        engine = self.Argument.getValue('engine') if self.Argument.isSet('engine') else 'reference'
+        if engine not in Interpret.engines:
+            self.handler.terminateProgram(10, 'Engine ' + engine + ' is invalid.')
+
+        jobs = self.getLimit('jobs', int)
+
+        # Time limit of each program is checked by its budget (input of program is never waited for)
+        budget = self.createBudget(self.getLimit('timeout', float))
+
+        # Sockets and workers are not imported for a single program
+        from src.Interpret.Server import Server
+
+        server = Server(self.Argument.getPath('serve'), jobs, engine, not self.Argument.isSet('no-cache'),
+                        self.Argument.isSet('optimize'), self.Argument.isSet('analyze'), budget)
+        return server.run()
+
+    def createBudget(self, timeout: float or None):
+        """
+        Creates the execution budget from limits of arguments.
+
+        :param timeout: Time limit in seconds or None
+        :return: Budget or None if no limit is set.
+        """
+        steps = self.getLimit('max-steps', int)
+        memory = self.getLimit('max-memory', float)
+        if steps is None and timeout is None and memory is None:
+            return None
+
+        from src.Interpret.Budget import Budget
+        return Budget(steps, timeout, memory)
+
+    def createSnapshot(self):
+        """
+        Creates the writer of snapshots from arguments.
+
+        :return: Snapshot or None if snapshots are not written.
+        """
+        every = self.getLimit('checkpoint-every', int)
+        if not self.Argument.isSet('checkpoint'):
+            if every is not None:
+                self.handler.terminateProgram(10, 'Can not use --checkpoint-every without --checkpoint argument.')
+            return None
+
+        from src.Interpret.Snapshot import Snapshot
+        return Snapshot(self.Argument.getPath('checkpoint'), every)
+
+    def getLimit(self, name: str, convert) -> int or float or None:
+        """
+        Gets a positive limit from argument.
+
+        :param name:    Name of argument
+        :param convert: Type of limit (int or float)
+        :return: Limit or None if the argument is not set.
+        """
+        if not self.Argument.isSet(name):
+            return None
+
+        value = self.Argument.getValue(name)
+        try:
+            limit = convert(value)
+        except ValueError:
+            self.handler.terminateProgram(10, 'Value ' + value + ' of --' + name + ' is invalid.')
+        if limit <= 0:
+            self.handler.terminateProgram(10, 'Value of --' + name + ' must be positive.')
+        return limit
 
     def parseArguments(self, arguments: list):
         """
@@ -89,10 +251,32 @@ class App:
         print("OPTIONS:")
         print("\t--source=file\tInput file with XML representation of IPPcode21.")
         print("\t--input=file\tFile with inputs for the interpretation of the entered source code.")
+        print("\t--output=file\tFile where the output of interpretation is written (standard output by default).")
+        print("\t--engine=name\tExecution engine: reference (default) or compiled.")
+        print("\t--no-cache\tDo not use (and store) cached program images.")
+        print("\t--optimize\tFuses common sequences of instructions into superinstructions before execution.")
+        print("\t--analyze\tRemoves unreachable code and folds constant operations, report is written into stderr.")
+        print("\t--profile=file\tProfiles the program, JSON profile is written into file and its report into stderr.")
+        print("\t--checkpoint=file\tWrites snapshot of interpret into file on SIGUSR1 and BREAK.")
+        print("\t--checkpoint-every=n\tWrites snapshot also after each n executed instructions.")
+        print("\t--resume=file\tContinues the program from snapshot (with the same source and input).")
+        print("\t--max-steps=n\tTerminates the program with code 60 after n executed instructions.")
+        print("\t--timeout=seconds\tTerminates the program with code 61 after the time limit.")
+        print("\t--max-memory=MB\tTerminates the program with code 62 when it allocates more memory.")
+        print("BATCH:")
+        print("\t--batch=path\tRuns test cases (.src, .in, .out, .rc) from directory or manifest in process pool.")
+        print("\t--jobs=n\tNumber of worker processes (number of cores by default).")
+        print("\t--timeout=seconds\tTime limit of each test case (--max-steps and --max-memory limit each case too).")
+        print("\t--report=file\tFile where the JSON report is written (standard output by default).")
+        print("SERVER:")
+        print("\t--serve=path\tRuns programs sent to the Unix socket by warm worker processes (--jobs limits them).")
         self.handler.terminateProgram(0)
 
-    def terminate(self):
+    @staticmethod
+    def terminate(code: int = 0):
         """
         Terminate application
+
+        :param code: Exit code
         """
-        self.handler.terminateProgram(0, 'Interpretation is done.')
+        sys.exit(code)
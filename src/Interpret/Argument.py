@@ -88,6 +88,15 @@ class Argument:
         :param name: Name of argument
         :return: Path of argument or Internal Error if fail
         """
+        return self.getValue(name)
+
+    def getValue(self, name: str) -> str:
+        """
+        Gets value from argument
+
+        :param name: Name of argument
+        :return: Value of argument or Internal Error if fail
+        """
         # Found argument
         found = name
 
@@ -99,7 +108,7 @@ class Argument:
         eqPos = found.find('=')
 
         if eqPos == -1:
-            self.handler.terminateProgram(99, 'This argument does not have path.')
+            self.handler.terminateProgram(99, 'This argument does not have value.')
 
         return found[(eqPos+1):]
 
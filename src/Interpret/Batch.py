@@ -0,0 +1,218 @@
+import hashlib
+import io
+import json
+import os
+import signal
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from src.Interpret.Cache import Cache, MemoryCache
+from src.Interpret.Runner import run
+from src.Support.ErrorHandler import ErrorHandler
+
+# Cache of program images in the worker process, each distinct source is loaded once
+images = None
+
+
+class BatchTimeout(Exception):
+    """
+    Test case exceeded its time limit.
+    """
+
+
+def initializeWorker(cached: bool):
+    """
+    Initializes the worker process of batch.
+
+    :param cached: True if the persistent cache of program images is used
+    """
+    global images
+    images = MemoryCache(Cache() if cached else None)
+
+
+def alarm(signum, frame):
+    """
+    Interrupts the test case when its time limit is exceeded.
+    """
+    raise BatchTimeout()
+
+
+def runCase(case: dict, engine: str, timeout: float or None, optimize: bool = False, analyze: bool = False,
+            budget=None) -> dict:
+    """
+    Runs a test case in the worker process.
+
+    :param case:     Test case (name, src, in, output, rc)
+    :param engine:   Execution engine
+    :param timeout:  Time limit of test case in seconds or None
+    :param optimize: True if instructions are fused into superinstructions by peephole optimizer
+    :param analyze:  True if the program is reduced by static analyzer
+    :param budget:   Budget of instructions and memory or None
+    :return: Result of test case.
+    """
+    if images is None:
+        initializeWorker(False)
+
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    result = {'name': case['name'], 'source': case['src'], 'code': None, 'status': 'done'}
+
+    if timeout:
+        signal.signal(signal.SIGALRM, alarm)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+
+    start = time.perf_counter()
+    try:
+        stdin = open(case['in']) if os.path.isfile(case['in']) else io.StringIO('')
+        with stdin:
+            result['code'] = run(case['src'], stdin, stdout, stderr, engine, images, optimize=optimize,
+                                     analyze=analyze, budget=budget)
+    except BatchTimeout:
+        result['status'] = 'timeout'
+    except Exception as exception:
+        result['status'] = 'error'
+        result['error'] = type(exception).__name__ + ': ' + str(exception)
+    finally:
+        if timeout:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+    result['time'] = round(time.perf_counter() - start, 6)
+
+    output = stdout.getvalue()
+    result['stdout'] = hashlib.sha256(output.encode('utf-8')).hexdigest()
+    result['expected'] = case['rc']
+    result['passed'] = result['code'] == case['rc'] and (case['rc'] != 0 or output == case['output'])
+    return result
+
+
+class Batch:
+    handler = ErrorHandler()
+
+    def __init__(self, path: str, jobs: int = None, timeout: float = None, engine: str = 'reference',
+                 cached: bool = True, optimize: bool = False, analyze: bool = False, budget=None):
+        """
+        Initializes the batch of test cases (.src, .in, .out, .rc) in the layout of test.php.
+
+        :param path:     Directory of test cases (searched recursively) or manifest file
+        :param jobs:     Number of worker processes (number of cores by default)
+        :param timeout:  Time limit of each test case in seconds or None
+        :param engine:   Execution engine
+        :param cached:   True if the persistent cache of program images is used
+        :param optimize: True if instructions are fused into superinstructions by peephole optimizer
+        :param analyze:  True if programs are reduced by static analyzer
+        :param budget:   Budget of instructions and memory of each test case or None
+        """
+        self.path = path
+        self.jobs = jobs or os.cpu_count() or 1
+        self.timeout = timeout
+        self.engine = engine
+        self.cached = cached
+        self.optimize = optimize
+        self.analyze = analyze
+        self.budget = budget
+
+    def collect(self) -> list:
+        """
+        Collects test cases from the directory or the manifest.
+        Each line of manifest is a path of .src file, optionally followed by a path of .in file,
+        expected .out and .rc files are named by the .in file then. Paths are relative to the manifest.
+
+        :return: List of test cases.
+        """
+        cases = list()
+        if os.path.isdir(self.path):
+            for directory, directories, files in os.walk(self.path):
+                directories.sort()
+                for file in sorted(files):
+                    if file.endswith('.src'):
+                        cases.append(self.__createCase(os.path.join(directory, file)))
+        else:
+            try:
+                with open(self.path) as manifest:
+                    lines = [line.split() for line in manifest]
+            except OSError as exception:
+                self.handler.terminateProgram(11, 'Can not open batch manifest: ' + str(exception))
+            root = os.path.dirname(self.path)
+            for line in lines:
+                if len(line) == 0 or line[0].startswith('#'):
+                    continue
+                if len(line) > 2:
+                    self.handler.terminateProgram(11, 'Invalid line of batch manifest: ' + ' '.join(line))
+                paths = [os.path.join(root, path) for path in line]
+                cases.append(self.__createCase(*paths))
+
+        # Cases with the same source run one after another in the same worker
+        cases.sort(key=lambda item: item['src'])
+        return cases
+
+    def run(self) -> dict:
+        """
+        Runs all test cases across the process pool.
+
+        :return: Report of batch (results of cases and summary).
+        """
+        cases = self.collect()
+        start = time.perf_counter()
+
+        chunk = max(1, min(16, len(cases) // (self.jobs * 4)))
+        try:
+            with ProcessPoolExecutor(self.jobs, initializer=initializeWorker, initargs=(self.cached,)) as executor:
+                results = list(executor.map(runCase, cases, [self.engine] * len(cases), [self.timeout] * len(cases),
+                                            [self.optimize] * len(cases), [self.analyze] * len(cases),
+                                            [self.budget] * len(cases), chunksize=chunk))
+        except BrokenProcessPool as exception:
+            self.handler.terminateProgram(99, 'Worker of batch failed: ' + str(exception))
+
+        return {
+            'summary': {
+                'total': len(results),
+                'passed': sum(1 for result in results if result['passed']),
+                'failed': sum(1 for result in results if not result['passed']),
+                'timeouts': sum(1 for result in results if result['status'] == 'timeout'),
+                'errors': sum(1 for result in results if result['status'] == 'error'),
+                'jobs': self.jobs,
+                'time': round(time.perf_counter() - start, 6),
+            },
+            'cases': results,
+        }
+
+    def write(self, report: dict, reportFile: str = None):
+        """
+        Writes the report as JSON.
+
+        :param report:     Report of batch
+        :param reportFile: Path of report file or None for standard output
+        """
+        if reportFile is None:
+            print(json.dumps(report, indent=2))
+            return
+
+        try:
+            with open(reportFile, 'w') as file:
+                json.dump(report, file, indent=2)
+        except OSError as exception:
+            self.handler.terminateProgram(12, 'Can not write batch report: ' + str(exception))
+
+    @staticmethod
+    def __createCase(source: str, inputFile: str = None) -> dict:
+        """
+        Creates a test case, missing .in and .out are empty and missing .rc is 0 (as in test.php).
+
+        :param source:    Path of .src file
+        :param inputFile: Path of .in file or None if it is named by the source
+        :return: Test case.
+        """
+        base = os.path.splitext(inputFile if inputFile is not None else source)[0]
+        case = {'name': os.path.basename(base), 'src': source, 'in': inputFile or base + '.in', 'output': '', 'rc': 0}
+
+        try:
+            with open(base + '.out') as file:
+                case['output'] = file.read()
+        except OSError:
+            pass
+        try:
+            with open(base + '.rc') as file:
+                case['rc'] = int(file.read().strip() or 0)
+        except (OSError, ValueError):
+            pass
+        return case
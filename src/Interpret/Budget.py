@@ -0,0 +1,127 @@
+import os
+import time
+
+from src.Support.ErrorHandler import ErrorHandler
+
+
+class Budget:
+    handler = ErrorHandler()
+
+    # Number of executed instructions between two checks of time and memory
+    INTERVAL = 1024
+
+    def __init__(self, steps: int = None, timeout: float = None, memory: float = None):
+        """
+        Initializes the execution budget of program.
+        Limits are checked by the execution loop in batches of instructions, so the loop only compares
+        the counter of executed instructions with the next checkpoint.
+
+        :param steps:   Maximal number of executed instructions or None
+        :param timeout: Maximal wall-clock time of execution in seconds or None
+        :param memory:  Maximal growth of resident memory during execution in megabytes or None
+        """
+        self.steps = steps
+        self.timeout = timeout
+        self.memory = int(memory * 1024 * 1024) if memory is not None else None
+        self.deadline = None
+        self.baseline = None
+        self.statm = None
+        self.previous = None
+
+    def start(self, executed: int = 0) -> int:
+        """
+        Starts measuring of execution (time and memory are measured from now).
+
+        :param executed: Number of executed instructions (not 0 in resumed program)
+        :return: Number of executed instructions when the budget is checked first.
+        """
+        if self.timeout is not None:
+            self.deadline = time.monotonic() + self.timeout
+        if self.memory is not None:
+            try:
+                self.statm = os.open('/proc/self/statm', os.O_RDONLY)
+            except (OSError, AttributeError):
+                self.statm = None
+            self.baseline = self.__residentMemory()
+            self.__limitAddressSpace()
+        return self.__checkpoint(executed)
+
+    def stop(self):
+        """
+        Stops measuring of execution.
+        """
+        if self.previous is not None:
+            import resource
+            resource.setrlimit(resource.RLIMIT_AS, self.previous)
+            self.previous = None
+        if self.statm is not None:
+            os.close(self.statm)
+            self.statm = None
+
+    def check(self, executed: int) -> int:
+        """
+        Checks the budget before the next instruction is executed.
+
+        :param executed: Number of executed instructions
+        :return: Number of executed instructions when the budget is checked next time.
+        """
+        if self.steps is not None and executed >= self.steps:
+            self.handler.terminateProgram(60, 'Limit of ' + str(self.steps) + ' executed instructions exceeded.')
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            self.handler.terminateProgram(61, 'Time limit of ' + str(self.timeout) + ' s exceeded.')
+        if self.baseline is not None:
+            used = self.__residentMemory() - self.baseline
+            if used > self.memory:
+                self.handler.terminateProgram(62, 'Memory limit exceeded (' + str(used // (1024 * 1024)) + ' MB).')
+        return self.__checkpoint(executed)
+
+    def exceedMemory(self):
+        """
+        Terminates the program which has run out of memory (memory limit is set).
+        """
+        self.handler.terminateProgram(62, 'Memory limit exceeded (out of memory).')
+
+    def __limitAddressSpace(self):
+        """
+        Limits the address space of process, so the program which grows faster than the budget is checked
+        runs out of memory (MemoryError) instead of being killed by the system.
+        """
+        if self.statm is None:
+            return
+        try:
+            import resource
+            soft, hard = resource.getrlimit(resource.RLIMIT_AS)
+            limit = int(os.pread(self.statm, 64, 0).split()[0]) * os.sysconf('SC_PAGE_SIZE') + self.memory
+            if soft != resource.RLIM_INFINITY:
+                limit = min(limit, soft)
+            resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+        except (ImportError, ValueError, OSError):
+            return
+        self.previous = (soft, hard)
+
+    def __residentMemory(self) -> int or None:
+        """
+        Gets resident memory of the process.
+
+        :return: Resident memory in bytes or None if it can not be measured.
+        """
+        if self.statm is not None:
+            return int(os.pread(self.statm, 64, 0).split()[1]) * os.sysconf('SC_PAGE_SIZE')
+        try:
+            import resource
+        except ImportError:
+            return None
+        # Peak resident memory (in kilobytes on Linux) is used where /proc is not available
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+    def __checkpoint(self, executed: int) -> int:
+        """
+        Gets the next checkpoint.
+
+        :param executed: Number of executed instructions
+        :return: Number of executed instructions when the budget is checked next time.
+        """
+        checkpoint = executed + self.INTERVAL
+        if self.steps is not None:
+            checkpoint = min(checkpoint, self.steps)
+        return checkpoint
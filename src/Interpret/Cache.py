@@ -0,0 +1,193 @@
+import hashlib
+import marshal
+import os
+
+# Version of program image, has to be changed whenever the image format changes
+IMAGE_VERSION = 1
+
+
+class Cache:
+    def __init__(self, directory: str = None, limit: int = 128 * 1024 * 1024):
+        """
+        Initializes the cache of program images.
+
+        :param directory: Directory of cache (~/.cache/ipp21-interpret by default)
+        :param limit:     Maximal size of all images in bytes
+        """
+        if directory is None:
+            directory = os.path.join(os.path.expanduser('~'), '.cache', 'ipp21-interpret')
+        self.directory = directory
+        self.limit = limit
+
+    @staticmethod
+    def key(content: bytes) -> str:
+        """
+        Creates a key of source content.
+
+        :param content: Content of XML source
+        :return: Hash of content.
+        """
+        return hashlib.sha256(content).hexdigest()
+
+    @staticmethod
+    def keyOfFile(path: str) -> str:
+        """
+        Creates a key of source file without loading it into memory.
+
+        :param path: Path of XML source
+        :return: Hash of file content.
+        """
+        digest = hashlib.sha256()
+        with open(path, 'rb') as file:
+            for chunk in iter(lambda: file.read(1 << 20), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def load(self, key: str) -> list or None:
+        """
+        Loads a program image.
+
+        :param key: Key of source
+        :return: Program image or None if it is not cached.
+        """
+        path = self.__path(key)
+        try:
+            with open(path, 'rb') as file:
+                version, image = marshal.load(file)
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, ValueError, TypeError):
+            self.__remove(path)
+            return None
+
+        if version != IMAGE_VERSION:
+            self.__remove(path)
+            return None
+
+        # Mark image as recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return image
+
+    def store(self, key: str, image: list):
+        """
+        Stores a program image and evicts least recently used images over the limit.
+        Cache is only an optimization, so failures are ignored.
+
+        :param key:   Key of source
+        :param image: Program image
+        """
+        data = marshal.dumps((IMAGE_VERSION, image))
+        if len(data) > self.limit:
+            return
+
+        path = self.__path(key)
+        temporary = path + '.' + str(os.getpid())
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(temporary, 'wb') as file:
+                file.write(data)
+            os.replace(temporary, path)
+        except OSError:
+            self.__remove(temporary)
+            return
+
+        self.__evict()
+
+    def __evict(self):
+        """
+        Removes least recently used images until the cache fits the limit.
+        """
+        images = list()
+        try:
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.image'):
+                        status = entry.stat()
+                        images.append((status.st_mtime, status.st_size, entry.path))
+        except OSError:
+            return
+
+        size = sum(image[1] for image in images)
+        for mtime, imageSize, path in sorted(images):
+            if size <= self.limit:
+                break
+            self.__remove(path)
+            size -= imageSize
+
+    def __path(self, key: str) -> str:
+        """
+        Gets path of image.
+
+        :param key: Key of source
+        :return: Path of image in cache directory.
+        """
+        return os.path.join(self.directory, key + '.image')
+
+    @staticmethod
+    def __remove(path: str):
+        """
+        Removes a file, missing file is ignored.
+
+        :param path: Path of removed file
+        """
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+class MemoryCache:
+    def __init__(self, cache: Cache = None, limit: int = 256):
+        """
+        Initializes the in-memory cache of program images for a long-lived process.
+        Images which are not in memory are looked up in the (optional) persistent cache.
+
+        :param cache: Persistent cache or None if it is not used
+        :param limit: Maximal number of images in memory
+        """
+        self.images = dict()
+        self.cache = cache
+        self.limit = limit
+
+    key = staticmethod(Cache.key)
+    keyOfFile = staticmethod(Cache.keyOfFile)
+
+    def load(self, key: str) -> list or None:
+        """
+        Loads a program image.
+
+        :param key: Key of source
+        :return: Program image or None if it is not cached.
+        """
+        image = self.images.get(key)
+        if image is None and self.cache is not None:
+            image = self.cache.load(key)
+        if image is not None:
+            self.__keep(key, image)
+        return image
+
+    def store(self, key: str, image: list):
+        """
+        Stores a program image.
+
+        :param key:   Key of source
+        :param image: Program image
+        """
+        self.__keep(key, image)
+        if self.cache is not None:
+            self.cache.store(key, image)
+
+    def __keep(self, key: str, image: list):
+        """
+        Keeps an image as the most recently used one, the least recently used image over the limit is removed.
+
+        :param key:   Key of source
+        :param image: Program image
+        """
+        self.images.pop(key, None)
+        self.images[key] = image
+        if len(self.images) > self.limit:
+            del self.images[next(iter(self.images))]
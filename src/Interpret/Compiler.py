@@ -0,0 +1,793 @@
+import operator
+
+from src.Interpret.Inference import Inference
+from src.Interpret.Instruction import Instruction, Superinstruction, Argument
+from src.Interpret.Value import NIL, INT, BOOL, STRING, typeName, represent, divide
+from src.Support.ErrorHandler import ErrorHandler
+from src.Support.Exception import InterpretException
+
+
+class Compiler:
+    handler = ErrorHandler()
+
+    arithmetic = {'ADD': operator.add, 'SUB': operator.sub, 'MUL': operator.mul}
+    relations = {'LT': operator.lt, 'GT': operator.gt, 'EQ': operator.eq}
+
+    def __init__(self, interpret):
+        """
+        Initializes the compiler.
+
+        :param interpret: Interpret which storage and inputs are used by compiled operations
+        """
+        self.interpret = interpret
+        self.frames = interpret.storage.frames
+        # Types of global variables proven before each instruction (by Inference) or None
+        self.types = interpret.types
+
+    def compile(self, instructions: list) -> list:
+        """
+        Compiles instructions into operations.
+
+        :param instructions: Instructions sorted by order
+        :return: List of operations, each operation returns position of the next operation.
+        """
+        if self.types is None:
+            return [self.compileInstruction(instruction) for instruction in instructions]
+        return [self.compileInstruction(instruction, known) for instruction, known in zip(instructions, self.types)]
+
+    def compileInstruction(self, instruction: Instruction, known: dict = None):
+        """
+        Compiles an instruction into an operation with already bound operands.
+
+        :param instruction: Compiled instruction
+        :param known:       Types of global variables proven before the instruction or None
+        :return: Operation of instruction.
+        """
+        handler = self.handler
+        storage = self.interpret.storage
+        frames = self.frames
+        following = instruction.next
+        target = instruction.target
+        opcode = instruction.opcode
+
+        if type(instruction) is Superinstruction:
+            return self.compileSuperinstruction(instruction, known)
+
+        if known is not None:
+            operation = self.compileProven(instruction, known)
+            if operation is not None:
+                return operation
+
+        if opcode == 'MOVE':  # MOVE <var> <symb>
+            var = self.__operand(instruction.getArg(0), False)
+            symb = self.__operand(instruction.getArg(1))
+
+            def move():
+                variable = var()
+                source = symb()
+                variable.value = source.value
+                variable.type = source.type
+                return following
+            return move
+        elif opcode == 'CREATEFRAME':  # CREATEFRAME
+            def createFrame():
+                frames.create('temp')
+                return following
+            return createFrame
+        elif opcode == 'PUSHFRAME':  # PUSHFRAME
+            def pushFrame():
+                frames.create('local')
+                return following
+            return pushFrame
+        elif opcode == 'POPFRAME':  # POPFRAME
+            def popFrame():
+                frames.pop()
+                return following
+            return popFrame
+        elif opcode == 'DEFVAR':  # DEFVAR <var>
+            arg = instruction.getArg(0)
+
+            def defVar():
+                frames.registerVar(arg)
+                return following
+            return defVar
+        elif opcode == 'CALL':  # CALL <label>
+            label = instruction.getArg(0)
+
+            def call():
+                if target is None:
+                    handler.terminateProgram(52, 'Label ' + label.value + ' does not exist.')
+                storage.calls.push(instruction)
+                return target
+            return call
+        elif opcode == 'RETURN':  # RETURN
+            def ret():
+                return storage.calls.pop().next
+            return ret
+        elif opcode == 'PUSHS':  # PUSHS <symb>
+            symb = self.__operand(instruction.getArg(0))
+            values = storage.stack.values
+            types = storage.stack.types
+
+            def pushs():
+                source = symb()
+                values.append(source.value)
+                types.append(source.type)
+                return following
+            return pushs
+        elif opcode == 'POPS':  # POPS <var>
+            var = self.__operand(instruction.getArg(0), False)
+            values = storage.stack.values
+            types = storage.stack.types
+
+            def pops():
+                variable = var()
+                if not values:
+                    storage.stack.empty()
+                variable.value = values.pop()
+                variable.type = types.pop()
+                return following
+            return pops
+        elif opcode in self.arithmetic or opcode == 'IDIV':  # ADD/SUB/MUL/IDIV <var> <symb1> <symb2>
+            var, symb1, symb2 = self.__operands(instruction)
+            calculate = self.arithmetic.get(opcode)
+
+            def arithmetic():
+                variable = var()
+                first = symb1()
+                second = symb2()
+                if first.type != INT or second.type != INT:
+                    handler.terminateProgram(53, 'Int expected')
+                if calculate is None:
+                    if second.value == 0:
+                        handler.terminateProgram(57, 'Division by zero.')
+                    variable.value = divide(first.value, second.value)
+                else:
+                    variable.value = calculate(first.value, second.value)
+                variable.type = INT
+                return following
+            return arithmetic
+        elif opcode in self.relations:  # LT/GT/EQ <var> <symb1> <symb2>
+            var, symb1, symb2 = self.__operands(instruction)
+            compare = self.relations.get(opcode)
+
+            def relation():
+                variable = var()
+                first = symb1()
+                second = symb2()
+                if first.type != second.type or first.type == NIL:
+                    handler.terminateInterpret(53, 'Types of operands do not match '
+                                               + typeName(first.type) + ' != ' + typeName(second.type))
+                if first.type > STRING:
+                    handler.terminateInterpret(53, 'Not valid types <' + typeName(first.type) + ':symb1> '
+                                                   '<' + typeName(second.type) + ':symb2>')
+                variable.value = compare(first.value, second.value)
+                variable.type = BOOL
+                return following
+            return relation
+        elif opcode == 'AND' or opcode == 'OR':  # AND/OR <var> <symb1> <symb2>
+            var, symb1, symb2 = self.__operands(instruction)
+            conjunction = opcode == 'AND'
+
+            def logic():
+                variable = var()
+                first = symb1()
+                second = symb2()
+                if first.type != BOOL or second.type != BOOL:
+                    handler.terminateProgram(53, 'Expected Boolean.')
+                if conjunction:
+                    variable.value = first.value and second.value
+                else:
+                    variable.value = first.value or second.value
+                variable.type = BOOL
+                return following
+            return logic
+        elif opcode == 'NOT':  # NOT <var> <symb>
+            var, symb = self.__operands(instruction)
+
+            def negation():
+                variable = var()
+                source = symb()
+                if source.type != BOOL:
+                    handler.terminateProgram(53, 'Expected Boolean.')
+                variable.value = not source.value
+                variable.type = BOOL
+                return following
+            return negation
+        elif opcode == 'INT2CHAR':  # INT2CHAR <var> <symb>
+            var, symb = self.__operands(instruction)
+
+            def int2char():
+                variable = var()
+                source = symb()
+                if source.type != INT:
+                    handler.terminateInterpret(53, 'Int is expected as second parameter.')
+                try:
+                    variable.value = chr(source.value)
+                except (ValueError, OverflowError):
+                    handler.terminateInterpret(58, 'Value of second parameter is out of range.')
+                variable.type = STRING
+                return following
+            return int2char
+        elif opcode == 'STRI2INT' or opcode == 'GETCHAR':  # STRI2INT/GETCHAR <var> <symb1> <symb2>
+            var, symb1, symb2 = self.__operands(instruction)
+            ordinal = opcode == 'STRI2INT'
+
+            def character():
+                variable = var()
+                first = symb1()
+                second = symb2()
+                if first.type != STRING or second.type != INT:
+                    handler.terminateInterpret(53, 'Params error (<got:expected>) '
+                                                   '<' + typeName(first.type) + ':string> '
+                                                   '<' + typeName(second.type) + ':int>')
+                index = second.value
+                if index >= len(first.value) or index < 0:
+                    handler.terminateInterpret(58, 'Index is out of range.')
+                if ordinal:
+                    variable.value = ord(first.value[index])
+                    variable.type = INT
+                else:
+                    variable.value = first.value[index]
+                    variable.type = STRING
+                return following
+            return character
+        elif opcode == 'READ':  # READ <var> <type>
+            var = self.__operand(instruction.getArg(0), False)
+            readType = instruction.getArg(1).value
+            read = self.interpret.read
+
+            def readInput():
+                read(var(), readType)
+                return following
+            return readInput
+        elif opcode == 'WRITE':  # WRITE <symb>
+            symb = self.__operand(instruction.getArg(0))
+            output = self.interpret.output.write
+
+            def write():
+                source = symb()
+                if source.type == STRING:
+                    output(source.value)
+                elif source.type == INT:
+                    output(str(source.value))
+                elif source.type == BOOL:
+                    output(represent(source.value) + '\n')
+                else:
+                    output('\n')
+                return following
+            return write
+        elif opcode == 'CONCAT':  # CONCAT <var> <symb1> <symb2>
+            var, symb1, symb2 = self.__operands(instruction)
+
+            def concat():
+                variable = var()
+                first = symb1()
+                second = symb2()
+                if first.type != STRING or second.type != STRING:
+                    handler.terminateInterpret(53, 'Can concatenate only strings.')
+                variable.value = first.value + second.value
+                variable.type = STRING
+                return following
+            return concat
+        elif opcode == 'STRLEN':  # STRLEN <var> <symb>
+            var, symb = self.__operands(instruction)
+
+            def strlen():
+                variable = var()
+                source = symb()
+                if source.type != STRING:
+                    handler.terminateInterpret(53, 'Second parameter is not a string.')
+                variable.value = len(source.value)
+                variable.type = INT
+                return following
+            return strlen
+        elif opcode == 'SETCHAR':  # SETCHAR <var> <symb1> <symb2>
+            var = self.__operand(instruction.getArg(0))
+            symb1 = self.__operand(instruction.getArg(1))
+            symb2 = self.__operand(instruction.getArg(2))
+
+            def setChar():
+                variable = var()
+                first = symb1()
+                second = symb2()
+                if variable.type != STRING or first.type != INT or second.type != STRING:
+                    handler.terminateInterpret(53, 'Params error (<got:expected>) '
+                                                   '<' + typeName(variable.type) + ':string> '
+                                                   '<' + typeName(first.type) + ':string> '
+                                                   '<' + typeName(second.type) + ':int>')
+                index = first.value
+                if index >= len(variable.value) or index < 0 or not len(second.value):
+                    handler.terminateInterpret(58, 'Index is out of range or third parameter is empty.')
+                variable.value = variable.value[0:index] + second.value[0] + variable.value[index+1:]
+                return following
+            return setChar
+        elif opcode == 'TYPE':  # TYPE <var> <symb>
+            var = self.__operand(instruction.getArg(0), False)
+            symb = self.__operand(instruction.getArg(1), False)
+
+            def typeOf():
+                variable = var()
+                source = symb()
+                variable.value = typeName(source.type) if source.isInitialized() else ''
+                variable.type = STRING
+                return following
+            return typeOf
+        elif opcode == 'JUMP':  # JUMP <label>
+            label = instruction.getArg(0)
+
+            def jump():
+                if target is None:
+                    handler.terminateProgram(52, 'Label ' + label.value + ' does not exist.')
+                return target
+            return jump
+        elif opcode == 'JUMPIFEQ' or opcode == 'JUMPIFNEQ':  # JUMPIF(N)EQ <label> <symb1> <symb2>
+            symb1 = self.__operand(instruction.getArg(1))
+            symb2 = self.__operand(instruction.getArg(2))
+            equal = opcode == 'JUMPIFEQ'
+
+            def jumpIf():
+                first = symb1()
+                second = symb2()
+                if target is None:
+                    handler.terminateInterpret(52, 'Label does not exists.')
+                if first.type != NIL and second.type != NIL and first.type != second.type:
+                    handler.terminateInterpret(53, "Types does not match or symbols are not 'nil'.")
+                if (first.value == second.value) == equal:
+                    return target + 1
+                return following
+            return jumpIf
+        elif opcode == 'EXIT':  # EXIT <symb>
+            symb = self.__operand(instruction.getArg(0))
+
+            def terminate():
+                source = symb()
+                if source.type != INT:
+                    handler.terminateInterpret(53, 'Excepted int.')
+                code = source.value
+                if not (0 <= code <= 49):
+                    handler.terminateInterpret(57, 'Invalid exit code value (excepted range: 0-49).')
+                handler.exitProgram(code, 'Terminated by EXIT instruction.')
+            return terminate
+        elif opcode == 'DPRINT':  # DPRINT <symb>
+            symb = self.__operand(instruction.getArg(0))
+            error = self.interpret.output.error
+
+            def dprint():
+                error(represent(symb().value))
+                return following
+            return dprint
+        elif opcode == 'BREAK':  # BREAK
+            breakpoint = self.interpret.breakpoint
+
+            def pause():
+                breakpoint(instruction)
+                return following
+            return pause
+        elif opcode in self.interpret.stackInstructions:  # <instruction>S (STACK extension)
+            return self.compileStack(instruction)
+
+        # LABEL and instructions without effect
+        def skip():
+            return following
+        return skip
+
+    def compileProven(self, instruction: Instruction, known: dict):
+        """
+        Compiles an instruction whose operand types are proven into an operation without type checks.
+        Proven variables are initialized, so they are not checked either (only the <var> operand is).
+
+        :param instruction: Compiled instruction
+        :param known:       Types of global variables proven before the instruction
+        :return: Operation of instruction or None if types of operands are not proven.
+        """
+        handler = self.handler
+        following = instruction.next
+        target = instruction.target
+        opcode = instruction.opcode
+        types = [Inference.typeOf(arg, known) for arg in instruction.args[1:]]
+
+        if opcode in self.arithmetic or opcode == 'IDIV':  # ADD/SUB/MUL/IDIV <var> <symb1> <symb2>
+            if types != [INT, INT]:
+                return None
+            var, symb1, symb2 = self.__provenOperands(instruction)
+            calculate = self.arithmetic.get(opcode)
+
+            if calculate is None:
+                def division():
+                    variable = var()
+                    first = symb1().value
+                    second = symb2().value
+                    if second == 0:
+                        handler.terminateProgram(57, 'Division by zero.')
+                    variable.value = divide(first, second)
+                    variable.type = INT
+                    return following
+                return division
+
+            def arithmetic():
+                variable = var()
+                variable.value = calculate(symb1().value, symb2().value)
+                variable.type = INT
+                return following
+            return arithmetic
+        elif opcode in self.relations:  # LT/GT/EQ <var> <symb1> <symb2>
+            if types[0] != types[1] or types[0] not in (INT, BOOL, STRING):
+                return None
+            var, symb1, symb2 = self.__provenOperands(instruction)
+            compare = self.relations.get(opcode)
+
+            def relation():
+                variable = var()
+                variable.value = compare(symb1().value, symb2().value)
+                variable.type = BOOL
+                return following
+            return relation
+        elif opcode == 'AND' or opcode == 'OR':  # AND/OR <var> <symb1> <symb2>
+            if types != [BOOL, BOOL]:
+                return None
+            var, symb1, symb2 = self.__provenOperands(instruction)
+            conjunction = opcode == 'AND'
+
+            def logic():
+                variable = var()
+                first = symb1().value
+                second = symb2().value
+                variable.value = (first and second) if conjunction else (first or second)
+                variable.type = BOOL
+                return following
+            return logic
+        elif opcode == 'NOT':  # NOT <var> <symb>
+            if types != [BOOL]:
+                return None
+            var, symb = self.__provenOperands(instruction)
+
+            def negation():
+                variable = var()
+                variable.value = not symb().value
+                variable.type = BOOL
+                return following
+            return negation
+        elif opcode == 'CONCAT':  # CONCAT <var> <symb1> <symb2>
+            if types != [STRING, STRING]:
+                return None
+            var, symb1, symb2 = self.__provenOperands(instruction)
+
+            def concat():
+                variable = var()
+                variable.value = symb1().value + symb2().value
+                variable.type = STRING
+                return following
+            return concat
+        elif opcode == 'STRLEN':  # STRLEN <var> <symb>
+            if types != [STRING]:
+                return None
+            var, symb = self.__provenOperands(instruction)
+
+            def strlen():
+                variable = var()
+                variable.value = len(symb().value)
+                variable.type = INT
+                return following
+            return strlen
+        elif opcode == 'JUMPIFEQ' or opcode == 'JUMPIFNEQ':  # JUMPIF(N)EQ <label> <symb1> <symb2>
+            first, second = types
+            if first is None or second is None or (first != second and NIL not in types) or target is None:
+                return None
+            symb1 = self.__operand(instruction.getArg(1), False)
+            symb2 = self.__operand(instruction.getArg(2), False)
+            equal = opcode == 'JUMPIFEQ'
+
+            def jumpIf():
+                if (symb1().value == symb2().value) == equal:
+                    return target + 1
+                return following
+            return jumpIf
+        return None
+
+    def __provenOperands(self, instruction: Instruction) -> tuple:
+        """
+        Creates getters of instruction operands (<var> <symb> [<symb>]) whose types are proven.
+
+        :param instruction: Instruction with operands
+        :return: Getter of <var> followed by getters of <symb> operands (without initialization check).
+        """
+        return tuple(self.__operand(arg, False) for arg in instruction.args)
+
+    def compileSuperinstruction(self, superinstruction: Superinstruction, known: dict = None):
+        """
+        Compiles a superinstruction into a single operation.
+        Errors of the first part get the order of superinstruction (as other operations),
+        errors of the second part get the order of the second part. Each part is counted as an execution.
+
+        :param superinstruction: Compiled superinstruction
+        :param known:            Types of global variables proven before the superinstruction or None
+        :return: Operation of superinstruction.
+        """
+        handler = self.handler
+        frames = self.frames
+        interpret = self.interpret
+        following = superinstruction.next
+        target = superinstruction.target
+        first, second = (superinstruction.parts + (None,))[:2]
+
+        if superinstruction.opcode == 'COMPAREJUMP':  # LT/GT/EQ <var> <symb1> <symb2> + JUMPIF(N)EQ <label> ...
+            var, symb1, symb2 = self.__operands(first)
+            compare = self.relations.get(first.opcode)
+            # Jump is taken when the result of comparison is equal (not equal) to the bool constant
+            constant = second.getArg(2) if second.getArg(2).isBool() else second.getArg(1)
+            jumpOn = constant.value if second.opcode == 'JUMPIFEQ' else not constant.value
+
+            def compareJump():
+                variable = var()
+                left = symb1()
+                right = symb2()
+                if left.type != right.type or left.type == NIL:
+                    handler.terminateInterpret(53, 'Types of operands do not match '
+                                               + typeName(left.type) + ' != ' + typeName(right.type))
+                if left.type > STRING:
+                    handler.terminateInterpret(53, 'Not valid types <' + typeName(left.type) + ':symb1> '
+                                                   '<' + typeName(right.type) + ':symb2>')
+                result = compare(left.value, right.value)
+                variable.value = result
+                variable.type = BOOL
+                interpret.counter += 1
+                if target is None:
+                    try:
+                        handler.terminateInterpret(52, 'Label does not exists.')
+                    except InterpretException as exception:
+                        exception.order = second.order
+                        raise
+                if result == jumpOn:
+                    return target + 1
+                return following
+            return compareJump
+        elif superinstruction.opcode == 'STACKMOVE':  # PUSHS <symb> + POPS <var>
+            symb = self.__operand(first.getArg(0))
+            var = self.__operand(second.getArg(0), False)
+
+            def stackMove():
+                source = symb()
+                interpret.counter += 1
+                try:
+                    variable = var()
+                except InterpretException as exception:
+                    exception.order = second.order
+                    raise
+                variable.value = source.value
+                variable.type = source.type
+                return following
+            return stackMove
+        elif superinstruction.opcode == 'DEFINEMOVE':  # DEFVAR <var> + MOVE <var> <symb>
+            arg = first.getArg(0)
+            symb = self.__operand(second.getArg(1))
+
+            def defineMove():
+                variable = frames.registerVar(arg)
+                interpret.counter += 1
+                try:
+                    source = symb()
+                except InterpretException as exception:
+                    exception.order = second.order
+                    raise
+                variable.value = source.value
+                variable.type = source.type
+                return following
+            return defineMove
+
+        # INCREMENT: ADD/SUB <var> <var> int@<value>
+        step = first.getArg(2).value if first.opcode == 'ADD' else -first.getArg(2).value
+        if Inference.typeOf(first.getArg(1), known) == INT:
+            var = self.__operand(first.getArg(1), False)
+
+            def provenIncrement():
+                var().value += step
+                return following
+            return provenIncrement
+
+        var = self.__operand(first.getArg(1))
+
+        def increment():
+            variable = var()
+            if variable.type != INT:
+                handler.terminateProgram(53, 'Int expected')
+            variable.value += step
+            return following
+        return increment
+
+    def compileStack(self, instruction: Instruction):
+        """
+        Compiles an instruction of STACK extension into an operation.
+        Operations work directly on lists of the data stack (the second operand is on top),
+        the result replaces the first operand.
+
+        :param instruction: Compiled instruction
+        :return: Operation of instruction.
+        """
+        handler = self.handler
+        stack = self.interpret.storage.stack
+        values = stack.values
+        types = stack.types
+        following = instruction.next
+        target = instruction.target
+        opcode = instruction.opcode
+        # Instruction without S suffix (ADDS -> ADD)
+        base = opcode[:-1]
+
+        if opcode == 'CLEARS':  # CLEARS
+            def clears():
+                stack.clear()
+                return following
+            return clears
+        elif base in self.arithmetic or opcode == 'IDIVS':  # ADDS/SUBS/MULS/IDIVS
+            calculate = self.arithmetic.get(base)
+
+            def arithmetic():
+                if len(values) < 2:
+                    stack.empty()
+                if types[-1] != INT or types[-2] != INT:
+                    handler.terminateProgram(53, 'Int expected')
+                second = values.pop()
+                types.pop()
+                if calculate is None:
+                    if second == 0:
+                        handler.terminateProgram(57, 'Division by zero.')
+                    values[-1] = divide(values[-1], second)
+                else:
+                    values[-1] = calculate(values[-1], second)
+                return following
+            return arithmetic
+        elif base in self.relations:  # LTS/GTS/EQS
+            compare = self.relations.get(base)
+
+            def relation():
+                if len(values) < 2:
+                    stack.empty()
+                first, second = types[-2], types[-1]
+                if first != second or first == NIL:
+                    handler.terminateInterpret(53, 'Types of operands do not match '
+                                               + typeName(first) + ' != ' + typeName(second))
+                if first > STRING:
+                    handler.terminateInterpret(53, 'Not valid types <' + typeName(first) + ':symb1> '
+                                                   '<' + typeName(second) + ':symb2>')
+                types.pop()
+                second = values.pop()
+                values[-1] = compare(values[-1], second)
+                types[-1] = BOOL
+                return following
+            return relation
+        elif opcode == 'ANDS' or opcode == 'ORS':  # ANDS/ORS
+            conjunction = opcode == 'ANDS'
+
+            def logic():
+                if len(values) < 2:
+                    stack.empty()
+                if types[-1] != BOOL or types[-2] != BOOL:
+                    handler.terminateProgram(53, 'Expected Boolean.')
+                types.pop()
+                second = values.pop()
+                if conjunction:
+                    values[-1] = values[-1] and second
+                else:
+                    values[-1] = values[-1] or second
+                return following
+            return logic
+        elif opcode == 'NOTS':  # NOTS
+            def negation():
+                if not values:
+                    stack.empty()
+                if types[-1] != BOOL:
+                    handler.terminateProgram(53, 'Expected Boolean.')
+                values[-1] = not values[-1]
+                return following
+            return negation
+        elif opcode == 'INT2CHARS':  # INT2CHARS
+            def int2char():
+                if not values:
+                    stack.empty()
+                if types[-1] != INT:
+                    handler.terminateInterpret(53, 'Int is expected on top of the stack.')
+                try:
+                    values[-1] = chr(values[-1])
+                except (ValueError, OverflowError):
+                    handler.terminateInterpret(58, 'Value on top of the stack is out of range.')
+                types[-1] = STRING
+                return following
+            return int2char
+        elif opcode == 'STRI2INTS':  # STRI2INTS
+            def stri2int():
+                if len(values) < 2:
+                    stack.empty()
+                if types[-2] != STRING or types[-1] != INT:
+                    handler.terminateInterpret(53, 'Params error (<got:expected>) '
+                                                   '<' + typeName(types[-2]) + ':string> '
+                                                   '<' + typeName(types[-1]) + ':int>')
+                types.pop()
+                index = values.pop()
+                string = values[-1]
+                if index >= len(string) or index < 0:
+                    handler.terminateInterpret(58, 'Index is out of range.')
+                values[-1] = ord(string[index])
+                types[-1] = INT
+                return following
+            return stri2int
+
+        # JUMPIFEQS/JUMPIFNEQS <label>
+        equal = opcode == 'JUMPIFEQS'
+
+        def jumpIf():
+            if len(values) < 2:
+                stack.empty()
+            if target is None:
+                handler.terminateInterpret(52, 'Label does not exists.')
+            first, second = types[-2], types[-1]
+            if first != NIL and second != NIL and first != second:
+                handler.terminateInterpret(53, "Types does not match or symbols are not 'nil'.")
+            del types[-2:]
+            second = values.pop()
+            if (values.pop() == second) == equal:
+                return target + 1
+            return following
+        return jumpIf
+
+    def __operands(self, instruction: Instruction) -> tuple:
+        """
+        Creates getters of instruction operands (<var> <symb> [<symb>]).
+
+        :param instruction: Instruction with operands
+        :return: Getter of <var> followed by getters of <symb> operands.
+        """
+        var = self.__operand(instruction.getArg(0), False)
+        return (var,) + tuple(self.__operand(arg) for arg in instruction.args[1:])
+
+    def __operand(self, arg: Argument, initRequired=True):
+        """
+        Creates a getter of operand.
+
+        :param arg:          Operand of instruction
+        :param initRequired: Whether variable has to be initialized
+        :return: Function which returns constant or variable from storage.
+        """
+        handler = self.handler
+        frames = self.frames
+        name = arg.value
+
+        if not arg.isVar():
+            def constant():
+                return arg
+            return constant
+
+        def undefined():
+            handler.terminateInterpret(54, 'Undefined variable <' + name + ':' + typeName(arg.type) + '>')
+
+        def uninitialized():
+            handler.terminateInterpret(56, "Variable '" + name + "' is not initialized")
+
+        if arg.frame == 'GF':
+            # Global frame is never replaced, bind its registry directly
+            registry = frames.get('GF').registry
+
+            def globalVariable():
+                variable = registry.get(name)
+                if variable is None:
+                    undefined()
+                if initRequired and variable.value is None:
+                    uninitialized()
+                return variable
+            return globalVariable
+
+        # Local and temporary frames are looked up by name, they are changed by frame instructions
+        current = frames.current
+        frameType = arg.frame
+
+        def variable():
+            frame = current[frameType]
+            if frame is None:
+                frames.undefinedFrame(frameType)
+            found = frame.registry.get(name)
+            if found is None:
+                undefined()
+            if initRequired and found.value is None:
+                uninitialized()
+            return found
+        return variable
@@ -1,57 +1,278 @@
 import io
-import re
-import sys
-from xml.dom import minidom
 
-from src.Interpret.Parser import Parser
+from src.Interpret.Input import Input
+from src.Interpret.Output import Output
 from src.Support.ErrorHandler import ErrorHandler
-from src.Interpret.Instruction import Instruction, Argument
+from src.Support.Exception import InterpretException, LimitException
+from src.Interpret.Instruction import Instruction, Superinstruction, Argument
 from src.Interpret.Storage import Storage, Variable
+from src.Interpret.Value import NIL, INT, BOOL, STRING, nil, typeName, represent, divide
 
 
 class Interpret:
     handler = ErrorHandler()
 
-    def __init__(self, sourceFile, inputFile):
+    engines = ['reference', 'compiled']
+
+    # Instructions of STACK extension, operands are popped from the data stack
+    stackInstructions = frozenset(['CLEARS', 'ADDS', 'SUBS', 'MULS', 'IDIVS', 'LTS', 'GTS', 'EQS', 'ANDS', 'ORS',
+                                   'NOTS', 'INT2CHARS', 'STRI2INTS', 'JUMPIFEQS', 'JUMPIFNEQS'])
+
+    def __init__(self, sourceFile, inputFile, engine='reference', outputFile=None, cache=None, errorFile=None,
+                 profileFile=None, optimize=False, analyze=False, budget=None, snapshot=None, resume=None):
         """
         Initializes the interpret
 
-        :param sourceFile:  XML source file of IPPcode21
-        :param inputFile:   Input file with defined inputs
+        :param sourceFile:  XML source file of IPPcode21 (path or opened stream)
+        :param inputFile:   Input file with defined inputs (path, opened stream or None for standard input)
+        :param engine:      Execution engine (reference or compiled)
+        :param outputFile:  Output file (path, opened stream or None for standard output)
+        :param cache:       Cache of program images or None if it is not used
+        :param errorFile:   Opened stream for DPRINT and BREAK or None for standard error output
+        :param profileFile: Path of JSON profile or None if the program is not profiled
+        :param optimize:    True if instructions are fused into superinstructions by peephole optimizer
+        :param analyze:     True if the program is reduced by static analyzer (and its report is written)
+        :param budget:      Execution budget (limits of instructions, time and memory) or None
+        :param snapshot:    Writer of snapshots or None
+        :param resume:      Path of snapshot from which the program continues or None
         """
-        # Get Nodes
-        tree = self.__getNodes(sourceFile)
-
-        # Run parser
-        Parser(tree)
+        # Load program image (XML is checked by parser while it is read)
+        image = self.__loadImage(sourceFile, cache)
 
         # Initialize storage
         self.storage = Storage()
 
         # Initialize instructions
-        self.instructions, self.ordersList = self.__collectInstructions(tree)
-
-        # Initialize inputs
-        self.inputs = self.__getInputs(inputFile)
-        self.inputsFlag = True if self.inputs is not None else False
+        self.instructions, self.positions = self.__collectInstructions(
+            [self.__createInstruction(item) for item in image]
+        )
+        self.__resolveTargets()
+        self.analyzer = None
+        if analyze:
+            from src.Interpret.Analyzer import Analyzer
+            self.analyzer = Analyzer()
+            self.instructions = self.analyzer.analyze(self.instructions)
+            self.positions = {instruction.order: index for index, instruction in enumerate(self.instructions)}
+            self.__resolveTargets()
+        self.types = None
+        if optimize:
+            if engine == 'compiled':
+                # Types are inferred before instructions are fused (compiled engine skips checks of proven types)
+                from src.Interpret.Inference import Inference
+                self.types = Inference().infer(self.instructions)
+            from src.Interpret.Optimizer import Optimizer
+            Optimizer().optimize(self.instructions)
+
+        # Initialize inputs (read on demand)
+        self.inputs = Input(inputFile)
+
+        # Initialize output
+        self.output = Output(outputFile, errorFile, append=resume is not None)
+        if self.analyzer is not None:
+            self.output.error(self.analyzer.report())
 
         # Program counter
         self.counter = 0
+        self.position = 0
+        self.order = None
+
+        self.engine = engine
+        self.budget = budget
+        self.snapshot = snapshot
+        if resume is not None:
+            from src.Interpret.Snapshot import Snapshot
+            Snapshot.restore(self, resume)
+
+        # Initialize profiler (only if it is used)
+        self.profileFile = profileFile
+        self.profiler = None
+        if profileFile is not None:
+            from src.Interpret.Profiler import Profiler
+            self.profiler = Profiler(self.instructions)
+
+    def run(self):
+        """
+        Runs the program by the selected engine.
+        Output is flushed when the program ends (also by EXIT or by an error).
+        Exception which terminates the program gets the order of instruction where it was raised,
+        exceeded budget is also reported into the error output. Profile is written also when the program
+        ends by an exception, but failed write does not replace its exit code.
+        """
+        try:
+            try:
+                if self.profiler is not None:
+                    self.runProfiled()
+                elif self.engine == 'compiled':
+                    self.runCompiled()
+                else:
+                    self.runReference()
+            except MemoryError:
+                # Program can run out of memory between two checks of the budget
+                if self.budget is None or self.budget.memory is None:
+                    raise
+                self.budget.exceedMemory()
+        except InterpretException as exception:
+            if exception.order is None:
+                exception.order = self.__currentOrder()
+            if isinstance(exception, LimitException):
+                self.output.error(str(exception))
+            if self.profiler is not None:
+                try:
+                    self.writeProfile()
+                except InterpretException as failure:
+                    # Program keeps its exit code, failed write is only reported
+                    self.output.error(str(failure))
+            raise
+        else:
+            if self.profiler is not None:
+                self.writeProfile()
+        finally:
+            if self.budget is not None:
+                self.budget.stop()
+            if self.snapshot is not None:
+                self.snapshot.stop()
+            self.output.close()
+            self.inputs.close()
+
+    def runReference(self):
+        """
+        Runs instructions one by one until the program counter reaches the end of instructions.
+        """
+        if self.budget is None and self.snapshot is None:
+            while self.position < len(self.instructions):
+                instruction = self.instructions[self.position]
+                self.order = instruction.order
+                self.position += 1
+                self.execute(instruction)
+            return
+
+        # Budget and snapshots are checked only when the counter reaches the next checkpoint
+        checkpoint = self.startWatch()
+        while self.position < len(self.instructions):
+            instruction = self.instructions[self.position]
+            self.order = instruction.order
+            if self.counter >= checkpoint:
+                checkpoint = self.watch(self.counter)
+            self.position += 1
+            self.execute(instruction)
+
+    def runCompiled(self):
+        """
+        Compiles instructions into operations and runs them until there are no more operations.
+        Each operation returns the position of the next one.
+        """
+        from src.Interpret.Compiler import Compiler
+        operations = Compiler(self).compile(self.instructions)
+        count = len(operations)
+
+        if self.budget is None and self.snapshot is None:
+            while self.position < count:
+                self.counter += 1
+                self.position = operations[self.position]()
+            return
+
+        # Budget and snapshots are checked only when the counter reaches the next checkpoint
+        checkpoint = self.startWatch()
+        while self.position < count:
+            if self.counter >= checkpoint:
+                checkpoint = self.watch(self.counter)
+            self.counter += 1
+            self.position = operations[self.position]()
+
+    def runProfiled(self):
+        """
+        Runs the program by the selected engine and measures each instruction.
+        Time is attributed to the function (label of CALL on top of the call stack) where the instruction is executed.
+        """
+        import time
+        clock = time.perf_counter_ns
+        profiler = self.profiler
+        calls = self.storage.calls.registry
+        instructions = self.instructions
+
+        operations = None
+        if self.engine == 'compiled':
+            from src.Interpret.Compiler import Compiler
+            operations = Compiler(self).compile(instructions)
+
+        watched = self.budget is not None or self.snapshot is not None
+        checkpoint = self.startWatch() if watched else None
+
+        while self.position < len(instructions):
+            position = self.position
+            instruction = instructions[position]
+            if watched and self.counter >= checkpoint:
+                self.order = instruction.order
+                checkpoint = self.watch(self.counter)
+            function = calls[-1].getArg(0).value if calls else None
+            start = clock()
+            try:
+                if operations is not None:
+                    self.counter += 1
+                    self.position = operations[position]()
+                else:
+                    self.order = instruction.order
+                    self.position += 1
+                    self.execute(instruction)
+            finally:
+                profiler.record(position, function, clock() - start)
+
+    def startWatch(self) -> int:
+        """
+        Starts measuring of budget and watching for snapshots.
+
+        :return: Number of executed instructions when the budget and snapshots are checked first.
+        """
+        checkpoints = list()
+        if self.budget is not None:
+            checkpoints.append(self.budget.start(self.counter))
+        if self.snapshot is not None:
+            checkpoints.append(self.snapshot.start(self.counter))
+        return min(checkpoints)
+
+    def watch(self, executed: int) -> int:
+        """
+        Checks the budget and writes the snapshot if it is due (before the next instruction is executed).
 
-        # End if no instructions provided.
-        if len(self.instructions) == 0:
-            self.handler.terminateProgram(0, 'Interpretation done (no instructions set).')
+        :param executed: Number of executed instructions
+        :return: Number of executed instructions when the budget and snapshots are checked next time.
+        """
+        checkpoints = list()
+        # Snapshot is written before the budget is checked, so the exceeded program can be resumed
+        if self.snapshot is not None:
+            checkpoints.append(self.snapshot.check(self, executed))
+        if self.budget is not None:
+            checkpoints.append(self.budget.check(executed))
+        return min(checkpoints)
+
+    def breakpoint(self, instruction: Instruction):
+        """
+        Prints the statement of interpret and writes the snapshot if snapshots are written (BREAK instruction).
 
-        # Execute the code
-        self.order = self.ordersList[0]
-        self.execute(self.__getInstructionAt(self.order))
+        :param instruction: Executed BREAK instruction
+        """
+        self.printStatement(instruction.order)
+        if self.snapshot is not None:
+            self.snapshot.save(self, instruction.next)
+
+    def writeProfile(self):
+        """
+        Writes the profile into JSON file and its report into the error output.
+        """
+        profile = self.profiler.export()
+        self.profiler.write(profile, self.profileFile)
+        self.output.error(self.profiler.report(profile))
 
     def execute(self, instruction: Instruction):
         """
-        Executes an instruction.
+        Executes an instruction and moves the program counter if it transfers control.
 
         :param instruction: Instruction to be executed.
         """
+        if type(instruction) is Superinstruction:
+            self.executeParts(instruction)
+            return
+
         # Increment counter
         self.counter += 1
         # Set instruction to error handler
@@ -75,65 +296,59 @@ class Interpret:
             self.storage.frames.registerVar(var)
         elif instruction.opcode == 'CALL':  # LABEL <label>
             label = instruction.getArg(0)
+            if instruction.target is None:
+                self.handler.terminateProgram(52, 'Label ' + label.value + ' does not exist.')
             self.storage.calls.push(instruction)
-            self.order = self.storage.labels.getOrder(label.value)
-            self.execute(self.__getInstructionAt(self.order))
+            self.position = instruction.target
         elif instruction.opcode == 'RETURN':  # RETURN
-            order = self.storage.calls.pop().order
-            self.execute(self.__getInstructionAt(order, True))
+            self.position = self.storage.calls.pop().next
         elif instruction.opcode == 'PUSHS':  # PUSHS <symb>
             symb = self.__checkVariable(instruction.getArg(0))
-            self.storage.stack.push({'value': symb.value, 'type': symb.type})
+            self.storage.stack.push(symb.value, symb.type)
         elif instruction.opcode == 'POPS':  # POPS <var>
             var = self.__checkVariable(instruction.getArg(0), False)
-            item = self.storage.stack.pop()
-            self.storage.frames.updateVar(var, item.get('value'), item.get('type'))
+            value, valueType = self.storage.stack.pop()
+            self.storage.frames.updateVar(var, value, valueType)
         elif instruction.opcode == 'ADD':  # ADD <var> <symb1> <symb2>
             var, symb1, symb2 = self.__initializeArithmeticOperation(instruction)
-            self.storage.frames.updateVar(var, int(symb1.value) + int(symb2.value), 'int')
+            self.storage.frames.updateVar(var, symb1.value + symb2.value, INT)
         elif instruction.opcode == 'SUB':  # SUB <var> <symb1> <symb2>
             var, symb1, symb2 = self.__initializeArithmeticOperation(instruction)
-            self.storage.frames.updateVar(var, int(symb1.value) - int(symb2.value), 'int')
+            self.storage.frames.updateVar(var, symb1.value - symb2.value, INT)
         elif instruction.opcode == 'MUL':  # MUL <var> <symb1> <symb2>
             var, symb1, symb2 = self.__initializeArithmeticOperation(instruction)
-            self.storage.frames.updateVar(var, int(symb1.value) * int(symb2.value), 'int')
+            self.storage.frames.updateVar(var, symb1.value * symb2.value, INT)
         elif instruction.opcode == 'IDIV':  # IDIV <var> <symb1> <symb2>
             var, symb1, symb2 = self.__initializeArithmeticOperation(instruction)
-            if int(symb2.value) == 0:
+            if symb2.value == 0:
                 self.handler.terminateProgram(57, 'Division by zero.')
-            self.storage.frames.updateVar(var, int(symb1.value) / int(symb2.value), 'int')
+            self.storage.frames.updateVar(var, divide(symb1.value, symb2.value), INT)
         elif instruction.opcode == 'LT':  # LT <var> <symb1> <symb2>
             var, symb1, symb2 = self.__initializeRelationOperation(instruction)
-            value = 'true' if symb1.value < symb2.value else 'false'
-            self.storage.frames.updateVar(var, value, 'bool')
+            self.storage.frames.updateVar(var, symb1.value < symb2.value, BOOL)
         elif instruction.opcode == 'GT':  # GT <var> <symb1> <symb2>
             var, symb1, symb2 = self.__initializeRelationOperation(instruction)
-            value = 'true' if symb1.value > symb2.value else 'false'
-            self.storage.frames.updateVar(var, value, 'bool')
+            self.storage.frames.updateVar(var, symb1.value > symb2.value, BOOL)
         elif instruction.opcode == 'EQ':  # EQ <var> <symb1> <symb2>
             var, symb1, symb2 = self.__initializeRelationOperation(instruction)
-            value = 'true' if symb1.value == symb2.value else 'false'
-            self.storage.frames.updateVar(var, value, 'bool')
+            self.storage.frames.updateVar(var, symb1.value == symb2.value, BOOL)
         elif instruction.opcode == 'AND':  # AND <var> <symb1> <symb2>
             var, symb1, symb2 = self.__initializeBooleanOperation(instruction)
-            value = 'true' if symb1 & symb2 else 'false'
-            self.storage.frames.updateVar(var, value, 'bool')
+            self.storage.frames.updateVar(var, symb1.value and symb2.value, BOOL)
         elif instruction.opcode == 'OR':  # OR <var> <symb1> <symb2>
             var, symb1, symb2 = self.__initializeBooleanOperation(instruction)
-            value = 'true' if symb1 | symb2 else 'false'
-            self.storage.frames.updateVar(var, value, 'bool')
+            self.storage.frames.updateVar(var, symb1.value or symb2.value, BOOL)
         elif instruction.opcode == 'NOT':  # NOT <var> <symb>
             var, symb = self.__initializeBooleanOperation(instruction)
-            value = 'false' if symb else 'true'
-            self.storage.frames.updateVar(var, value, 'bool')
+            self.storage.frames.updateVar(var, not symb.value, BOOL)
         elif instruction.opcode == 'INT2CHAR':  # INT2CHAR <var> <symb>
             var = self.__checkVariable(instruction.getArg(0), False)
             symb = self.__checkVariable(instruction.getArg(1))
             if not symb.isInt():
                 self.handler.terminateInterpret(53, 'Int is expected as second parameter.')
             try:
-                self.storage.frames.updateVar(var, chr(int(symb.value)), 'string')
-            except ValueError:
+                self.storage.frames.updateVar(var, chr(symb.value), STRING)
+            except (ValueError, OverflowError):
                 self.handler.terminateInterpret(58, 'Value of second parameter is out of range.')
         elif instruction.opcode == 'STRI2INT':  # STRI2INT <var> <symb1> <symb2>
             var = self.__checkVariable(instruction.getArg(0), False)
@@ -141,307 +356,363 @@ class Interpret:
             symb2 = self.__checkVariable(instruction.getArg(2))
             if not symb1.isString() or not symb2.isInt():
                 self.handler.terminateInterpret(53, 'Params error (<got:expected>) '
-                                                    '<' + symb1.type + ':string> <' + symb2.type + ':int>')
-            index = int(symb2.value)
+                                                    '<' + typeName(symb1.type) + ':string> '
+                                                    '<' + typeName(symb2.type) + ':int>')
+            index = symb2.value
             if index >= len(symb1.value) or index < 0:
                 self.handler.terminateInterpret(58, 'Index is out of range.')
-            self.storage.frames.updateVar(var, int(ord(symb1.value[index])), 'int')
+            self.storage.frames.updateVar(var, ord(symb1.value[index]), INT)
         elif instruction.opcode == 'READ':  # READ <var> <type>
             var = self.__checkVariable(instruction.getArg(0), False)
-            readType = instruction.getArg(1).value
-
-            if self.inputsFlag:
-                if len(self.inputs) > 0:
-                    read = self.inputs.pop(0)
-                else:
-                    read = ''
-            else:
-                read = input()
-
-            if len(read) == 0:
-                self.storage.frames.updateVar(var, 'nil', 'nil')
-            elif readType == 'int':
-                read = read.lstrip().rstrip()
-                if read.lstrip('-').isdigit():
-                    self.storage.frames.updateVar(var, int(read), 'int')
-                else:
-                    self.storage.frames.updateVar(var, 'nil', 'nil')
-            elif readType == 'string':
-                read = read.lstrip().rstrip()
-                self.storage.frames.updateVar(var, str(read), 'string')
-            elif readType == 'bool':
-                read = read.lstrip().rstrip()
-                if read.lower() == 'true':
-                    self.storage.frames.updateVar(var, 'true', 'bool')
-                else:
-                    self.storage.frames.updateVar(var, 'false', 'bool')
+            self.read(var, instruction.getArg(1).value)
         elif instruction.opcode == 'WRITE':  # WRITE <symb>
             symb = self.__checkVariable(instruction.getArg(0))
             if symb.isNil():
-                print()
+                self.output.write('\n')
             elif symb.isBool():
-                print(symb.value)
+                self.output.write(represent(symb.value) + '\n')
             elif symb.isInt():
-                print(int(symb.value), end='')
+                self.output.write(str(symb.value))
             else:
-                symb.value = str(symb.value)
-                escapes = re.findall(r'\\[0-9]{3}', symb.value)
-                for escape in escapes:
-                    symb.value = symb.value.replace(escape, chr(int(escape.lstrip('\\').rstrip())))
-                print(symb.value, end='')
+                self.output.write(symb.value)
         elif instruction.opcode == 'CONCAT':  # CONCAT <var> <symb1> <symb2>
             var = self.__checkVariable(instruction.getArg(0), False)
             symb1 = self.__checkVariable(instruction.getArg(1))
             symb2 = self.__checkVariable(instruction.getArg(2))
             if not symb1.isString() or not symb2.isString():
                 self.handler.terminateInterpret(53, 'Can concatenate only strings.')
-            self.storage.frames.updateVar(var, str(symb1.value) + str(symb2.value), 'string')
+            self.storage.frames.updateVar(var, symb1.value + symb2.value, STRING)
         elif instruction.opcode == 'STRLEN':  # STRLEN <var> <symb>
             var = self.__checkVariable(instruction.getArg(0), False)
             symb = self.__checkVariable(instruction.getArg(1))
             if not symb.isString():
                 self.handler.terminateInterpret(53, 'Second parameter is not a string.')
-            self.storage.frames.updateVar(var, len(symb.value), 'int')
+            self.storage.frames.updateVar(var, len(symb.value), INT)
         elif instruction.opcode == 'GETCHAR':  # GETCHAR <var> <symb1> <symb2>
             var = self.__checkVariable(instruction.getArg(0), False)
             symb1 = self.__checkVariable(instruction.getArg(1))
             symb2 = self.__checkVariable(instruction.getArg(2))
             if not symb1.isString() or not symb2.isInt():
                 self.handler.terminateInterpret(53, 'Params error (<got:expected>) '
-                                                    '<' + symb1.type + ':string> <' + symb2.type + ':int>')
-            index = int(symb2.value)
+                                                    '<' + typeName(symb1.type) + ':string> '
+                                                    '<' + typeName(symb2.type) + ':int>')
+            index = symb2.value
             if index >= len(symb1.value) or index < 0:
                 self.handler.terminateInterpret(58, 'Index is out of range.')
-            self.storage.frames.updateVar(var, symb1.value[index], 'string')
+            self.storage.frames.updateVar(var, symb1.value[index], STRING)
         elif instruction.opcode == 'SETCHAR':  # SETCHAR <var> <symb1> <symb2>
             var = self.__checkVariable(instruction.getArg(0))
             symb1 = self.__checkVariable(instruction.getArg(1))
             symb2 = self.__checkVariable(instruction.getArg(2))
             if not var.isString() or not symb1.isInt() or not symb2.isString():
                 self.handler.terminateInterpret(53, 'Params error (<got:expected>) '
-                                                    '<' + var.type + ':string> '
-                                                    '<' + symb1.type + ':string> <' + symb2.type + ':int>')
+                                                    '<' + typeName(var.type) + ':string> '
+                                                    '<' + typeName(symb1.type) + ':string> '
+                                                    '<' + typeName(symb2.type) + ':int>')
 
-            index = int(symb1.value)
+            index = symb1.value
             if index >= len(var.value) or index < 0 or not len(symb2.value):
                 self.handler.terminateInterpret(58, 'Index is out of range or third parameter is empty.')
             var.value = var.value[0:index] + symb2.value[0] + var.value[index+1:]
-            self.storage.frames.updateVar(var, var.value, 'string')
+            self.storage.frames.updateVar(var, var.value, STRING)
         elif instruction.opcode == 'TYPE':  # TYPE <var> <symb>
             var = self.__checkVariable(instruction.getArg(0), False)
             symb = self.__checkVariable(instruction.getArg(1), False)
             if symb.isInitialized():
-                self.storage.frames.updateVar(var, symb.type, 'string')
+                self.storage.frames.updateVar(var, typeName(symb.type), STRING)
             else:
-                self.storage.frames.updateVar(var, '', 'string')
+                self.storage.frames.updateVar(var, '', STRING)
         elif instruction.opcode == 'LABEL':  # LABEL <label>
             pass
         elif instruction.opcode == 'JUMP':  # JUMP <label>
             label = instruction.getArg(0)
-            self.order = self.storage.labels.getOrder(label.value)
-            self.execute(self.__getInstructionAt(self.order))
+            if instruction.target is None:
+                self.handler.terminateProgram(52, 'Label ' + label.value + ' does not exist.')
+            self.position = instruction.target
         elif (instruction.opcode == 'JUMPIFEQ' or
               instruction.opcode == 'JUMPIFNEQ'):  # JUMPIF(N)EQ <label> <symb1> <symb2>
             label = instruction.getArg(0)
             symb1 = self.__checkVariable(instruction.getArg(1))
             symb2 = self.__checkVariable(instruction.getArg(2))
 
-            if not self.storage.labels.has(label.value):
+            if instruction.target is None:
                 self.handler.terminateInterpret(52, 'Label does not exists.')
 
             if not symb1.isNil() and not symb2.isNil() and symb1.type != symb2.type:
                 self.handler.terminateInterpret(53, "Types does not match or symbols are not 'nil'.")
             if ((instruction.opcode == 'JUMPIFEQ' and symb1.value == symb2.value) or
                     (instruction.opcode == 'JUMPIFNEQ' and symb1.value != symb2.value)):
-                order = self.storage.labels.getOrder(label.value)
-                self.execute(self.__getInstructionAt(order, True))
+                self.position = instruction.target + 1
         elif instruction.opcode == 'EXIT':  # EXIT <symb>
             symb = self.__checkVariable(instruction.getArg(0))
             if not symb.isInt():
                 self.handler.terminateInterpret(53, 'Excepted int.')
-            symb.value = int(symb.value)
-            if not (0 <= symb.value <= 49):
+            code = symb.value
+            if not (0 <= code <= 49):
                 self.handler.terminateInterpret(57, 'Invalid exit code value (excepted range: 0-49).')
-            self.handler.terminateProgram(symb.value, 'Terminated by EXIT instruction.')
+            self.handler.exitProgram(code, 'Terminated by EXIT instruction.')
         elif instruction.opcode == 'DPRINT':  # DPRINT <symb>
             symb = self.__checkVariable(instruction.getArg(0))
-            print(symb.value, file=sys.stderr)
+            self.output.error(represent(symb.value))
         elif instruction.opcode == 'BREAK':  # BREAK
-            stats = "Executions: " + str(self.counter) + '\n' \
-                    "Current order: " + str(self.order + 1) + '\n' \
-                    "========== Storage ==========\n" + str(self.storage.statement()) + '' \
-                    "============================="
-            print(stats, file=sys.stderr)
+            self.breakpoint(instruction)
+        elif instruction.opcode in self.stackInstructions:  # <instruction>S (STACK extension)
+            self.executeStack(instruction)
 
-        # Execute next instruction
-        self.execute(self.__getInstructionAt(self.order, True))
-
-    def __getNodes(self, source):
+    def executeParts(self, superinstruction: Superinstruction):
         """
-        Gets nodes from XML source file.
+        Executes parts of a superinstruction one by one (as if it was not fused).
 
-        :param source: XML source file
-        :return: XML Object that refers to the root of XML file.
+        :param superinstruction: Superinstruction to be executed.
         """
-        try:
-            tree = minidom.parse(source)
-
-            return tree
-        except Exception as exception:
-            self.handler.terminateProgram(31, 'XML Error: ' + str(exception))
+        self.position = superinstruction.next
+        for part in superinstruction.parts:
+            self.order = part.order
+            self.execute(part)
 
-    @staticmethod
-    def __getInputs(source) -> list or None:
+    def executeStack(self, instruction: Instruction):
         """
-        Collect inputs into a list.
+        Executes an instruction of STACK extension.
+        Operands are popped from the data stack (the second operand is on top) and the result is pushed back.
 
-        :param source: Source file of inputs
-        :return: List of input data or None if non provided.
+        :param instruction: Instruction to be executed.
         """
-        inputs = None
-
-        if not source:
-            return inputs
-
-        inputs = list()
-
-        if isinstance(source, io.TextIOWrapper):
-            for line in source:
-                inputs.append(line)
-            return inputs
+        stack = self.storage.stack
+        if instruction.opcode == 'CLEARS':  # CLEARS
+            stack.clear()
+            return
+
+        # Popped operands are wrapped into variables, so they are checked as operands of other instructions
+        symb2 = Variable(None, *stack.pop())
+        if instruction.opcode == 'NOTS':  # NOTS
+            self.__checkBooleanOperands(symb2)
+            stack.push(not symb2.value, BOOL)
+            return
+        if instruction.opcode == 'INT2CHARS':  # INT2CHARS
+            if not symb2.isInt():
+                self.handler.terminateInterpret(53, 'Int is expected on top of the stack.')
+            try:
+                stack.push(chr(symb2.value), STRING)
+            except (ValueError, OverflowError):
+                self.handler.terminateInterpret(58, 'Value on top of the stack is out of range.')
+            return
+        symb1 = Variable(None, *stack.pop())
+
+        if instruction.opcode == 'ADDS':  # ADDS
+            self.__checkArithmeticOperands(symb1, symb2)
+            stack.push(symb1.value + symb2.value, INT)
+        elif instruction.opcode == 'SUBS':  # SUBS
+            self.__checkArithmeticOperands(symb1, symb2)
+            stack.push(symb1.value - symb2.value, INT)
+        elif instruction.opcode == 'MULS':  # MULS
+            self.__checkArithmeticOperands(symb1, symb2)
+            stack.push(symb1.value * symb2.value, INT)
+        elif instruction.opcode == 'IDIVS':  # IDIVS
+            self.__checkArithmeticOperands(symb1, symb2)
+            if symb2.value == 0:
+                self.handler.terminateProgram(57, 'Division by zero.')
+            stack.push(divide(symb1.value, symb2.value), INT)
+        elif instruction.opcode == 'LTS':  # LTS
+            self.__checkRelationOperands(symb1, symb2)
+            stack.push(symb1.value < symb2.value, BOOL)
+        elif instruction.opcode == 'GTS':  # GTS
+            self.__checkRelationOperands(symb1, symb2)
+            stack.push(symb1.value > symb2.value, BOOL)
+        elif instruction.opcode == 'EQS':  # EQS
+            self.__checkRelationOperands(symb1, symb2)
+            stack.push(symb1.value == symb2.value, BOOL)
+        elif instruction.opcode == 'ANDS':  # ANDS
+            self.__checkBooleanOperands(symb1, symb2)
+            stack.push(symb1.value and symb2.value, BOOL)
+        elif instruction.opcode == 'ORS':  # ORS
+            self.__checkBooleanOperands(symb1, symb2)
+            stack.push(symb1.value or symb2.value, BOOL)
+        elif instruction.opcode == 'STRI2INTS':  # STRI2INTS
+            if not symb1.isString() or not symb2.isInt():
+                self.handler.terminateInterpret(53, 'Params error (<got:expected>) '
+                                                    '<' + typeName(symb1.type) + ':string> '
+                                                    '<' + typeName(symb2.type) + ':int>')
+            index = symb2.value
+            if index >= len(symb1.value) or index < 0:
+                self.handler.terminateInterpret(58, 'Index is out of range.')
+            stack.push(ord(symb1.value[index]), INT)
+        elif instruction.opcode == 'JUMPIFEQS' or instruction.opcode == 'JUMPIFNEQS':  # JUMPIF(N)EQS <label>
+            if instruction.target is None:
+                self.handler.terminateInterpret(52, 'Label does not exists.')
+            if not symb1.isNil() and not symb2.isNil() and symb1.type != symb2.type:
+                self.handler.terminateInterpret(53, "Types does not match or symbols are not 'nil'.")
+            if (symb1.value == symb2.value) == (instruction.opcode == 'JUMPIFEQS'):
+                self.position = instruction.target + 1
 
-        file = open(source)
-        for line in file:
-            inputs.append(line)
-        return inputs
+    def read(self, var: Variable, readType: str):
+        """
+        Reads next input into a variable (READ instruction).
 
-    def __collectInstructions(self, tree) -> tuple:
+        :param var:      Variable where the input is stored
+        :param readType: Expected type of input
         """
-        Initializes instructions into a collection.
+        # Written output has to be visible before waiting for the user
+        if self.inputs.isInteractive():
+            self.output.flush()
+
+        read = self.inputs.readLine()
+
+        if len(read) == 0:
+            self.storage.frames.updateVar(var, nil, NIL)
+        elif readType == 'int':
+            read = read.lstrip().rstrip()
+            if read.lstrip('-').isdigit():
+                self.storage.frames.updateVar(var, int(read), INT)
+            else:
+                self.storage.frames.updateVar(var, nil, NIL)
+        elif readType == 'string':
+            read = read.lstrip().rstrip()
+            self.storage.frames.updateVar(var, read, STRING)
+        elif readType == 'bool':
+            read = read.lstrip().rstrip()
+            self.storage.frames.updateVar(var, read.lower() == 'true', BOOL)
+
+    def printStatement(self, order: int):
+        """
+        Prints the statement of interpret into stderr (BREAK instruction).
 
-        :param tree: XML tree from source file
-        :return: List of instructions sorted by order.
+        :param order: Order of currently executed instruction
         """
-        collection = list()
+        stats = "Executions: " + str(self.counter) + '\n' \
+                "Current order: " + str(order + 1) + '\n' \
+                "========== Storage ==========\n" + str(self.storage.statement()) + '' \
+                "============================="
+        self.output.error(stats)
 
-        instructions = tree.getElementsByTagName('instruction')
+    def __currentOrder(self) -> int or None:
+        """
+        Gets order of currently executed instruction.
 
-        for instruction in instructions:
-            arguments = instruction.childNodes
-            collection.append(self.__registerInstruction(instruction, arguments))
+        :return: Order of instruction or None if no instruction is executed.
+        """
+        if self.engine == 'compiled':
+            # Position of operation is changed after the operation returns
+            if self.position < len(self.instructions):
+                return self.instructions[self.position].order
+            return None
+        return self.order
 
-        # Sort by order
-        collection.sort(key=lambda x: x.order)
+    @staticmethod
+    def __loadImage(source, cache) -> list:
+        """
+        Loads program image from cache or from XML source.
 
-        # Check for duplicated orders and create orders list
-        ordersList = list()
-        for instruction in collection:
-            if instruction.order in ordersList:
-                self.handler.terminateProgram(32, 'Order duplication.')
-            ordersList.append(instruction.order)
+        :param source: XML source file
+        :param cache:  Cache of program images or None
+        :return: Program image.
+        """
+        if cache is None:
+            return Interpret.__loadSource(source)
 
-        return collection, ordersList
+        if isinstance(source, str):
+            try:
+                key = cache.keyOfFile(source)
+            except OSError:
+                return Interpret.__loadSource(source)
+        else:
+            if isinstance(source, io.TextIOBase) and hasattr(source, 'buffer'):
+                content = source.buffer.read()
+            else:
+                content = source.read()
+            if isinstance(content, str):
+                content = content.encode('utf-8')
+            key = cache.key(content)
+            source = io.BytesIO(content)
+
+        image = cache.load(key)
+        if image is None:
+            image = Interpret.__loadSource(source)
+            cache.store(key, image)
+        return image
 
-    def __registerInstruction(self, instructionNode, argNodes) -> Instruction:
+    @staticmethod
+    def __loadSource(source) -> list:
         """
-        Register an instruction.
+        Loads program image from XML source.
+        Loader (with expat and parser) is imported only when the image is not cached.
 
-        :param instructionNode: <instruction> node
-        :param argNodes:        <argX> node
-        :return:                Instruction instance
+        :param source: XML source file
+        :return: Program image.
         """
-        instruction = Instruction()
-
-        instruction.setOrder(instructionNode.getAttribute('order'))
-        instruction.setOpcode(instructionNode.getAttribute('opcode').upper())
+        from src.Interpret.Loader import Loader
+        return Loader().load(source)
 
-        # Sort arguments
-        argNodes = [x for x in argNodes if x.nodeType == 1]
-        argNodes.sort(key=lambda x: x.tagName)
+    @staticmethod
+    def __createInstruction(item: tuple) -> Instruction:
+        """
+        Creates an instruction from program image.
 
-        # Set arguments
-        for argument in argNodes:
-            if argument.nodeType == 1:  # Get only elements
-                instruction.setArg(
-                    argument.getAttribute('type'),
-                    argument.childNodes[0].nodeValue if argument.hasChildNodes() else ''
-                )
+        :param item: Instruction of program image (order, opcode, ((type, value), ...))
+        :return: Instruction instance
+        """
+        order, opcode, args = item
 
-        # Register labels
-        if instruction.isLabel():
-            if self.storage.labels.has(instruction):
-                self.handler.terminateProgram(52, 'This label is already set.')
-            self.storage.labels.register(instruction.getArg(0).value, instruction.order)
+        instruction = Instruction()
+        instruction.setOrder(order)
+        instruction.setOpcode(opcode)
+        for argType, value in args:
+            instruction.setArg(argType, value)
 
         return instruction
 
-    def __getInstructionAt(self, order, nextInstruction=False) -> Instruction:
+    def __collectInstructions(self, collection: list) -> tuple:
         """
-        Gets an instruction at orderList's index.
+        Initializes instructions into a collection.
 
-        :param order: The order of instruction
-        :return: Instance of instruction
+        :param collection: Instructions loaded from source file
+        :return: List of instructions sorted by order and map of order to its index.
         """
-        index = None
-        for i in range(len(self.ordersList)):
-            if order == self.ordersList[i]:
-                index = i
-                break
+        # Register labels
+        for instruction in collection:
+            if instruction.isLabel():
+                self.storage.labels.register(instruction.getArg(0).value, instruction.order)
 
-        # Instruction not found
-        if index is None:
-            self.handler.terminateProgram(99, 'Instruction at order '+str(index)+' not found.')
+        # Sort by order
+        collection.sort(key=lambda x: x.order)
 
-        # If returned find next order
-        if nextInstruction:
-            index += 1
+        # Check for duplicated orders and create order to index map
+        positions = dict()
+        for index, instruction in enumerate(collection):
+            if instruction.order in positions:
+                self.handler.terminateProgram(32, 'Order duplication.')
+            positions[instruction.order] = index
 
-        # If no next index that means we are done.
-        if index >= len(self.instructions):
-            self.handler.terminateProgram(0, 'Interpret done.')
+        return collection, positions
 
-        self.order = self.instructions[index].order
+    def __resolveTargets(self):
+        """
+        Resolves successor and label target (as instructions list index) of each instruction.
+        """
+        for index, instruction in enumerate(self.instructions):
+            instruction.next = index + 1
 
-        return self.instructions[index]
+            if instruction.isJump():
+                label = instruction.getArg(0).value
+                if self.storage.labels.has(label):
+                    instruction.target = self.positions[self.storage.labels.getOrder(label)]
 
     def __checkVariable(self, var: Argument, initRequired=True) -> Argument or Variable:
         """
         Checks a variable.
 
         :param var: Variable that is checked
-        :return: If it is a variable return variable from storage otherwise return it back.
+        :return: If it is a variable return variable from storage otherwise return constant back.
         """
-        if var.isVar() and not self.storage.frames.has(var.frame):
-            self.handler.terminateInterpret(55, 'Frame ' + var.frame + ' is not set')
-        if var.isVar() and not self.storage.frames.hasVar(var):
-            self.handler.terminateInterpret(54, 'Undefined variable <' + var.value + ':' + var.type + '>')
         if var.isVar():
-            variable = self.storage.frames.getVar(var)
+            variable = self.storage.frames.findVar(var)
+            if variable is None:
+                self.handler.terminateInterpret(54, 'Undefined variable <' + var.value + ':'
+                                                + typeName(var.type) + '>')
             if initRequired and not variable.isInitialized():
                 self.handler.terminateInterpret(56, "Variable '" + var.value + "' is not initialized")
             return variable
-        if var.isInt():
-            var.value = int(var.value)
-            return var
-        if var.isString():
-            # If string parse regex
-            var.value = self.__stringEscapesCheck(var.value)
         return var
 
-    @staticmethod
-    def __stringEscapesCheck(string):
-        """
-        Checks string for escape characters.
-
-        :param string: The checked string
-        :return: String with removed escape sequences.
-        """
-        string = str(string)
-        escapes = re.findall(r'\\[0-9]{3}', string)
-        for escape in escapes:
-            string = string.replace(escape, chr(int(escape.lstrip('\\'))))
-        return string
-
     def __initializeArithmeticOperation(self, instruction: Instruction) -> tuple:
         """
         Initialize arguments for arithmetic operation.
@@ -452,9 +723,18 @@ class Interpret:
         var = self.__checkVariable(instruction.getArg(0), False)
         symb1 = self.__checkVariable(instruction.getArg(1))
         symb2 = self.__checkVariable(instruction.getArg(2))
+        self.__checkArithmeticOperands(symb1, symb2)
+        return var, symb1, symb2
+
+    def __checkArithmeticOperands(self, symb1, symb2):
+        """
+        Checks operands of arithmetic operation.
+
+        :param symb1: First operand
+        :param symb2: Second operand
+        """
         if not symb1.isInt() or not symb2.isInt():
             self.handler.terminateProgram(53, 'Int expected')
-        return var, symb1, symb2
 
     def __initializeRelationOperation(self, instruction: Instruction) -> tuple:
         """
@@ -466,11 +746,22 @@ class Interpret:
         var = self.__checkVariable(instruction.getArg(0), False)
         symb1 = self.__checkVariable(instruction.getArg(1))
         symb2 = self.__checkVariable(instruction.getArg(2))
+        self.__checkRelationOperands(symb1, symb2)
+        return var, symb1, symb2
+
+    def __checkRelationOperands(self, symb1, symb2):
+        """
+        Checks operands of relation operation.
+
+        :param symb1: First operand
+        :param symb2: Second operand
+        """
         if symb1.type != symb2.type or (symb1.isNil() or symb2.isNil()):
-            self.handler.terminateInterpret(53, 'Types of operands do not match ' + symb1.type + ' != ' + symb2.type)
+            self.handler.terminateInterpret(53, 'Types of operands do not match '
+                                            + typeName(symb1.type) + ' != ' + typeName(symb2.type))
         if not symb1.isRelationValid() or not symb2.isRelationValid():
-            self.handler.terminateInterpret(53, 'Not valid types <' + symb1.type + ':symb1> <' + symb2.type + ':symb2>')
-        return var, symb1, symb2
+            self.handler.terminateInterpret(53, 'Not valid types <' + typeName(symb1.type) + ':symb1> '
+                                                '<' + typeName(symb2.type) + ':symb2>')
 
     def __initializeBooleanOperation(self, instruction: Instruction) -> tuple:
         """
@@ -482,12 +773,18 @@ class Interpret:
         var = self.__checkVariable(instruction.getArg(0), False)
         symb1 = self.__checkVariable(instruction.getArg(1))
         symb2 = self.__checkVariable(instruction.getArg(2)) if len(instruction.args) > 2 else None
-        if not symb1.isBool() or (symb2 and not symb2.isBool()):
-            self.handler.terminateProgram(53, 'Expected Boolean.')
+        self.__checkBooleanOperands(symb1, symb2)
         if symb2:
-            symb1 = True if symb1.value == 'true' else False
-            symb2 = True if symb2.value == 'true' else False
             return var, symb1, symb2
         else:
-            symb1 = True if symb1.value == 'true' else False
             return var, symb1
+
+    def __checkBooleanOperands(self, symb1, symb2=None):
+        """
+        Checks operands of boolean operation.
+
+        :param symb1: First operand
+        :param symb2: Second operand or None (NOT)
+        """
+        if not symb1.isBool() or (symb2 and not symb2.isBool()):
+            self.handler.terminateProgram(53, 'Expected Boolean.')
@@ -0,0 +1,139 @@
+from src.Interpret.Analyzer import Analyzer
+from src.Interpret.Instruction import Instruction
+from src.Interpret.Value import INT, BOOL, STRING
+
+
+class Inference:
+    # Types of results stored into <var> (the first operand) when the instruction succeeds
+    results = {
+        'ADD': INT, 'SUB': INT, 'MUL': INT, 'IDIV': INT, 'STRLEN': INT, 'STRI2INT': INT,
+        'LT': BOOL, 'GT': BOOL, 'EQ': BOOL, 'AND': BOOL, 'OR': BOOL, 'NOT': BOOL,
+        'INT2CHAR': STRING, 'CONCAT': STRING, 'GETCHAR': STRING, 'SETCHAR': STRING, 'TYPE': STRING,
+    }
+
+    def infer(self, instructions: list) -> list:
+        """
+        Infers types of global variables before each instruction (flow-sensitive, over basic blocks).
+        Variable has a known type only if it holds a value of this type on every path to the instruction,
+        so it is also defined and initialized there. Local and temporary frames are not tracked.
+
+        :param instructions: Instructions sorted by order (with resolved successors and targets)
+        :return: Known types (name of variable to type tag) before each instruction, None if it is not reachable.
+        """
+        blocks = Analyzer.createBlocks(instructions)
+        starts = {start: end for start, end in blocks}
+
+        # Known types at the start of blocks, None until the block is reached
+        entries = {start: None for start, end in blocks}
+        if blocks:
+            entries[0] = dict()
+        pending = [0] if blocks else []
+        while pending:
+            start = pending.pop()
+            end = starts[start]
+            state = dict(entries[start])
+            for position in range(start, end):
+                self.__transfer(instructions[position], state)
+
+            for successor, known in self.__successors(instructions[end - 1], end, state):
+                if successor not in entries:
+                    continue
+                merged = known if entries[successor] is None else self.__meet(entries[successor], known)
+                if merged != entries[successor]:
+                    entries[successor] = merged
+                    pending.append(successor)
+
+        # Known types before each instruction (shared by instructions which do not change them)
+        types = [None] * len(instructions)
+        for start, end in blocks:
+            state = entries[start]
+            if state is None:
+                continue
+            for position in range(start, end):
+                types[position] = state
+                if self.__writes(instructions[position]):
+                    state = dict(state)
+                    self.__transfer(instructions[position], state)
+        return types
+
+    def __transfer(self, instruction: Instruction, state: dict):
+        """
+        Updates known types by the instruction (as if it succeeds).
+
+        :param instruction: Executed instruction
+        :param state:       Known types of global variables
+        """
+        if not self.__writes(instruction):
+            return
+        var = instruction.getArg(0)
+        known = None
+        if instruction.opcode in self.results:
+            known = self.results[instruction.opcode]
+        elif instruction.opcode == 'MOVE':
+            symb = instruction.getArg(1)
+            known = self.typeOf(symb, state)
+
+        if known is None:
+            state.pop(var.value, None)
+        else:
+            state[var.value] = known
+
+    @staticmethod
+    def __writes(instruction: Instruction) -> bool:
+        """
+        Checks whether the instruction stores a value into a global variable.
+
+        :param instruction: Instruction
+        :return: True if the first operand is a global variable which is changed by instruction.
+        """
+        if not instruction.args or instruction.opcode in ('PUSHS', 'WRITE', 'EXIT', 'DPRINT'):
+            return False
+        var = instruction.getArg(0)
+        return var.isVar() and var.frame == 'GF'
+
+    @staticmethod
+    def __successors(last: Instruction, end: int, state: dict) -> list:
+        """
+        Gets the following blocks and known types at their start.
+        Called function can change any global variable, so nothing is known after CALL.
+
+        :param last:  The last instruction of block
+        :param end:   Position after the block
+        :param state: Known types at the end of block
+        :return: List of positions of blocks with known types.
+        """
+        successors = list()
+        if last.isJump() and last.target is not None:
+            successors.append((last.target, state))
+        if last.opcode == 'CALL':
+            successors.append((end, dict()))
+        elif last.opcode not in Analyzer.terminators:
+            successors.append((end, state))
+        return successors
+
+    @staticmethod
+    def __meet(first: dict, second: dict) -> dict:
+        """
+        Merges known types of two paths.
+
+        :param first:  Known types of the first path
+        :param second: Known types of the second path
+        :return: Types which are the same on both paths.
+        """
+        return {name: known for name, known in first.items() if second.get(name) == known}
+
+    @staticmethod
+    def typeOf(arg, state: dict or None) -> int or None:
+        """
+        Gets the type of operand proven by inference.
+
+        :param arg:   Operand of instruction
+        :param state: Known types before the instruction or None if they are not inferred
+        :return: Type tag or None if the type is not known.
+        """
+        if not arg.isVar():
+            # Int literal which is not a number is checked at runtime
+            return None if arg.type == INT and type(arg.value) is not int else arg.type
+        if state is None or arg.frame != 'GF':
+            return None
+        return state.get(arg.value)
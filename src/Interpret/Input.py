@@ -0,0 +1,74 @@
+import io
+import sys
+
+from src.Support.ErrorHandler import ErrorHandler
+
+
+class Input:
+    handler = ErrorHandler()
+
+    def __init__(self, source):
+        """
+        Initializes the input reader.
+        The source is not opened until the first line is read.
+
+        :param source: Path of input file, opened (text or binary) stream or None for standard input
+        """
+        self.source = sys.stdin if source is None else source
+        self.stream = None
+        self.owned = isinstance(source, str)
+        # Number of read lines (cursor of snapshot)
+        self.lines = 0
+
+    def readLine(self) -> str:
+        """
+        Reads next line of input.
+
+        :return: Line with the newline character or empty string if there are no more lines.
+        """
+        if self.stream is None:
+            self.open()
+        self.lines += 1
+        return self.stream.readline()
+
+    def skip(self, lines: int):
+        """
+        Skips lines which were read before the snapshot (input of resumed program is the same).
+
+        :param lines: Number of skipped lines
+        """
+        for _ in range(lines):
+            self.readLine()
+
+    def isInteractive(self) -> bool:
+        """
+        Checks whether input is read from a terminal.
+
+        :return: True if input is a terminal otherwise false.
+        """
+        return not self.owned and self.source.isatty()
+
+    def open(self):
+        """
+        Opens the source of input.
+        """
+        if not self.owned:
+            self.stream = self.source
+            if isinstance(self.source, (io.RawIOBase, io.BufferedIOBase)):
+                # Binary stream is decoded as UTF-8 (it is detached, not closed, when input is closed)
+                self.stream = io.TextIOWrapper(self.source, encoding='utf-8')
+            return
+
+        try:
+            self.stream = open(self.source)
+        except OSError as exception:
+            self.handler.terminateProgram(11, 'Can not open input file: ' + str(exception))
+
+    def close(self):
+        """
+        Closes the input file if it was opened.
+        """
+        if self.owned and self.stream is not None:
+            self.stream.close()
+        elif self.stream is not None and self.stream is not self.source:
+            self.stream.detach()
@@ -1,8 +1,16 @@
+from sys import intern
+
 from src.Interpret.Interfaces import ArgumentInterface
+from src.Interpret.Value import typeTags, nil
 from src.Support.ErrorHandler import ErrorHandler
 
+# Pattern of escape sequence (re is imported only when a string has one)
+escapeSequence = r'\\([0-9]{3})'
+
 
 class Instruction:
+    __slots__ = ('order', 'opcode', 'args', 'next', 'target')
+
     handler = ErrorHandler()
 
     def __init__(self):
@@ -12,6 +20,8 @@ class Instruction:
         self.order = None
         self.opcode = None
         self.args = list()
+        self.next = None
+        self.target = None
 
     def setOrder(self, order: str):
         """
@@ -52,22 +62,74 @@ class Instruction:
         """
         return True if self.opcode == 'LABEL' else False
 
+    def isJump(self):
+        """
+        Checks whether instruction transfers control to a label.
+        """
+        return True if self.opcode in ('CALL', 'JUMP', 'JUMPIFEQ', 'JUMPIFNEQ', 'JUMPIFEQS', 'JUMPIFNEQS') else False
+
+
+class Superinstruction(Instruction):
+    __slots__ = ('parts',)
+
+    def __init__(self, opcode: str, parts: tuple):
+        """
+        Initializes a superinstruction which fuses consecutive instructions (created by Optimizer).
+        It takes the place of the first part, the other parts stay in the list (they are skipped).
+
+        :param opcode: Name of superinstruction
+        :param parts:  Fused instructions (with resolved successors and targets)
+        """
+        super().__init__()
+        self.order = parts[0].order
+        self.opcode = opcode
+        self.args = parts[0].args
+        self.next = parts[-1].next
+        self.target = parts[-1].target
+        self.parts = parts
+
 
 class Argument(ArgumentInterface):
+    __slots__ = ('type', 'frame', 'value')
+
     handler = ErrorHandler()
 
     def __init__(self, argType: str, value: str):
         """
         Initializes the argument
 
-        :param argType: Argument type
+        :param argType: Argument type (name)
         :param value:   Argument value
         """
-        self.type = argType
+        self.type = typeTags[argType]
 
-        if len(value) > 2 and value[2] == '@':
-            self.frame = value[:2]
-            self.value = value[3:]
+        # Names of frames and variables are shared by all arguments
+        if self.isVar():
+            self.frame = intern(value[:2])
+            self.value = intern(value[3:])
         else:
             self.frame = None
             self.value = value
+
+        # Decode literals into native values once, so execution only reads ready values
+        if self.isInt() and value.lstrip('-').isdigit():
+            self.value = int(value)
+        elif self.isBool():
+            self.value = value == 'true'
+        elif self.isNil():
+            self.value = nil
+        elif self.isString():
+            self.value = self.decode(value)
+
+    @staticmethod
+    def decode(string: str) -> str:
+        """
+        Replaces escape sequences (\\xyz) in string with its characters.
+
+        :param string: The decoded string
+        :return: String with replaced escape sequences.
+        """
+        if '\\' not in string:
+            return string
+        import re
+        return re.sub(escapeSequence, lambda match: chr(int(match.group(1))), string)
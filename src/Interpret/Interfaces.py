@@ -1,36 +1,37 @@
+from src.Interpret.Value import NIL, INT, BOOL, STRING, VAR, LABEL, TYPE
 from src.Support.ErrorHandler import ErrorHandler
 
 
 class ArgumentInterface:
-    type = None
-    value = None
+    # Attributes are defined by __slots__ of subclasses
+    __slots__ = ()
 
     def isInt(self):
-        return True if self.type == 'int' else False
+        return True if self.type == INT else False
 
     def isBool(self):
-        return True if self.type == 'bool' else False
+        return True if self.type == BOOL else False
 
     def isNil(self):
-        return True if self.type == 'nil' else False
+        return True if self.type == NIL else False
 
     def isString(self):
-        return True if self.type == 'string' else False
+        return True if self.type == STRING else False
 
     def isSymb(self):
-        return True if self.isInt() or self.isBool() or self.isString() or self.isNil() else False
+        return True if self.type is not None and self.type <= STRING else False
 
     def isRelationValid(self):
-        return True if self.isInt() or self.isBool() or self.isString() or self.isNil() else False
+        return True if self.type is not None and self.type <= STRING else False
 
     def isVar(self):
-        return True if self.type == 'var' else False
+        return True if self.type == VAR else False
 
     def isLabel(self):
-        return True if self.type == 'label' else False
+        return True if self.type == LABEL else False
 
     def isType(self):
-        return True if self.type == 'type' else False
+        return True if self.type == TYPE else False
 
     def isInitialized(self):
         return True if self.value is not None else False
@@ -0,0 +1,161 @@
+import io
+from xml.parsers import expat
+
+from src.Interpret.Parser import Parser
+from src.Support.ErrorHandler import ErrorHandler
+
+
+class Node:
+    def __init__(self, tagName: str, attributes: dict):
+        """
+        Initializes an element node of the XML source.
+
+        :param tagName:    Tag name of element
+        :param attributes: Attributes of element
+        """
+        self.tagName = tagName
+        self.attributes = attributes
+        self.childNodes = list()
+        self.text = ''
+        self.illegal = False
+
+    def getAttribute(self, name: str) -> str:
+        """
+        Gets value of attribute.
+
+        :param name: Name of attribute
+        :return: Value of attribute or empty string if element does not have it.
+        """
+        return self.attributes.get(name, '')
+
+
+class Loader:
+    handler = ErrorHandler()
+
+    def __init__(self):
+        """
+        Initializes the loader of XML source.
+        """
+        self.parser = Parser()
+        self.instructions = list()
+        self.depth = 0
+        self.root = None
+        self.instruction = None
+        self.argument = None
+
+    def load(self, source) -> list:
+        """
+        Loads program image from XML source in a single pass.
+        Each <instruction> element is checked by Parser and converted into
+        a tuple (order, opcode, ((type, value), ...)) when it is closed.
+
+        :param source: Path of XML source file or opened (binary or text) stream
+        :return: Program image - list of instructions in order of the XML source.
+        """
+        reader = expat.ParserCreate()
+        reader.buffer_text = True
+        reader.StartElementHandler = self.__startElement
+        reader.EndElementHandler = self.__endElement
+        reader.CharacterDataHandler = self.__characterData
+        reader.CommentHandler = self.__illegalNode
+        reader.ProcessingInstructionHandler = self.__illegalNode
+        reader.StartCdataSectionHandler = self.__illegalNode
+
+        try:
+            if isinstance(source, str):
+                with open(source, 'rb') as file:
+                    reader.ParseFile(file)
+            elif not isinstance(source, io.TextIOBase):
+                reader.ParseFile(source)
+            elif hasattr(source, 'buffer'):
+                reader.ParseFile(source.buffer)
+            else:
+                # Text stream without binary buffer (e.g. io.StringIO)
+                reader.Parse(source.read(), True)
+        except (expat.ExpatError, OSError) as exception:
+            self.handler.terminateProgram(31, 'XML Error: ' + str(exception))
+
+        # Errors of XML structure are reported only for well-formed XML
+        self.parser.terminate()
+
+        return self.instructions
+
+    def __startElement(self, tagName: str, attributes: dict):
+        """
+        Handles start of an element.
+
+        :param tagName:    Tag name of element
+        :param attributes: Attributes of element
+        """
+        self.depth += 1
+        node = Node(tagName, attributes)
+
+        if self.depth == 1:
+            self.root = node
+            self.parser.checkRootNode(node)
+        elif self.depth == 2:
+            self.instruction = node
+        elif self.depth == 3:
+            self.instruction.childNodes.append(node)
+            self.argument = node
+        elif self.depth == 4:
+            self.__illegalNode()
+
+    def __endElement(self, tagName: str):
+        """
+        Handles end of an element.
+
+        :param tagName: Tag name of element
+        """
+        if self.depth == 2:
+            self.__registerInstruction(self.instruction)
+            self.instruction = None
+        elif self.depth == 3:
+            self.argument = None
+        self.depth -= 1
+
+    def __characterData(self, data: str):
+        """
+        Handles text of an element.
+
+        :param data: Text data
+        """
+        if self.depth == 1:
+            if data.lstrip().rstrip() != "":
+                self.parser.fail('Illegal nodeType.')
+        elif self.depth == 2:
+            if data.lstrip().rstrip() != "":
+                self.instruction.illegal = True
+        elif self.depth == 3:
+            self.argument.text += data
+
+    def __illegalNode(self, *data):
+        """
+        Handles a node which is not allowed (comment, processing instruction, CDATA, nested element).
+
+        :param data: Data of node
+        """
+        if self.depth == 1:
+            self.parser.fail('Illegal nodeType.')
+        elif self.depth == 2:
+            self.instruction.illegal = True
+        elif self.depth >= 3:
+            self.argument.illegal = True
+
+    def __registerInstruction(self, node: Node):
+        """
+        Register an instruction.
+
+        :param node: <instruction> node
+        """
+        if not self.parser.checkInstructionNode(node) or self.parser.error is not None:
+            return
+
+        # Sort arguments
+        argNodes = sorted(node.childNodes, key=lambda x: x.tagName)
+
+        self.instructions.append((
+            int(node.getAttribute('order')),
+            node.getAttribute('opcode').upper(),
+            tuple((argument.getAttribute('type'), argument.text) for argument in argNodes)
+        ))
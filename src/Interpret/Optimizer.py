@@ -0,0 +1,91 @@
+from src.Interpret.Instruction import Instruction, Superinstruction
+from src.Interpret.Value import INT, BOOL
+
+
+class Optimizer:
+    # Names of superinstructions
+    COMPARE_JUMP = 'COMPAREJUMP'  # LT/GT/EQ <var> <symb1> <symb2> + JUMPIF(N)EQ <label> <var> bool@<value>
+    STACK_MOVE = 'STACKMOVE'      # PUSHS <symb> + POPS <var>
+    DEFINE_MOVE = 'DEFINEMOVE'    # DEFVAR <var> + MOVE <var> <symb>
+    INCREMENT = 'INCREMENT'       # ADD/SUB <var> <var> int@<value>
+
+    def __init__(self):
+        """
+        Initializes the peephole optimizer.
+        """
+        self.counts = dict()
+
+    def optimize(self, instructions: list) -> int:
+        """
+        Rewrites windows of instructions into superinstructions (in place).
+        Instructions have to be sorted and have resolved successors and targets. Positions of instructions
+        are not changed, the superinstruction takes the place of its first part and skips the others,
+        so labels and return addresses stay valid.
+
+        :param instructions: Instructions sorted by order
+        :return: Number of created superinstructions.
+        """
+        position = 0
+        count = 0
+        while position < len(instructions):
+            window = instructions[position:position + 2]
+            superinstruction = self.__fuse(window)
+            if superinstruction is None:
+                position += 1
+                continue
+            instructions[position] = superinstruction
+            self.counts[superinstruction.opcode] = self.counts.get(superinstruction.opcode, 0) + 1
+            position += len(superinstruction.parts)
+            count += 1
+        return count
+
+    def __fuse(self, window: list) -> Superinstruction or None:
+        """
+        Fuses the window of instructions into a superinstruction.
+
+        :param window: First instruction and the following one (if there is any)
+        :return: Superinstruction or None if the window does not match any pattern.
+        """
+        first = window[0]
+        second = window[1] if len(window) > 1 else None
+
+        if second is not None:
+            if (first.opcode in ('LT', 'GT', 'EQ') and second.opcode in ('JUMPIFEQ', 'JUMPIFNEQ')
+                    and self.__isBranchOn(second, first.getArg(0))):
+                return Superinstruction(self.COMPARE_JUMP, (first, second))
+            if first.opcode == 'PUSHS' and second.opcode == 'POPS':
+                return Superinstruction(self.STACK_MOVE, (first, second))
+            if (first.opcode == 'DEFVAR' and second.opcode == 'MOVE'
+                    and self.__isSameVariable(first.getArg(0), second.getArg(0))):
+                return Superinstruction(self.DEFINE_MOVE, (first, second))
+
+        if (first.opcode in ('ADD', 'SUB') and self.__isSameVariable(first.getArg(0), first.getArg(1))
+                and first.getArg(2).type == INT):
+            return Superinstruction(self.INCREMENT, (first,))
+        return None
+
+    def __isBranchOn(self, jump: Instruction, var) -> bool:
+        """
+        Checks whether the conditional jump compares the variable with a bool constant.
+
+        :param jump: JUMPIFEQ or JUMPIFNEQ instruction
+        :param var:  Variable where the result of comparison is stored
+        :return: True if one operand is the variable and the other one is a bool constant.
+        """
+        first, second = jump.getArg(1), jump.getArg(2)
+        if self.__isSameVariable(first, var):
+            return second.type == BOOL
+        if self.__isSameVariable(second, var):
+            return first.type == BOOL
+        return False
+
+    @staticmethod
+    def __isSameVariable(first, second) -> bool:
+        """
+        Checks whether both arguments are the same variable.
+
+        :param first:  First argument
+        :param second: Second argument
+        :return: True if both are variables with the same frame and name.
+        """
+        return first.isVar() and second.isVar() and first.frame == second.frame and first.value == second.value
@@ -0,0 +1,92 @@
+import sys
+
+from src.Support.ErrorHandler import ErrorHandler
+
+
+class Output:
+    handler = ErrorHandler()
+
+    def __init__(self, outputFile=None, errorFile=None, limit=65536, append=False):
+        """
+        Initializes the output buffer.
+
+        :param outputFile: Path of output file, opened stream or None for standard output
+        :param errorFile:  Opened stream or None for standard error output
+        :param limit:      Size of buffer (in characters) when it is flushed
+        :param append:     True if the output file is continued (resumed program), otherwise it is truncated
+        """
+        self.buffer = list()
+        self.size = 0
+        self.limit = limit
+        self.owned = isinstance(outputFile, str)
+        self.errorStream = sys.stderr if errorFile is None else errorFile
+
+        if outputFile is None:
+            self.stream = sys.stdout
+        elif not self.owned:
+            self.stream = outputFile
+        else:
+            try:
+                self.stream = open(outputFile, 'a' if append else 'w')
+            except OSError as exception:
+                self.handler.terminateProgram(12, 'Can not open output file: ' + str(exception))
+
+    def write(self, text: str):
+        """
+        Writes a text into the buffer.
+
+        :param text: Written text
+        """
+        self.buffer.append(text)
+        self.size += len(text)
+        if self.size >= self.limit:
+            self.flush()
+
+    def error(self, text: str):
+        """
+        Writes a line into the error output.
+        Buffer is flushed before, so the order of both outputs is kept.
+
+        :param text: Written text
+        """
+        self.flush()
+        print(text, file=self.errorStream, flush=True)
+
+    def flush(self):
+        """
+        Flushes the buffer into the output stream.
+        """
+        if self.buffer:
+            self.stream.write(''.join(self.buffer))
+            self.buffer = list()
+            self.size = 0
+        self.stream.flush()
+
+    def tell(self) -> int or None:
+        """
+        Gets the size of written output file (buffer is flushed before).
+
+        :return: Size of output file or None if the output is not an owned file.
+        """
+        self.flush()
+        if not self.owned:
+            return None
+        return self.stream.tell()
+
+    def truncate(self, size: int):
+        """
+        Truncates the output file to the given size (output written after the snapshot is dropped).
+
+        :param size: Size of output file when the snapshot was written
+        """
+        self.flush()
+        if self.owned and size < self.stream.tell():
+            self.stream.truncate(size)
+
+    def close(self):
+        """
+        Flushes the buffer and closes the output file.
+        """
+        self.flush()
+        if self.owned:
+            self.stream.close()
@@ -2,201 +2,174 @@ import re
 from src.Support.DataHandler import instructions
 from src.Support.ErrorHandler import ErrorHandler
 
+# Patterns of argument values
+argName = re.compile('arg[1-3]')
+varValue = re.compile('(GF|LF|TF)@[a-zA-Z?!*%$&_-][a-zA-Z0-9?!*%$&_-]*')
+labelValue = re.compile('[a-zA-Z?!*%$&_-][a-zA-Z0-9?!*%$&_-]*')
+intValue = re.compile('-?[0-9]+')
+boolValue = re.compile('true|false')
+nilValue = re.compile('nil')
+typeValue = re.compile('int|string|bool')
+
+
+def anyValue(expression: str) -> bool:
+    """
+    Accepts any value (string literal).
+
+    :param expression: The checked expression
+    :return: Always true.
+    """
+    return True
+
+
+# Value checkers by (operand type, argument type)
+checkers = {
+    ('var', 'var'): varValue.fullmatch,
+    ('symb', 'var'): varValue.fullmatch,
+    ('symb', 'int'): intValue.fullmatch,
+    ('symb', 'bool'): boolValue.fullmatch,
+    ('symb', 'nil'): nilValue.fullmatch,
+    ('symb', 'string'): anyValue,
+    ('label', 'label'): labelValue.fullmatch,
+    ('type', 'type'): typeValue.fullmatch,
+}
+
+# Operand types of instructions
+schemas = {opcode: tuple(operands) for opcode, operands in instructions.items()}
+
+# Allowed attributes of elements
+rootAttributes = frozenset(['name', 'description', 'language'])
+instructionAttributes = frozenset(['order', 'opcode'])
+argAttributes = frozenset(['type'])
+
 
 class Parser:
-    def __init__(self, tree):
+    def __init__(self):
         """
         Parser invoker.
-
-        :param tree: tree of the XML structure.
+        Checks elements of the XML structure one by one, the first error is kept.
         """
         self.handler = ErrorHandler()
+        self.error = None
+
+    def fail(self, message: str) -> bool:
+        """
+        Keeps the first error of the XML structure.
 
-        root = self.__checkRootNode(tree.documentElement)
+        :param message: Error message
+        :return: Always false.
+        """
+        if self.error is None:
+            self.error = message
+        return False
 
-        self.__checkNodes(root.childNodes)
+    def terminate(self):
+        """
+        Terminates the program if the XML structure has an error.
+        """
+        if self.error is not None:
+            self.handler.terminateProgram(32, self.error)
 
-    def __checkRootNode(self, root):
+    def checkRootNode(self, root) -> bool:
         """
         Checks root node element.
 
         :param root: The root node
+        :return: True if root node is valid otherwise false.
         """
-        allowedAttributes = ['name', 'description', 'language']
-
         if root.tagName != 'program':
-            self.handler.terminateProgram(32, 'Unknown root element: ' + root.tagName)
-
-        if not self.__hasValidAttributes(root, allowedAttributes):
-            self.handler.terminateProgram(32, '<program> has illegal attribute')
+            return self.fail('Unknown root element: ' + root.tagName)
 
-        return root
+        if not rootAttributes.issuperset(root.attributes):
+            return self.fail('<program> has illegal attribute')
 
-    def __checkNodes(self, nodes):
-        """
-        Checks if nodes contains only instructions.
+        return True
 
-        :param nodes: The checked nodes
-        """
-        for node in nodes:
-            if node.nodeType == 1:
-                self.__checkInstructionNode(node)
-            else:
-                if node.nodeType == 3 and node.data.lstrip().rstrip() == "":  # TEXT Node
-                    continue
-                self.handler.terminateProgram(32, 'Illegal nodeType.')
-
-    def __checkInstructionNode(self, node):
+    def checkInstructionNode(self, node) -> bool:
         """
         Checks if node is an instruction.
 
         :param node: The checked node
+        :return: True if instruction node is valid otherwise false.
         """
-        allowedAttributes = ['order', 'opcode']
-
         if node.tagName != 'instruction':
-            self.handler.terminateProgram(32, 'Illegal tag name: ' + node.tagName)
-        if not self.__hasValidAttributes(node, allowedAttributes):
-            self.handler.terminateProgram(32, '<instruction> has illegal attributes.')
+            return self.fail('Illegal tag name: ' + node.tagName)
+        if not instructionAttributes.issuperset(node.attributes):
+            return self.fail('<instruction> has illegal attributes.')
 
         # Check if instruction exists
         opcode = node.getAttribute('opcode').upper()
-        if opcode not in instructions:
-            self.handler.terminateProgram(32, 'Unknown instruction: ' + node.getAttribute('opcode'))
+        schema = schemas.get(opcode)
+        if schema is None:
+            return self.fail('Unknown instruction: ' + node.getAttribute('opcode'))
 
         # Check if order > 0
         order = node.getAttribute('order')
-        if not order.lstrip('-').isdigit() or int(order) < 1:
-            self.handler.terminateProgram(32, 'Order attribute has incorrect value.')
+        if intValue.fullmatch(order) is None or int(order) < 1:
+            return self.fail('Order attribute has incorrect value.')
 
         # Check child (arg) nodes
-        if node.hasChildNodes():
-            self.__checkArgNodes(opcode, node.childNodes)
+        return self.__checkArgNodes(opcode, schema, node)
 
-    def __checkArgNodes(self, instruction, nodes):
+    def __checkArgNodes(self, instruction: str, schema: tuple, node) -> bool:
         """
-        Checks arg nodes of instruction.
+        Checks arg nodes of instruction, each of argN has to be set once.
 
         :param instruction: Instruction that has these args
-        :param nodes:       The checked nodes
-        """
-        index = 0
-        argIndexes = [0] * len(instructions.get(instruction))
-        for node in nodes:
-            if node.nodeType == 1:
-                # Check for index
-                if index >= len(instructions.get(instruction)):
-                    self.handler.terminateProgram(32, instruction+' has invalid number of operands.')
-                # Check argument node
-                argIndex = self.__checkArgNode(node, instruction)
-                argIndexes[index] = argIndex
-                index += 1
-            else:
-                if node.nodeType == 3 and node.data.lstrip().rstrip() == "":  # TEXT Node newline
-                    continue
-                self.handler.terminateProgram(32, 'Illegal nodeType.')
-        if 0 in argIndexes:
-            self.handler.terminateProgram(32, instruction+' has invalid number of operands.')
-
-    def __checkArgNode(self, node, instruction):
+        :param schema:      Operand types of instruction
+        :param node:        Instruction node with checked arg nodes
+        :return: True if arg nodes are valid otherwise false.
         """
-        Checks current arg node and its value.
+        if node.illegal:
+            return self.fail('Illegal nodeType.')
+        if len(node.childNodes) != len(schema):
+            return self.fail(instruction + ' has invalid number of operands.')
 
-        :param node:        Current arg node
-        :param instruction: Instruction that is related to current argument
-        :return Index of argument.
-        """
-        allowedAttributes = ['type']
-
-        if not re.fullmatch('(arg[1-3])', node.tagName):
-            self.handler.terminateProgram(32, instruction + ' has invalid name of arg.')
-
-        argIndex = node.tagName[3]
-
-        if not self.__hasValidAttributes(node, allowedAttributes):
-            self.handler.terminateProgram(32, '<arg'+argIndex+'> has illegal attributes')
-
-        # Check child (text) nodes
-        if node.hasChildNodes():
-            for arg in node.childNodes:
-                if arg.nodeType == 3:  # TEXT Nodes
-                    index = int(argIndex) - 1
-                    if index >= len(instructions.get(instruction)):
-                        self.handler.terminateProgram(
-                            32,
-                            instruction + " has invalid argument."
-                        )
-                    operandType = instructions.get(instruction)[index]
-                    if not self.__isValueValid(arg.data, node.getAttribute('type'), operandType):
-                        self.handler.terminateProgram(
-                            32,
-                            instruction + " expected "+operandType+" but type "+node.getAttribute('type')+" given."
-                        )
-                else:
-                    self.handler.terminateProgram(32, 'Illegal nodeType.')
-
-        return int(argIndex)
-
-    @staticmethod
-    def __hasValidAttributes(node, attributes: list) -> bool:
-        """
-        Checks if attribute is valid.
-
-        :param node: The checked node
-        :param attributes: List of allowed attributes
-        :return: False if attributes are not in allowed attributes otherwise True.
-        """
-        for i in range(node.attributes.length):
-            if node.attributes.item(i).name not in attributes:
+        argIndexes = 0
+        for child in node.childNodes:
+            argIndex = self.__checkArgNode(child, instruction, schema)
+            if argIndex is None:
                 return False
-        return True
+            argIndexes |= 1 << argIndex
 
-    @staticmethod
-    def __isValueValid(expression: str, argType: str, operandType: str) -> bool:
-        """
-        Check if arg has valid value
+        # All of arg1..argN are set
+        if argIndexes != (1 << len(schema)) - 1:
+            return self.fail(instruction + ' has invalid number of operands.')
 
-        :param expression:  The checked expression
-        :param argType:     Argument type (actual)
-        :param operandType: Operand type (from instruction)
-        :return:
-        """
-        frames = ['GF', 'LF', 'TF']
+        return True
 
-        if operandType == 'var' or (operandType == 'symb' and argType == 'var'):
-            if argType != 'var':
-                return False
-            if expression[0:2] not in frames:
-                return False
-            if expression[2] != '@':
-                return False
-            if not re.match('[a-zA-Z?!*%$&_-]', expression[3]):
-                return False
-            if not re.fullmatch('^([a-zA-Z0-9?!*%$&_-])*$', expression[3:]):
-                return False
-        elif operandType == 'symb':
-            args = ['int', 'bool', 'nil', 'string']
-            if argType not in args:
-                return False
-            if argType == 'int' and not expression.lstrip('-').isdigit():
-                return False
-            if argType == 'bool' and (expression != 'true' and expression != 'false'):
-                return False
-            if argType == 'nil' and expression != 'nil':
-                return False
-            if argType == 'string' and not isinstance(expression, str):
-                return False
-        elif operandType == 'label':
-            if argType != 'label':
-                return False
-            if not re.match('[a-zA-Z?!*%$&_-]', expression[0]):
-                return False
-            if not re.fullmatch('^([a-zA-Z0-9?!*%$&_-])*$', expression):
-                return False
-        elif operandType == 'type':
-            if argType != 'type':
-                return False
-            if expression != 'int' and expression != 'string' and expression != 'bool':
-                return False
+    def __checkArgNode(self, node, instruction: str, schema: tuple) -> int or None:
+        """
+        Checks current arg node and its value.
 
-        return True
+        :param node:        Current arg node
+        :param instruction: Instruction that is related to current argument
+        :param schema:      Operand types of instruction
+        :return: Index of argument (from 0) or None if arg node is not valid (the error is kept by fail).
+        """
+        if argName.fullmatch(node.tagName) is None:
+            self.fail(instruction + ' has invalid name of arg.')
+            return None
+
+        index = int(node.tagName[3]) - 1
+
+        if not argAttributes.issuperset(node.attributes):
+            self.fail('<' + node.tagName + '> has illegal attributes')
+            return None
+
+        # Check child (text) node
+        if node.illegal:
+            self.fail('Illegal nodeType.')
+            return None
+        if index >= len(schema):
+            self.fail(instruction + " has invalid argument.")
+            return None
+
+        operandType = schema[index]
+        argType = node.getAttribute('type')
+        checker = checkers.get((operandType, argType))
+        if checker is None or not checker(node.text):
+            self.fail(instruction + " expected " + operandType + " but type " + argType + " given.")
+            return None
+
+        return index
@@ -0,0 +1,152 @@
+import json
+
+from src.Support.ErrorHandler import ErrorHandler
+
+# Name of function for instructions outside of any called function
+MAIN = '<main>'
+
+
+class Profiler:
+    handler = ErrorHandler()
+
+    def __init__(self, instructions: list):
+        """
+        Initializes the profiler of instructions.
+        Counts and times are kept by position of instruction, opcodes and labels are summed up at the end.
+
+        :param instructions: Instructions sorted by order
+        """
+        self.instructions = instructions
+        self.counts = [0] * len(instructions)
+        self.times = [0] * len(instructions)
+        self.functions = dict()
+
+        # Label of each instruction is the nearest preceding LABEL (block of code, e.g. body of a loop)
+        self.labels = list()
+        label = MAIN
+        for instruction in instructions:
+            if instruction.opcode == 'LABEL':
+                label = instruction.getArg(0).value
+            self.labels.append(label)
+
+    def record(self, position: int, function: str or None, elapsed: int):
+        """
+        Records an executed instruction.
+
+        :param position: Position of instruction
+        :param function: Label of called function where the instruction is executed or None
+        :param elapsed:  Time of execution in nanoseconds
+        """
+        self.counts[position] += 1
+        self.times[position] += elapsed
+
+        statistic = self.functions.get(function)
+        if statistic is None:
+            statistic = self.functions[function] = [0, 0]
+        statistic[0] += 1
+        statistic[1] += elapsed
+
+    def export(self) -> dict:
+        """
+        Exports the profile, each part is sorted by time.
+
+        :return: Profile with executions and times (in milliseconds) of opcodes, functions, labels and instructions.
+        """
+        opcodes = dict()
+        labels = dict()
+        calls = dict()
+        instructions = list()
+        for position, instruction in enumerate(self.instructions):
+            count = self.counts[position]
+            if count == 0:
+                continue
+            elapsed = self.times[position]
+            self.__add(opcodes, instruction.opcode, count, elapsed)
+            self.__add(labels, self.labels[position], count, elapsed)
+            if instruction.opcode == 'CALL':
+                label = instruction.getArg(0).value
+                calls[label] = calls.get(label, 0) + count
+            instructions.append({'order': instruction.order, 'opcode': instruction.opcode,
+                                 'label': self.labels[position], 'count': count, 'time': elapsed / 1e6})
+
+        functions = dict()
+        for function, (count, elapsed) in self.functions.items():
+            name = MAIN if function is None else function
+            functions[name] = {'count': count, 'time': elapsed / 1e6, 'calls': calls.get(name, 0)}
+
+        return {
+            'executions': sum(self.counts),
+            'time': sum(self.times) / 1e6,
+            'opcodes': self.__sort(opcodes, 'opcode'),
+            'functions': self.__sort(functions, 'function'),
+            'labels': self.__sort(labels, 'label'),
+            'instructions': sorted(instructions, key=lambda item: (-item['time'], item['order'])),
+        }
+
+    def report(self, profile: dict, limit: int = 20) -> str:
+        """
+        Creates a text report of profile.
+
+        :param profile: Exported profile
+        :param limit:   Maximal number of rows of each part
+        :return: Report sorted by time.
+        """
+        total = profile['time'] or 1
+        string = "========== Profile ==========\n" \
+                 "Executions: " + str(profile['executions']) + '\n' \
+                 "Time: " + format(profile['time'], '.3f') + ' ms\n'
+
+        for title, key in [('Opcodes', 'opcode'), ('Functions', 'function'), ('Labels', 'label'),
+                           ('Instructions', 'order')]:
+            string += '---------- ' + title + ' ----------\n'
+            string += format('count', '>12') + format('time [ms]', '>14') + format('%', '>8') + '  ' + key + '\n'
+            for item in profile[title.lower()][:limit]:
+                name = str(item[key])
+                if key == 'order':
+                    name += ' ' + item['opcode'] + ' (' + item['label'] + ')'
+                if key == 'function':
+                    name += ' (calls: ' + str(item['calls']) + ')'
+                string += format(item['count'], '>12') + format(item['time'], '>14.3f') \
+                    + format(item['time'] / total * 100, '>8.1f') + '  ' + name + '\n'
+        return string + "============================="
+
+    def write(self, profile: dict, profileFile: str):
+        """
+        Writes the profile as JSON.
+
+        :param profile:     Exported profile
+        :param profileFile: Path of profile file
+        """
+        try:
+            with open(profileFile, 'w') as file:
+                json.dump(profile, file, indent=2)
+        except OSError as exception:
+            self.handler.terminateProgram(12, 'Can not write profile: ' + str(exception))
+
+    @staticmethod
+    def __add(statistics: dict, name: str, count: int, elapsed: int):
+        """
+        Adds executions and time of instruction into statistics.
+
+        :param statistics: Statistics by name
+        :param name:       Name of statistic
+        :param count:      Executions of instruction
+        :param elapsed:    Time of instruction in nanoseconds
+        """
+        statistic = statistics.get(name)
+        if statistic is None:
+            statistic = statistics[name] = {'count': 0, 'time': 0}
+        statistic['count'] += count
+        statistic['time'] += elapsed / 1e6
+
+    @staticmethod
+    def __sort(statistics: dict, key: str) -> list:
+        """
+        Sorts statistics by time.
+
+        :param statistics: Statistics by name
+        :param key:        Key of name in sorted items
+        :return: List of statistics sorted by time (descending).
+        """
+        items = [dict({key: name}, **statistic) for name, statistic in statistics.items()]
+        return sorted(items, key=lambda item: (-item['time'], item[key]))
@@ -0,0 +1,60 @@
+from src.Interpret.Core import Interpret
+from src.Support.ErrorHandler import ErrorHandler
+from src.Support.Exception import InterpretException
+
+handler = ErrorHandler()
+
+
+def run(source, stdin=None, stdout=None, stderr=None, engine: str = 'reference', cache=None,
+        profile: str = None, optimize: bool = False, analyze: bool = False, budget=None, snapshot=None,
+        resume: str = None) -> int:
+    """
+    Runs a program in the current process.
+    Errors are not terminating the process, so it can run many programs one after another.
+
+    :param source:   XML source of IPPcode21 (path or opened stream)
+    :param stdin:    Input of program (path, opened text or binary stream or None for standard input)
+    :param stdout:   Output of program (path, opened stream or None for standard output)
+    :param stderr:   Output of DPRINT and BREAK (opened stream or None for standard error output)
+    :param engine:   Execution engine (reference or compiled)
+    :param cache:    Cache of program images or None if it is not used
+    :param profile:  Path of JSON profile or None if the program is not profiled
+    :param optimize: True if instructions are fused into superinstructions by peephole optimizer
+    :param analyze:  True if the program is reduced by static analyzer (its report is written into stderr)
+    :param budget:   Execution budget (limits of instructions, time and memory) or None
+    :param snapshot: Writer of snapshots or None
+    :param resume:   Path of snapshot from which the program continues or None
+    :return: Exit code of program (0 if it ends without EXIT).
+    """
+    try:
+        execute(source, stdin, stdout, stderr, engine, cache, profile, optimize, analyze, budget, snapshot, resume)
+    except InterpretException as exception:
+        return exception.code
+    return 0
+
+
+def execute(source, stdin=None, stdout=None, stderr=None, engine: str = 'reference', cache=None,
+            profile: str = None, optimize: bool = False, analyze: bool = False, budget=None, snapshot=None,
+            resume: str = None):
+    """
+    Runs a program in the current process, errors are raised as exceptions.
+
+    :param source:   XML source of IPPcode21 (path or opened stream)
+    :param stdin:    Input of program (path, opened text or binary stream or None for standard input)
+    :param stdout:   Output of program (path, opened stream or None for standard output)
+    :param stderr:   Output of DPRINT and BREAK (opened stream or None for standard error output)
+    :param engine:   Execution engine (reference or compiled)
+    :param cache:    Cache of program images or None if it is not used
+    :param profile:  Path of JSON profile or None if the program is not profiled
+    :param optimize: True if instructions are fused into superinstructions by peephole optimizer
+    :param analyze:  True if the program is reduced by static analyzer (its report is written into stderr)
+    :param budget:   Execution budget (limits of instructions, time and memory) or None
+    :param snapshot: Writer of snapshots or None
+    :param resume:   Path of snapshot from which the program continues or None
+    :raise InterpretException: Program was terminated by an error (or ExitException by EXIT instruction)
+    """
+    if engine not in Interpret.engines:
+        handler.terminateProgram(10, 'Engine ' + engine + ' is invalid.')
+
+    Interpret(source, stdin, engine, stdout, cache, stderr, profile, optimize, analyze, budget, snapshot,
+              resume).run()
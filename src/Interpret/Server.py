@@ -0,0 +1,302 @@
+import io
+import os
+import signal
+import socket
+import stat
+import struct
+
+from src.Interpret.Cache import Cache, MemoryCache
+from src.Interpret.Runner import run
+from src.Support.ErrorHandler import ErrorHandler
+
+# Header of frame: kind (1 byte) and length of payload (4 bytes, big-endian)
+header = struct.Struct('>cI')
+
+# Maximal length of payload of request frame
+LIMIT = 64 * 1024 * 1024
+
+# Time (in seconds) of each receive or send of connection, idle client must not hold a worker
+TIMEOUT = 10.0
+
+
+class ServerDrain(Exception):
+    """
+    Worker is stopped while it waits for a job.
+    """
+
+
+class Channel:
+    def __init__(self, connection: socket.socket, kind: bytes):
+        """
+        Initializes the output stream of program which sends written text as frames.
+
+        :param connection: Connection of client
+        :param kind:       Kind of frames (O for stdout, E for stderr)
+        """
+        self.connection = connection
+        self.kind = kind
+
+    def write(self, text: str):
+        """
+        Sends a text to the client.
+
+        :param text: Written text
+        """
+        if text:
+            sendFrame(self.connection, self.kind, text.encode('utf-8'))
+
+    def flush(self):
+        """
+        Text is sent when it is written (Output buffers it).
+        """
+
+
+def sendFrame(connection: socket.socket, kind: bytes, payload: bytes):
+    """
+    Sends a frame.
+
+    :param connection: Connected socket
+    :param kind:       Kind of frame
+    :param payload:    Payload of frame
+    """
+    connection.sendall(header.pack(kind, len(payload)) + payload)
+
+
+def receiveFrame(connection: socket.socket, limit: int = None) -> tuple or None:
+    """
+    Receives a frame.
+
+    :param connection: Connected socket
+    :param limit:      Maximal length of payload or None
+    :return: Kind and payload of frame or None if the connection is closed or the frame is too long.
+    """
+    head = receiveExactly(connection, header.size)
+    if head is None:
+        return None
+    kind, length = header.unpack(head)
+    if limit is not None and length > limit:
+        return None
+    payload = receiveExactly(connection, length)
+    if payload is None:
+        return None
+    return kind, payload
+
+
+def receiveExactly(connection: socket.socket, size: int) -> bytes or None:
+    """
+    Receives the given number of bytes.
+
+    :param connection: Connected socket
+    :param size:       Number of bytes
+    :return: Received bytes or None if the connection is closed before.
+    """
+    chunks = list()
+    while size > 0:
+        chunk = connection.recv(min(size, 1024 * 1024))
+        if not chunk:
+            return None
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b''.join(chunks)
+
+
+def submit(path: str, source: bytes, stdin: bytes = b'') -> tuple:
+    """
+    Runs a program by the server (client of --serve).
+
+    :param path:   Path of server socket
+    :param source: XML source of IPPcode21
+    :param stdin:  Input of program
+    :return: Standard output, standard error output and exit code of program.
+    """
+    stdout = list()
+    stderr = list()
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(path)
+        sendFrame(connection, b'S', source)
+        sendFrame(connection, b'I', stdin)
+        while True:
+            frame = receiveFrame(connection)
+            if frame is None:
+                raise ConnectionError('Server closed the connection.')
+            kind, payload = frame
+            if kind == b'O':
+                stdout.append(payload)
+            elif kind == b'E':
+                stderr.append(payload)
+            elif kind == b'X':
+                code, = struct.unpack('>i', payload)
+                return b''.join(stdout).decode('utf-8'), b''.join(stderr).decode('utf-8'), code
+
+
+class Server:
+    handler = ErrorHandler()
+
+    def __init__(self, path: str, jobs: int = None, engine: str = 'reference', cached: bool = True,
+                 optimize: bool = False, analyze: bool = False, budget=None, backlog: int = 128,
+                 timeout: float = TIMEOUT):
+        """
+        Initializes the server of warm worker processes on a Unix socket.
+        Each worker runs one program at a time, so the number of workers limits concurrently executed programs,
+        other connections wait in the queue of socket.
+
+        :param path:     Path of Unix socket
+        :param jobs:     Number of worker processes (number of cores by default)
+        :param engine:   Execution engine
+        :param cached:   True if the persistent cache of program images is used
+        :param optimize: True if instructions are fused into superinstructions by peephole optimizer
+        :param analyze:  True if programs are reduced by static analyzer
+        :param budget:   Budget of each program or None
+        :param backlog:  Maximal number of connections waiting for a worker
+        :param timeout:  Time of each receive or send of connection in seconds (request is read in time)
+        """
+        self.path = path
+        self.jobs = jobs or os.cpu_count() or 1
+        self.engine = engine
+        self.cached = cached
+        self.optimize = optimize
+        self.analyze = analyze
+        self.budget = budget
+        self.backlog = backlog
+        self.timeout = timeout
+        self.listener = None
+        self.workers = set()
+        self.draining = False
+        self.images = None
+
+    def run(self) -> int:
+        """
+        Listens on the socket and keeps workers running until SIGTERM or SIGINT.
+        Workers finish their programs before they exit (graceful drain), failed workers are replaced.
+
+        :return: Exit code of server.
+        """
+        self.listener = self.__listen()
+        previous = {signum: signal.signal(signum, self.drain) for signum in (signal.SIGTERM, signal.SIGINT)}
+        try:
+            for _ in range(self.jobs):
+                self.__spawn()
+            while self.workers:
+                pid, status = os.wait()
+                self.workers.discard(pid)
+                if not self.draining:
+                    self.__spawn()
+        finally:
+            for signum, handler in previous.items():
+                signal.signal(signum, handler)
+            self.listener.close()
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+        return 0
+
+    def drain(self, signum, frame):
+        """
+        Stops accepting of programs and stops workers when they finish running programs.
+
+        :param signum: Number of signal
+        :param frame:  Interrupted frame
+        """
+        self.draining = True
+        for pid in list(self.workers):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def serve(self):
+        """
+        Accepts and runs jobs in the worker process until it is stopped.
+        SIGTERM is blocked while a job runs, so it stops the worker only while it waits for the next one.
+        """
+        self.images = MemoryCache(Cache() if self.cached else None)
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        signal.signal(signal.SIGTERM, self.stop)
+        try:
+            while True:
+                connection, address = self.listener.accept()
+                connection.settimeout(self.timeout)
+                signal.pthread_sigmask(signal.SIG_BLOCK, [signal.SIGTERM])
+                try:
+                    with connection:
+                        self.handle(connection)
+                finally:
+                    signal.pthread_sigmask(signal.SIG_UNBLOCK, [signal.SIGTERM])
+        except ServerDrain:
+            pass
+
+    @staticmethod
+    def stop(signum, frame):
+        """
+        Stops the waiting worker (handler of SIGTERM).
+
+        :param signum: Number of signal
+        :param frame:  Interrupted frame
+        """
+        raise ServerDrain()
+
+    def handle(self, connection: socket.socket):
+        """
+        Runs a job (source and input frames) and sends frames of its output and exit code.
+        Connection with invalid request (also incomplete in time) is closed without response.
+
+        :param connection: Connection of client
+        """
+        try:
+            source = receiveFrame(connection, LIMIT)
+            stdin = receiveFrame(connection, LIMIT)
+            if source is None or stdin is None or source[0] != b'S' or stdin[0] != b'I':
+                return
+
+            stderr = Channel(connection, b'E')
+            try:
+                code = run(io.BytesIO(source[1]), io.StringIO(stdin[1].decode('utf-8', 'replace')),
+                           Channel(connection, b'O'), stderr, self.engine, self.images, optimize=self.optimize,
+                           analyze=self.analyze, budget=self.budget)
+            except OSError:
+                # Client closed the connection (or stopped reading) while the program was writing
+                raise
+            except Exception as exception:
+                # Failed program must not stop the worker
+                stderr.write(type(exception).__name__ + ': ' + str(exception) + '\n')
+                code = 99
+            sendFrame(connection, b'X', struct.pack('>i', code))
+        except OSError:
+            pass
+
+    def __listen(self) -> socket.socket:
+        """
+        Creates the listening socket, stale socket file is replaced.
+
+        :return: Listening socket.
+        """
+        try:
+            if stat.S_ISSOCK(os.stat(self.path).st_mode):
+                os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+        except OSError as exception:
+            self.handler.terminateProgram(11, 'Can not use socket: ' + str(exception))
+
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            listener.bind(self.path)
+            listener.listen(self.backlog)
+        except OSError as exception:
+            listener.close()
+            self.handler.terminateProgram(11, 'Can not listen on socket: ' + str(exception))
+        return listener
+
+    def __spawn(self):
+        """
+        Forks a worker process which serves jobs until it is stopped.
+        """
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                self.serve()
+            except BaseException:
+                code = 1
+            finally:
+                os._exit(code)
+        self.workers.add(pid)
@@ -0,0 +1,301 @@
+import hashlib
+import json
+import os
+import signal
+import threading
+import zlib
+
+from src.Interpret.Storage import Variable, Variables
+from src.Interpret.Value import NIL, INT, BOOL, STRING, nil
+from src.Support.ErrorHandler import ErrorHandler
+
+
+class Snapshot:
+    handler = ErrorHandler()
+
+    # Version of snapshot format
+    VERSION = 3
+
+    # Number of executed instructions between two checks of requested snapshot (signal)
+    INTERVAL = 1024
+
+    def __init__(self, path: str, every: int = None):
+        """
+        Initializes the writer of snapshots (state of interpret which can be resumed).
+        Snapshot is written when it is requested by SIGUSR1, every given number of executed instructions
+        and by BREAK instruction. Each snapshot replaces the previous one.
+
+        :param path:  Path of snapshot file
+        :param every: Number of executed instructions between two snapshots or None
+        """
+        self.path = path
+        self.every = every
+        self.requested = False
+        self.following = None
+        self.previous = None
+        self.program = None
+
+    def start(self, executed: int) -> int:
+        """
+        Starts watching for snapshots (signal handler is installed in the main thread).
+
+        :param executed: Number of executed instructions (not 0 in resumed program)
+        :return: Number of executed instructions when the snapshot is checked first.
+        """
+        if hasattr(signal, 'SIGUSR1') and threading.current_thread() is threading.main_thread():
+            self.previous = signal.signal(signal.SIGUSR1, self.request)
+        self.following = self.__following(executed)
+        return self.__checkpoint(executed)
+
+    def stop(self):
+        """
+        Stops watching for snapshots.
+        """
+        if self.previous is not None:
+            signal.signal(signal.SIGUSR1, self.previous)
+            self.previous = None
+
+    def request(self, signum, frame):
+        """
+        Requests a snapshot (handler of SIGUSR1), it is written before one of the following instructions.
+
+        :param signum: Number of signal
+        :param frame:  Interrupted frame
+        """
+        self.requested = True
+
+    def check(self, interpret, executed: int) -> int:
+        """
+        Writes the snapshot if it is requested or the number of executed instructions reached the next one.
+
+        :param interpret: Interpret before execution of the next instruction
+        :param executed:  Number of executed instructions
+        :return: Number of executed instructions when the snapshot is checked next time.
+        """
+        if self.requested or (self.following is not None and executed >= self.following):
+            self.requested = False
+            self.following = self.__following(executed)
+            self.save(interpret, interpret.position)
+        return self.__checkpoint(executed)
+
+    def save(self, interpret, position: int):
+        """
+        Writes the snapshot of interpret as compressed JSON (only data, no objects are serialized).
+        Output is flushed before and the size of output file is stored, so the output of resumed program
+        continues right after it (output written after the snapshot is truncated). File is replaced atomically.
+
+        :param interpret: Interpret
+        :param position:  Position of the next executed instruction
+        """
+        output = interpret.output.tell()
+        if self.program is None:
+            self.program = self.fingerprint(interpret.instructions)
+        storage = interpret.storage.export()
+        frames = storage['frames']
+        values, types = storage['stack']
+        state = {
+            'version': self.VERSION,
+            'program': self.program,
+            'counter': interpret.counter,
+            'position': position,
+            'frames': {
+                'global': self.__encodeFrame(frames['global']),
+                'locals': [self.__encodeFrame(frame) for frame in frames['locals']],
+                'temp': self.__encodeFrame(frames['temp']) if frames['temp'] is not None else None,
+            },
+            'stack': [self.__encodeValue(value, valueType) for value, valueType in zip(values, types)],
+            # Called instructions are stored by their positions
+            'calls': [interpret.positions[call.order] for call in interpret.storage.calls.registry],
+            'input': interpret.inputs.lines,
+            # Size of output file (null for streams)
+            'output': output,
+        }
+
+        temporary = self.path + '.tmp'
+        try:
+            with open(temporary, 'wb') as file:
+                file.write(zlib.compress(json.dumps(state, separators=(',', ':')).encode('utf-8')))
+            os.replace(temporary, self.path)
+        except OSError as exception:
+            self.handler.terminateProgram(12, 'Can not write snapshot: ' + str(exception))
+
+    @staticmethod
+    def restore(interpret, path: str):
+        """
+        Restores the state of interpret from the snapshot of the same program (before it is run).
+        Snapshot is validated completely before the state of interpret is changed.
+
+        :param interpret: Initialized interpret
+        :param path:      Path of snapshot file
+        """
+        try:
+            with open(path, 'rb') as file:
+                state = json.loads(zlib.decompress(file.read()).decode('utf-8'))
+        except OSError as exception:
+            Snapshot.handler.terminateProgram(11, 'Can not open snapshot: ' + str(exception))
+        except (zlib.error, UnicodeDecodeError, ValueError):
+            Snapshot.handler.terminateProgram(11, 'Snapshot ' + path + ' is invalid.')
+
+        if not isinstance(state, dict) or state.get('version') != Snapshot.VERSION:
+            Snapshot.handler.terminateProgram(11, 'Snapshot ' + path + ' is invalid.')
+        # Positions are valid only for the same instructions (also with the same --analyze and --optimize)
+        if state.get('program') != Snapshot.fingerprint(interpret.instructions):
+            Snapshot.handler.terminateProgram(11, 'Snapshot ' + path + ' was not created by this program.')
+
+        instructions = interpret.instructions
+        try:
+            counter = Snapshot.__decodeNumber(state['counter'])
+            position = Snapshot.__decodeNumber(state['position'], len(instructions))
+            frames = state['frames']
+            if not isinstance(frames, dict) or not isinstance(frames['locals'], list) \
+                    or not isinstance(state['stack'], list) or not isinstance(state['calls'], list):
+                raise ValueError('Invalid structure.')
+            values, types = list(), list()
+            for item in state['stack']:
+                value, valueType = Snapshot.__decodeValue(item)
+                values.append(value)
+                types.append(valueType)
+            storage = {
+                'frames': {
+                    'global': Snapshot.__decodeFrame(frames['global']),
+                    'locals': [Snapshot.__decodeFrame(frame) for frame in frames['locals']],
+                    'temp': Snapshot.__decodeFrame(frames['temp']) if frames['temp'] is not None else None,
+                },
+                'stack': (values, types),
+            }
+            calls = [instructions[Snapshot.__decodeNumber(call, len(instructions) - 1)] for call in state['calls']]
+            if any(call.opcode != 'CALL' for call in calls):
+                raise ValueError('Call stack does not contain CALL.')
+            lines = Snapshot.__decodeNumber(state['input'])
+            output = Snapshot.__decodeNumber(state['output']) if state['output'] is not None else None
+        except (KeyError, TypeError, ValueError):
+            Snapshot.handler.terminateProgram(11, 'Snapshot ' + path + ' is invalid.')
+
+        interpret.counter = counter
+        interpret.position = position
+        interpret.storage.restore(storage)
+        interpret.storage.calls.registry[:] = calls
+        interpret.inputs.skip(lines)
+        if output is not None:
+            interpret.output.truncate(output)
+
+    @staticmethod
+    def fingerprint(instructions: list) -> str:
+        """
+        Creates a fingerprint of executed instructions.
+
+        :param instructions: Instructions of program
+        :return: SHA-256 of orders, opcodes and operands.
+        """
+        digest = hashlib.sha256()
+        for instruction in instructions:
+            digest.update(repr((instruction.order, instruction.opcode,
+                                [(arg.type, arg.frame, arg.value) for arg in instruction.args])).encode('utf-8'))
+        return digest.hexdigest()
+
+    @staticmethod
+    def __encodeFrame(frame: Variables) -> dict:
+        """
+        Encodes variables of frame.
+
+        :param frame: Frame
+        :return: Name of variable to its encoded value.
+        """
+        return {name: Snapshot.__encodeValue(variable.value, variable.type) for name, variable in frame.registry.items()}
+
+    @staticmethod
+    def __encodeValue(value, valueType: int or None) -> list:
+        """
+        Encodes a value as JSON data, int is written in hexadecimal (it is not limited by number of digits).
+
+        :param value:     Native value (None if variable is not initialized)
+        :param valueType: Type tag of value
+        :return: Type tag and encoded value.
+        """
+        if valueType == INT:
+            return [valueType, format(value, 'x')]
+        if valueType == NIL:
+            return [valueType, None]
+        return [valueType, value]
+
+    @staticmethod
+    def __decodeFrame(data: dict) -> Variables:
+        """
+        Decodes a frame.
+
+        :param data: Name of variable to its encoded value
+        :return: Frame.
+        :raise ValueError: Data are invalid
+        """
+        if not isinstance(data, dict):
+            raise ValueError('Frame is not an object.')
+        frame = Variables()
+        for name, item in data.items():
+            value, valueType = Snapshot.__decodeValue(item, True)
+            frame.registry[name] = Variable(name, value, valueType)
+        return frame
+
+    @staticmethod
+    def __decodeValue(item: list, uninitialized: bool = False) -> tuple:
+        """
+        Decodes a value and checks that it matches its type.
+
+        :param item:          Type tag and encoded value
+        :param uninitialized: Whether value of uninitialized variable is allowed
+        :return: Native value and type tag.
+        :raise ValueError: Data are invalid
+        """
+        if not isinstance(item, list) or len(item) != 2:
+            raise ValueError('Value is not a pair.')
+        valueType, value = item
+        if uninitialized and valueType is None and value is None:
+            return None, None
+        # Tag has to be a number (true of JSON is equal to 1 too)
+        if type(valueType) is not int:
+            raise ValueError('Invalid type of value.')
+        if valueType == INT and isinstance(value, str):
+            return int(value, 16), INT
+        if valueType == BOOL and type(value) is bool:
+            return value, BOOL
+        if valueType == STRING and isinstance(value, str):
+            return value, STRING
+        if valueType == NIL and value is None:
+            return nil, NIL
+        raise ValueError('Value does not match its type.')
+
+    @staticmethod
+    def __decodeNumber(value, maximum: int = None) -> int:
+        """
+        Decodes a non-negative number (counter, position, ...).
+
+        :param value:   Decoded data
+        :param maximum: Maximal number or None
+        :return: Number.
+        :raise ValueError: Data are invalid
+        """
+        if type(value) is not int or value < 0 or (maximum is not None and value > maximum):
+            raise ValueError('Invalid number.')
+        return value
+
+    def __following(self, executed: int) -> int or None:
+        """
+        Gets the number of executed instructions when the next periodic snapshot is written.
+
+        :param executed: Number of executed instructions
+        :return: The next multiple of period or None if snapshots are not periodic.
+        """
+        if self.every is None:
+            return None
+        return (executed // self.every + 1) * self.every
+
+    def __checkpoint(self, executed: int) -> int:
+        """
+        Gets the next checkpoint.
+
+        :param executed: Number of executed instructions
+        :return: Number of executed instructions when the snapshot is checked next time.
+        """
+        checkpoint = executed + self.INTERVAL
+        if self.following is not None:
+            checkpoint = min(checkpoint, self.following)
+        return checkpoint
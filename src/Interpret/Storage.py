@@ -1,5 +1,6 @@
 from src.Interpret.Instruction import Argument
 from src.Interpret.Interfaces import ArgumentInterface, StackInterface
+from src.Interpret.Value import typeName, represent
 from src.Support.ErrorHandler import ErrorHandler
 
 
@@ -11,7 +12,7 @@ class Storage:
         Initializes a storage.
         """
         self.frames = Frames()
-        self.stack = Stack()
+        self.stack = DataStack()
         self.labels = Labels()
         self.calls = Stack()
 
@@ -24,21 +25,37 @@ class Storage:
                  "Temp Frame:\n" + self.frames.get('temp', True).statement() + "\n" \
                  "Local Frame:\n" + self.frames.get('local', True).statement() + "\n" \
                  "Stack:\n" + self.stack.statement() + "\n" \
-                 "Call Stack:\n" + self.calls.statement(True) + ""
+                 "Call Stack:\n" + self.calls.statement() + ""
         return string
 
+    def export(self) -> dict:
+        """
+        Exports frames and the data stack (state of snapshot).
+
+        :return: State of storage.
+        """
+        return {'frames': self.frames.export(), 'stack': self.stack.export()}
+
+    def restore(self, state: dict):
+        """
+        Restores frames and the data stack from the state of snapshot.
+
+        :param state: State of storage
+        """
+        self.frames.restore(state['frames'])
+        self.stack.restore(state['stack'])
+
 
 class Variable(ArgumentInterface):
-    def __init__(self, frame, name, value, varType):
+    __slots__ = ('name', 'value', 'type')
+
+    def __init__(self, name, value, varType):
         """
-        Initializes a variable.
-        :param frame:   Variable frame
+        Initializes a variable (frame of variable is the frame which holds it).
         :param name:    Variable name
         :param value:   Variable value
         :param varType: Variable type
         """
-        self.handler = ErrorHandler()
-        self.frame = frame
         self.name = name
         self.value = value
         self.type = varType
@@ -71,9 +88,9 @@ class Variables:
 
     def __init__(self):
         """
-        Initializes a variable registry.
+        Initializes a variable registry (name of variable -> variable).
         """
-        self.registry = list()
+        self.registry = dict()
 
     def register(self, arg: Argument) -> Variable:
         """
@@ -85,8 +102,8 @@ class Variables:
         if self.has(arg.value):
             self.handler.terminateProgram(52, "Variable '" + arg.value + "' already exists.")
 
-        variable = Variable(arg.frame, arg.value, None, None)
-        self.registry.append(variable)
+        variable = Variable(arg.value, None, None)
+        self.registry[arg.value] = variable
 
         return variable
 
@@ -97,10 +114,7 @@ class Variables:
         :param name: Name of variable.
         :return: True if variable found otherwise false.
         """
-        for item in self.registry:
-            if name == item.name:
-                return True
-        return False
+        return name in self.registry
 
     def get(self, name: str) -> Variable:
         """
@@ -109,17 +123,26 @@ class Variables:
         :param name: Name of variable.
         :return: Found variable object.
         """
-        for item in self.registry:
-            if item.name == name:
-                return item
-        self.handler.terminateProgram(52, "Variable '" + name + "' is not set")
+        variable = self.registry.get(name)
+        if variable is None:
+            self.handler.terminateProgram(52, "Variable '" + name + "' is not set")
+        return variable
+
+    def find(self, name: str) -> Variable or None:
+        """
+        Finds a variable in variables.
+
+        :param name: Name of variable.
+        :return: Found variable object or None if variable does not exist.
+        """
+        return self.registry.get(name)
 
     def getAll(self) -> list:
         """
         Registry of variables.
         :return: Registry of variables.
         """
-        return self.registry
+        return list(self.registry.values())
 
     def update(self, var: Variable, value: str, varType: str):
         """
@@ -129,20 +152,11 @@ class Variables:
         :param value:   New value of variable
         :param varType: New type of variable
         """
-        for index in range(len(self.registry)):
-            if self.registry[index].name == var.name:
-                self.registry[index].setValue(value)
-                self.registry[index].setType(varType)
-                return
-        self.handler.terminateProgram(52, "Variable '" + var.name + "' is not set")
-
-    def clone(self, variables):
-        """
-        Clones a variable into this registry.
-
-        :param variables: Variables that are cloned
-        """
-        self.registry = variables.registry
+        variable = self.registry.get(var.name)
+        if variable is None:
+            self.handler.terminateProgram(52, "Variable '" + var.name + "' is not set")
+        variable.setValue(value)
+        variable.setType(varType)
 
     def statement(self) -> str:
         """
@@ -151,22 +165,26 @@ class Variables:
         :return: Statement of variables as string.
         """
         string = ""
-        for item in self.registry:
-            string += '<' + str(item.type) + '>' + str(item.name) + '=' + str(item.value) + '\n'
+        for item in self.registry.values():
+            string += '<' + typeName(item.type) + '>' + str(item.name) + '=' + represent(item.value) + '\n'
         return string
 
 
 class Frames:
     handler = ErrorHandler()
 
+    # Names of frames in statement
+    aliases = {'global': 'GF', 'temp': 'TF', 'local': 'LF'}
+
     def __init__(self):
         """
         Initializes interpret frames.
+        Local frames are a stack, the current frames are kept by their names,
+        so PUSHFRAME and POPFRAME only move references.
         """
         self.__global = Variables()
-        self.__temp = None
         self.__locals = list()
-        self.__nesting = -1
+        self.current = {'GF': self.__global, 'TF': None, 'LF': None}
 
     def create(self, frameType: str):
         """
@@ -175,17 +193,14 @@ class Frames:
         :param frameType: Frame type
         """
         if frameType == 'local':
-            if self.__temp is None:
+            temp = self.current['TF']
+            if temp is None:
                 self.handler.terminateProgram(55, 'Accessing to non-defined temporary frame.')
-            variables = Variables()
-            variables.clone(self.__temp)
-            self.__locals.append(variables)
-            self.__nesting += 1
-            for variable in self.get('local').getAll():
-                variable.frame = 'LF'
-            self.__temp = None
+            self.__locals.append(temp)
+            self.current['LF'] = temp
+            self.current['TF'] = None
         if frameType == 'temp':
-            self.__temp = Variables()
+            self.current['TF'] = Variables()
 
     def get(self, frameType: str, statement=False) -> Variables or None:
         """
@@ -195,112 +210,167 @@ class Frames:
         :param statement: If a statement is called create new instance for local/temp frame if None.
         :return: Requested frame.
         """
-        if frameType == 'global' or frameType == 'GF':
-            return self.__global
-        if frameType == 'temp' or frameType == 'TF':
-            if statement and self.__temp is None:
-                return Variables()
-            return self.__temp
-        if frameType == 'local' or frameType == 'LF':
-            if statement:
-                return Variables()
-            if self.__nesting >= 0:
-                return self.__locals[self.__nesting]
-            return None
+        frameType = self.aliases.get(frameType, frameType)
+        if frameType == 'LF' and statement:
+            return Variables()
+        frame = self.current.get(frameType)
+        if statement and frame is None:
+            return Variables()
+        return frame
 
     def pop(self):
         """
         Pops local frame into a temporary frame.
         """
-        if self.__nesting != -1 and self.__nesting < len(self.__locals):
-            self.__temp = self.__locals[self.__nesting]
-            self.__nesting -= 1
-        else:
+        if not self.__locals:
             self.handler.terminateProgram(55, 'Accessing to non-existing local frame.')
+        self.current['TF'] = self.__locals.pop()
+        self.current['LF'] = self.__locals[-1] if self.__locals else None
 
-    def has(self, frameType):
+    def registerVar(self, var: Argument) -> Variable:
         """
-        Checks whether frame exists.
+        Registers a variable into a frame.
 
-        :param frameType: Type of frame
-        :return:
+        :param var: Variable that holds required parameters
+        :return: Registered Variable.
         """
-        if frameType == 'GF' or frameType == 'global':
-            return True
+        return self.__getFrame(var.frame).register(var)
 
-        frame = self.get(frameType)
+    @staticmethod
+    def updateVar(var: Variable, value, varType: int):
+        """
+        Updates a variable.
 
-        if isinstance(frame, Variables):
-            return True
-        if isinstance(frame, list):
-            return True
-        return True
+        :param var:     Variable that is updated.
+        :param value:   New value for variable.
+        :param varType: New type for variable.
+        """
+        var.value = value
+        var.type = varType
 
-    def registerVar(self, var: Argument) -> Variable:
+    def findVar(self, var: Argument) -> Variable or None:
         """
-        Registers a variable into a frame.
+        Finds a variable in a frame.
 
-        :param var: Variable that holds required parameters
-        :return: Registered Variable.
+        :param var: Argument of searched variable.
+        :return: Variable that is found in storage or None if frame does not have it.
         """
-        self.__checkFrame(var.frame)
-        return self.get(var.frame).register(var)
+        return self.__getFrame(var.frame).find(var.value)
 
-    def getVar(self, var: Argument or Variable):
+    def export(self) -> dict:
         """
-        Gets a variable from a frame.
+        Exports all frames (local frame is the top of stack of local frames).
 
-        :param var: Argument of Variable instance that is searched.
-        :return: Variable that is found in storage.
+        :return: State of frames.
         """
-        self.__checkFrame(var.frame)
-        if isinstance(var, Argument):
-            return self.get(var.frame).get(var.value)
-        if isinstance(var, Variable):
-            return self.get(var.frame).get(var.name)
+        return {'global': self.__global, 'locals': self.__locals, 'temp': self.current['TF']}
 
-    def updateVar(self, var: Variable, value: str, varType: str):
+    def restore(self, state: dict):
         """
-        Updates a variable.
+        Restores all frames in place, so references to the global registry stay valid.
 
-        :param var:     Variable that is updated.
-        :param value:   New value for variable.
-        :param varType: New type for variable.
-        :return:
+        :param state: State of frames
         """
-        self.__checkFrame(var.frame)
-        return self.get(var.frame).update(var, value, varType)
+        self.__global.registry.clear()
+        self.__global.registry.update(state['global'].registry)
+        self.__locals[:] = state['locals']
+        self.current['LF'] = self.__locals[-1] if self.__locals else None
+        self.current['TF'] = state['temp']
 
-    def hasVar(self, var: Argument):
+    def undefinedFrame(self, frameType: str):
         """
-        Check if frames contains variable.
+        Terminates the interpret because frame does not exist.
 
-        :param var: Searched variable.
-        :return: True if one of frames has variable otherwise false.
+        :param frameType: Frame type (TF or LF)
         """
-        self.__checkFrame(var.frame)
-        return self.get(var.frame).has(var.value)
+        frame = 'Temporary' if frameType == 'TF' else 'Local'
+        self.handler.terminateInterpret(55, frame + ' frame is not set.')
 
-    def __checkFrame(self, frameType):
+    def __getFrame(self, frameType: str) -> Variables:
         """
-        Checks if frame exists.
+        Gets the current frame, which has to exist.
 
-        :param frameType: Frame type
+        :param frameType: Frame type (GF, TF or LF)
+        :return: Current frame.
         """
-        if self.get(frameType) is None:
-            frame = 'Temporary' if frameType == 'TF' else 'Local'
-            self.handler.terminateInterpret(55, frame + ' frame is not set.')
+        frame = self.current[frameType]
+        if frame is None:
+            self.undefinedFrame(frameType)
+        return frame
 
 
 class Stack(StackInterface):
-    def statement(self, callStack=False):
+    def statement(self):
         string = ""
-        if callStack:
-            for item in self.registry:
-                string += '<' + str(item.opcode) + '@' + str(item.order) + '>\n'
-            return string
         for item in self.registry:
-            string += '<' + str(item.get('type')) + '>=' + str(item.get('value')) + '\n'
+            string += '<' + str(item.opcode) + '@' + str(item.order) + '>\n'
+        return string
+
+
+class DataStack:
+    handler = ErrorHandler()
+
+    def __init__(self):
+        """
+        Initializes a data stack, values and their types are kept in parallel lists
+        (no object is allocated for a pushed item).
+        """
+        self.values = list()
+        self.types = list()
+
+    def push(self, value, valueType):
+        """
+        Push value into a stack.
+
+        :param value:     Native value
+        :param valueType: Type tag of value
+        """
+        self.values.append(value)
+        self.types.append(valueType)
+
+    def pop(self):
+        """
+        Pops value from a stack.
+
+        :return: Value and type tag popped from a stack.
+        """
+        if not self.values:
+            self.empty()
+        return self.values.pop(), self.types.pop()
+
+    def clear(self):
+        """
+        Removes all values from a stack.
+        """
+        self.values.clear()
+        self.types.clear()
+
+    def empty(self):
+        """
+        Terminates the program, stack is empty.
+        """
+        self.handler.terminateProgram(56, 'Can not return - stack is empty.')
+
+    def export(self) -> tuple:
+        """
+        Exports values and their types.
+
+        :return: Lists of values and type tags.
+        """
+        return self.values, self.types
+
+    def restore(self, state: tuple):
+        """
+        Restores values and their types in place (compiled operations hold the lists).
+
+        :param state: Lists of values and type tags
+        """
+        self.values[:], self.types[:] = state
+
+    def statement(self):
+        string = ""
+        for value, valueType in zip(self.values, self.types):
+            string += '<' + typeName(valueType) + '>=' + represent(value) + '\n'
         return string
 
 
@@ -315,10 +385,7 @@ class Labels:
         self.registry[name] = order
 
     def has(self, name):
-        for label in self.registry:
-            if label == name:
-                return True
-        return False
+        return name in self.registry
 
     def getOrder(self, name):
         if not self.has(name):
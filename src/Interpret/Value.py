@@ -0,0 +1,67 @@
+# Type tags of values and arguments
+NIL = 0
+INT = 1
+BOOL = 2
+STRING = 3
+VAR = 4
+LABEL = 5
+TYPE = 6
+
+# Names of types by tag (as they are written in the XML source)
+typeNames = ('nil', 'int', 'bool', 'string', 'var', 'label', 'type')
+
+# Tags of types by name
+typeTags = {name: tag for tag, name in enumerate(typeNames)}
+
+
+class Nil:
+    """
+    Value of type nil, there is only one instance (nil).
+    """
+    __slots__ = ()
+
+    def __repr__(self):
+        return 'nil'
+
+    def __reduce__(self):
+        # Unpickled nil is the same instance
+        return 'nil'
+
+
+nil = Nil()
+
+
+def typeName(tag: int or None) -> str:
+    """
+    Gets name of type.
+
+    :param tag: Tag of type or None if value is not initialized
+    :return: Name of type.
+    """
+    return typeNames[tag] if tag is not None else str(tag)
+
+
+def represent(value) -> str:
+    """
+    Represents a value as it is written in IPPcode21 (true, false, nil, ...).
+
+    :param value: Native value
+    :return: Value as string.
+    """
+    if value is True:
+        return 'true'
+    if value is False:
+        return 'false'
+    return str(value)
+
+
+def divide(first: int, second: int) -> int:
+    """
+    Divides integers exactly, quotient is truncated toward zero (IDIV).
+
+    :param first:  Dividend
+    :param second: Divisor (not zero)
+    :return: Quotient.
+    """
+    quotient = abs(first) // abs(second)
+    return -quotient if (first < 0) != (second < 0) else quotient
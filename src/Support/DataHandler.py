@@ -1,7 +1,29 @@
-import json
+import os
 
-# JSON of instructions
-instructions = json.loads(open('src/Support/api/instructions.json').read())
+# Directory of JSON files (relative to the package, not to the current directory)
+directory = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'api')
 
-# JSON of errors
-errors = json.loads(open('src/Support/api/errors.json').read())
+
+def load(name: str) -> dict:
+    """
+    Loads a JSON file of api directory.
+
+    :param name: Name of JSON file (without extension)
+    :return: Decoded JSON.
+    """
+    import json
+    with open(os.path.join(directory, name + '.json')) as file:
+        return json.load(file)
+
+
+def __getattr__(name: str) -> dict:
+    """
+    Loads instructions and errors on first access, so the interpret does not pay for them on every start.
+
+    :param name: Name of attribute (instructions or errors)
+    :return: JSON of instructions or errors.
+    """
+    if name not in ['instructions', 'errors']:
+        raise AttributeError("module '" + __name__ + "' has no attribute '" + name + "'")
+    value = globals()[name] = load(name)
+    return value
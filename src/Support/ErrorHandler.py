@@ -1,4 +1,5 @@
-from src.Support.DataHandler import errors
+from src.Support import DataHandler
+from src.Support.Exception import ExitException, createException
 
 
 class ErrorHandler:
@@ -16,14 +17,14 @@ class ErrorHandler:
         :param code:    Exit code
         :param message: Exit message
         """
-        if str(code) not in errors:
+        if str(code) not in DataHandler.errors:
             print(message) if message and self.debug else None
-            exit(code)
+            raise createException(code, message)
 
         if self.debug:
-            print(errors[str(code)])
+            print(DataHandler.errors[str(code)])
             print(message) if message else None
-        exit(code)
+        raise createException(code, message)
 
     def terminateInterpret(self, code: int, message: str = None):
         """
@@ -32,13 +33,25 @@ class ErrorHandler:
         :param code:    Exit code
         :param message: Exit message
         """
-        if str(code) not in errors:
+        order = self.instruction.order if self.instruction is not None else None
+
+        if str(code) not in DataHandler.errors:
             print(message) if message and self.debug else None
-            exit(code)
+            raise createException(code, message, order)
 
         if self.debug:
-            print(errors[str(code)])
+            print(DataHandler.errors[str(code)])
             if self.instruction is not None:
                 print(self.instruction.opcode + '@' + str(self.instruction.order), end=': ')
             print(message) if message else print('Unknown error.')
-        exit(code)
+        raise createException(code, message, order)
+
+    def exitProgram(self, code: int, message: str = None):
+        """
+        Terminates the program by EXIT instruction.
+
+        :param code:    Exit code (0-49)
+        :param message: Exit message
+        """
+        print(message) if message and self.debug else None
+        raise ExitException(code, message)
@@ -0,0 +1,96 @@
+from src.Support import DataHandler
+
+
+class InterpretException(Exception):
+    def __init__(self, code: int, message: str = None, order: int = None):
+        """
+        Initializes an exception which terminates the interpretation.
+
+        :param code:    Exit code
+        :param message: Exit message
+        :param order:   Order of instruction where the exception was raised
+        """
+        super().__init__(message)
+        self.code = code
+        self.message = message
+        self.order = order
+
+    def __str__(self):
+        """
+        Describes the exception.
+
+        :return: Code, its description, order of instruction and message.
+        """
+        string = str(self.code) + ': ' + DataHandler.errors.get(str(self.code), 'Program terminated.')
+        if self.order is not None:
+            string += ' (order ' + str(self.order) + ')'
+        if self.message:
+            string += '\nDetails: ' + self.message
+        return string
+
+
+class ExitException(InterpretException):
+    """
+    Program was terminated by EXIT instruction (or --help).
+    """
+
+
+class ArgumentException(InterpretException):
+    """
+    Program arguments or files are invalid (10, 11, 12).
+    """
+
+
+class SourceException(InterpretException):
+    """
+    XML source is not well-formed or has invalid structure (31, 32).
+    """
+
+
+class SemanticException(InterpretException):
+    """
+    Semantic error in source (52).
+    """
+
+
+class RuntimeException(InterpretException):
+    """
+    Error during interpretation (53-58).
+    """
+
+
+class LimitException(InterpretException):
+    """
+    Program exceeded its execution budget (60, 61, 62).
+    """
+
+
+class InternalException(InterpretException):
+    """
+    Internal error (99).
+    """
+
+
+# Exceptions by exit code
+exceptions = {
+    0: ExitException,
+    10: ArgumentException, 11: ArgumentException, 12: ArgumentException,
+    31: SourceException, 32: SourceException,
+    52: SemanticException,
+    53: RuntimeException, 54: RuntimeException, 55: RuntimeException,
+    56: RuntimeException, 57: RuntimeException, 58: RuntimeException,
+    60: LimitException, 61: LimitException, 62: LimitException,
+    99: InternalException,
+}
+
+
+def createException(code: int, message: str = None, order: int = None) -> InterpretException:
+    """
+    Creates an exception of exit code.
+
+    :param code:    Exit code
+    :param message: Exit message
+    :param order:   Order of instruction
+    :return: Exception of exit code.
+    """
+    return exceptions.get(code, InterpretException)(code, message, order)
@@ -0,0 +1,62 @@
+import io
+
+import pytest
+
+from benchmark.program import createSource
+from src.Interpret.Core import Interpret
+
+
+def analyze(code: list) -> Interpret:
+    """
+    Loads an analyzed program.
+
+    :param code: Lines of program
+    :return: Interpret with reduced program and its analyzer.
+    """
+    return Interpret(io.BytesIO(createSource(code).encode('utf-8')), io.StringIO(''), errorFile=io.StringIO(),
+                     analyze=True)
+
+
+def test_unreachable():
+    interpret = analyze(['JUMP end', 'WRITE int@1', 'LABEL unused', 'WRITE int@2', 'LABEL end', 'WRITE int@3'])
+    assert [instruction.order for instruction in interpret.instructions] == [1, 5, 6]
+    assert [len(block) for block in interpret.analyzer.removed] == [1, 2]
+
+
+@pytest.mark.parametrize('operation, result', [
+    ('ADD GF@x int@2 int@3', 'int@5'),
+    ('SUB GF@x int@2 int@3', 'int@-1'),
+    ('MUL GF@x int@-4 int@3', 'int@-12'),
+    ('IDIV GF@x int@7 int@2', 'int@3'),
+    ('IDIV GF@x int@-7 int@2', 'int@-3'),
+    ('IDIV GF@x int@7 int@-2', 'int@-3'),
+    ('IDIV GF@x int@123456789012345678901234567890123 int@3', 'int@41152263004115226300411522630041'),
+    ('LT GF@x int@1 int@2', 'bool@true'),
+    ('EQ GF@x string@a string@b', 'bool@false'),
+    ('AND GF@x bool@true bool@false', 'bool@false'),
+    ('NOT GF@x bool@false', 'bool@true'),
+])
+def test_folding(operation, result):
+    interpret = analyze(['DEFVAR GF@x', operation, 'WRITE GF@x'])
+    report = interpret.analyzer.report()
+    assert '2 ' + operation.split()[0] + ' -> MOVE ' + result + '\n' in report
+
+
+@pytest.mark.parametrize('operation', [
+    # Errors are left for runtime
+    'IDIV GF@x int@1 int@0',
+    'ADD GF@x int@1 string@a',
+    'LT GF@x nil@nil int@1',
+    # Variables are not constants
+    'ADD GF@x GF@x int@1',
+])
+def test_not_folded(operation):
+    interpret = analyze(['DEFVAR GF@x', 'MOVE GF@x int@1', operation, 'WRITE GF@x'])
+    assert interpret.analyzer.folded == []
+    assert interpret.instructions[2].opcode == operation.split()[0]
+
+
+def test_unused():
+    interpret = analyze(['DEFVAR GF@x', 'DEFVAR GF@y', 'LABEL a', 'LABEL b', 'WRITE GF@y', 'JUMP b'])
+    assert [instruction.order for instruction in interpret.analyzer.unusedVariables] == [1]
+    assert [instruction.order for instruction in interpret.analyzer.unusedLabels] == [3]
@@ -0,0 +1,45 @@
+from benchmark.program import createSource
+from src.Interpret.Batch import Batch
+
+# Test cases: name, lines of program, input, expected output and exit code
+cases = [
+    ('square', ['DEFVAR GF@x', 'READ GF@x int', 'MUL GF@x GF@x GF@x', 'WRITE GF@x'], '7\n', '49', 0),
+    ('wrong', ['WRITE int@1'], '', '2', 0),
+    ('error', ['WRITE GF@x'], '', '', 54),
+    ('exit', ['EXIT int@3'], '', '', 3),
+    ('loop', ['LABEL loop', 'JUMP loop'], '', '', 0),
+]
+
+
+def createCases(directory):
+    """
+    Creates test cases in the layout of test.php.
+
+    :param directory: Directory of test cases
+    """
+    for name, code, stdin, output, rc in cases:
+        (directory / (name + '.src')).write_text(createSource(code), encoding='utf-8')
+        (directory / (name + '.in')).write_text(stdin, encoding='utf-8')
+        (directory / (name + '.out')).write_text(output, encoding='utf-8')
+        (directory / (name + '.rc')).write_text(str(rc), encoding='utf-8')
+
+
+def test_directory(tmp_path):
+    createCases(tmp_path)
+    report = Batch(str(tmp_path), jobs=2, timeout=0.5, cached=False).run()
+    results = {result['name']: result for result in report['cases']}
+
+    assert report['summary']['total'] == 5
+    assert report['summary']['passed'] == 3
+    assert report['summary']['timeouts'] == 1
+    assert [name for name in sorted(results) if not results[name]['passed']] == ['loop', 'wrong']
+    assert results['exit']['code'] == 3
+    assert results['loop']['status'] == 'timeout'
+
+
+def test_manifest(tmp_path):
+    createCases(tmp_path)
+    (tmp_path / 'cases.txt').write_text('# comment\nsquare.src\nerror.src error.in\n', encoding='utf-8')
+    report = Batch(str(tmp_path / 'cases.txt'), jobs=1, cached=False).run()
+    assert [result['name'] for result in report['cases']] == ['error', 'square']
+    assert report['summary']['passed'] == 2
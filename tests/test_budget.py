@@ -0,0 +1,61 @@
+import io
+import os
+import subprocess
+import sys
+
+import pytest
+
+from benchmark.program import createSource
+from src.Interpret.Budget import Budget
+from src.Interpret.Runner import run
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Infinite loop
+loop = ['DEFVAR GF@i', 'MOVE GF@i int@0', 'LABEL loop', 'ADD GF@i GF@i int@1', 'JUMP loop']
+
+# String which doubles its length in each iteration
+growth = ['DEFVAR GF@s', 'MOVE GF@s string@x', 'LABEL loop', 'CONCAT GF@s GF@s GF@s', 'JUMP loop']
+
+
+def execute(code: list, budget: Budget, engine: str) -> tuple:
+    """
+    Runs a program with a budget.
+
+    :param code:   Lines of program
+    :param budget: Execution budget
+    :param engine: Execution engine
+    :return: Exit code and standard error output of program.
+    """
+    stderr = io.StringIO()
+    code = run(io.BytesIO(createSource(code).encode('utf-8')), io.StringIO(''), io.StringIO(), stderr, engine,
+               budget=budget)
+    return code, stderr.getvalue()
+
+
+@pytest.mark.parametrize('engine', ['reference', 'compiled'])
+def test_steps(engine):
+    code, stderr = execute(loop, Budget(steps=5000), engine)
+    assert code == 60
+    assert '5000 executed instructions' in stderr
+
+
+@pytest.mark.parametrize('engine', ['reference', 'compiled'])
+def test_steps_are_exact(engine):
+    code = ['DEFVAR GF@i', 'MOVE GF@i int@1', 'WRITE GF@i']
+    assert execute(code, Budget(steps=3), engine)[0] == 0
+    assert execute(code, Budget(steps=2), engine)[0] == 60
+
+
+@pytest.mark.parametrize('engine', ['reference', 'compiled'])
+def test_timeout(engine):
+    assert execute(loop, Budget(timeout=0.2), engine)[0] == 61
+
+
+def test_memory(tmp_path):
+    # Address space is limited, so the program runs in a new process
+    path = tmp_path / 'growth.xml'
+    path.write_text(createSource(growth), encoding='utf-8')
+    result = subprocess.run([sys.executable, os.path.join(root, 'interpret.py'), '--source=' + str(path),
+                             '--max-memory=64'], capture_output=True, timeout=60)
+    assert result.returncode == 62
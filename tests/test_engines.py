@@ -0,0 +1,51 @@
+import glob
+import io
+import os
+import re
+
+import pytest
+
+from src.Interpret.Runner import run
+
+corpus = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'corpus')
+programs = sorted(os.path.basename(path)[:-4] for path in glob.glob(os.path.join(corpus, '*.src')))
+
+# Report of static analyzer written before the program runs
+report = re.compile(r'========== Analysis ==========\n.*?==============================\n', re.S)
+
+# Combinations of --optimize and --analyze
+options = [(False, False), (True, False), (False, True), (True, True)]
+
+
+def execute(name: str, engine: str, optimize: bool, analyze: bool) -> tuple:
+    """
+    Runs a program of corpus.
+
+    :param name:     Name of program (its input is in the file with .in extension)
+    :param engine:   Execution engine
+    :param optimize: True if the program is optimized
+    :param analyze:  True if the program is analyzed
+    :return: Exit code, standard output and standard error output of program.
+    """
+    path = os.path.join(corpus, name + '.in')
+    stdin = open(path, encoding='utf-8') if os.path.exists(path) else io.StringIO('')
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with stdin:
+        code = run(os.path.join(corpus, name + '.src'), stdin, stdout, stderr, engine, optimize=optimize,
+                   analyze=analyze)
+    return code, stdout.getvalue(), stderr.getvalue()
+
+
+@pytest.mark.parametrize('optimize, analyze', options)
+@pytest.mark.parametrize('name', programs)
+def test_engines_are_equal(name, optimize, analyze):
+    assert execute(name, 'compiled', optimize, analyze) == execute(name, 'reference', optimize, analyze)
+
+
+@pytest.mark.parametrize('optimize, analyze', options[1:])
+@pytest.mark.parametrize('name', programs)
+def test_options_keep_behaviour(name, optimize, analyze):
+    code, stdout, stderr = execute(name, 'reference', optimize, analyze)
+    if analyze:
+        stderr = report.sub('', stderr, count=1)
+    assert (code, stdout, stderr) == execute(name, 'reference', False, False)
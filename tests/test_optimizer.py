@@ -0,0 +1,40 @@
+import io
+
+import pytest
+
+from benchmark.program import createSource
+from src.Interpret.Core import Interpret
+from src.Interpret.Optimizer import Optimizer
+
+
+def load(code: list) -> list:
+    """
+    Loads an optimized program.
+
+    :param code: Lines of program
+    :return: Opcodes of executed instructions (fused parts are skipped).
+    """
+    interpret = Interpret(io.BytesIO(createSource(code).encode('utf-8')), io.StringIO(''), optimize=True)
+    opcodes = list()
+    position = 0
+    while position < len(interpret.instructions):
+        instruction = interpret.instructions[position]
+        opcodes.append(instruction.opcode)
+        position += len(getattr(instruction, 'parts', (instruction,)))
+    return opcodes
+
+
+@pytest.mark.parametrize('code, opcodes', [
+    (['DEFVAR GF@b', 'LABEL a', 'LT GF@b int@1 int@2', 'JUMPIFEQ a GF@b bool@false'],
+     ['DEFVAR', 'LABEL', Optimizer.COMPARE_JUMP]),
+    (['DEFVAR GF@x', 'PUSHS int@1', 'POPS GF@x'], ['DEFVAR', Optimizer.STACK_MOVE]),
+    (['DEFVAR GF@x', 'MOVE GF@x int@1'], [Optimizer.DEFINE_MOVE]),
+    (['DEFVAR GF@x', 'MOVE GF@y int@1'], ['DEFVAR', 'MOVE']),
+    (['DEFVAR GF@i', 'MOVE GF@i int@0', 'ADD GF@i GF@i int@1'], [Optimizer.DEFINE_MOVE, Optimizer.INCREMENT]),
+    # Branch on another variable is not fused
+    (['DEFVAR GF@b', 'DEFVAR GF@c', 'LABEL a', 'LT GF@b int@1 int@2', 'JUMPIFEQ a GF@c bool@false'],
+     ['DEFVAR', 'DEFVAR', 'LABEL', 'LT', 'JUMPIFEQ']),
+])
+def test_patterns(code, opcodes):
+    assert load(code) == opcodes
+
@@ -0,0 +1,39 @@
+import io
+
+import pytest
+
+from src.Interpret.Runner import execute
+from src.Support.Exception import InterpretException
+
+
+def load(args: str) -> str:
+    """
+    Loads a program with one ADD instruction.
+
+    :param args: XML of arg nodes
+    :return: Details of XML error.
+    """
+    source = '<?xml version="1.0" encoding="UTF-8"?>\n<program language="IPPcode21">' \
+             '<instruction order="1" opcode="ADD">' + args + '</instruction></program>'
+    with pytest.raises(InterpretException) as exception:
+        execute(io.BytesIO(source.encode('utf-8')), io.StringIO(''), io.StringIO(), io.StringIO())
+    assert exception.value.code == 32
+    return str(exception.value).split('Details: ')[1]
+
+
+@pytest.mark.parametrize('args, message', [
+    # The first invalid arg is reported, the following ones are not checked
+    ('<arg1 type="int">1</arg1><arg9 type="int">1</arg9><arg3 type="int">x</arg3>',
+     'ADD expected var but type int given.'),
+    ('<arg1 type="var">GF@x</arg1><argx type="int">1</argx><arg3 type="int">x</arg3>',
+     'ADD has invalid name of arg.'),
+    ('<arg1 type="var">GF@x</arg1><arg2 type="int" size="1">1</arg2><arg3 type="int">1</arg3>',
+     '<arg2> has illegal attributes'),
+    ('<arg1 type="var">GF@x</arg1><arg2 type="int">1</arg2><arg4 type="int">1</arg4>',
+     'ADD has invalid name of arg.'),
+    ('<arg1 type="var">GF@x</arg1><arg2 type="int">1</arg2><arg2 type="int">1</arg2>',
+     'ADD has invalid number of operands.'),
+    ('<arg1 type="var">GF@x</arg1><arg2 type="int">1</arg2>', 'ADD has invalid number of operands.'),
+])
+def test_invalid_args(args, message):
+    assert load(args) == message
@@ -0,0 +1,46 @@
+import io
+import json
+
+import pytest
+
+from benchmark.program import createSource
+from src.Interpret.Runner import run
+
+
+def execute(code: list, profile: str) -> tuple:
+    """
+    Runs a profiled program.
+
+    :param code:    Lines of program
+    :param profile: Path of profile
+    :return: Exit code and standard error output of program.
+    """
+    stderr = io.StringIO()
+    code = run(io.BytesIO(createSource(code).encode('utf-8')), io.StringIO(''), io.StringIO(), stderr,
+               profile=profile)
+    return code, stderr.getvalue()
+
+
+@pytest.mark.parametrize('code, expected', [
+    (['WRITE int@1'], 0),
+    (['EXIT int@3'], 3),
+    (['WRITE GF@x'], 54),
+])
+def test_profile(tmp_path, code, expected):
+    path = tmp_path / 'profile.json'
+    assert execute(code, str(path))[0] == expected
+    assert isinstance(json.loads(path.read_text()), dict)
+
+
+@pytest.mark.parametrize('code, expected', [
+    (['EXIT int@3'], 3),
+    (['WRITE GF@x'], 54),
+])
+def test_failed_write_keeps_code(tmp_path, code, expected):
+    code, stderr = execute(code, str(tmp_path / 'missing' / 'profile.json'))
+    assert code == expected
+    assert 'Can not write profile' in stderr
+
+
+def test_failed_write(tmp_path):
+    assert execute(['WRITE int@1'], str(tmp_path / 'missing' / 'profile.json'))[0] == 12
@@ -0,0 +1,49 @@
+import io
+
+import pytest
+
+from benchmark.program import createSource
+from src.Interpret.Runner import execute, run
+from src.Support.Exception import InterpretException
+
+# Reads a line and an integer and writes them
+echo = createSource(['DEFVAR GF@s', 'DEFVAR GF@n', 'READ GF@s string', 'READ GF@n int', 'WRITE GF@s',
+                     'WRITE GF@n']).encode('utf-8')
+
+
+@pytest.mark.parametrize('engine', ['reference', 'compiled'])
+def test_binary_input(engine):
+    stdin = io.BytesIO('žluťoučký\n42\n'.encode('utf-8'))
+    stdout = io.StringIO()
+    assert run(io.BytesIO(echo), stdin, stdout, io.StringIO(), engine) == 0
+    assert stdout.getvalue() == 'žluťoučký42'
+    # Input stream of caller stays open
+    assert not stdin.closed
+
+
+@pytest.mark.parametrize('engine', ['reference', 'compiled'])
+def test_text_input(engine):
+    stdout = io.StringIO()
+    assert run(io.BytesIO(echo), io.StringIO(' a \n12\n'), stdout, io.StringIO(), engine) == 0
+    assert stdout.getvalue() == 'a12'
+
+
+def test_codes():
+    assert run(io.BytesIO(createSource(['EXIT int@9']).encode('utf-8'))) == 9
+    assert run(io.BytesIO(b'<program'), io.StringIO('')) == 31
+    assert run(io.BytesIO(echo), io.StringIO(''), engine='unknown') == 10
+
+
+def test_exception():
+    with pytest.raises(InterpretException) as exception:
+        execute(io.BytesIO(createSource(['DEFVAR GF@x', 'IDIV GF@x int@1 int@0']).encode('utf-8')))
+    assert exception.value.code == 57
+
+
+def test_many_programs():
+    # Errors do not terminate the process, so programs run one after another
+    for number in range(3):
+        stdout = io.StringIO()
+        assert run(io.BytesIO(createSource(['WRITE int@' + str(number)]).encode('utf-8')), None, stdout) == 0
+        assert stdout.getvalue() == str(number)
+        assert run(io.BytesIO(createSource(['POPFRAME']).encode('utf-8')), None, io.StringIO()) == 55
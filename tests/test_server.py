@@ -0,0 +1,93 @@
+import multiprocessing
+import os
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from benchmark.program import createSource
+from src.Interpret.Server import Server, header, submit
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Reads a number and writes its square
+square = createSource(['DEFVAR GF@x', 'READ GF@x int', 'MUL GF@x GF@x GF@x', 'WRITE GF@x']).encode('utf-8')
+
+# Counts to the read number
+count = createSource(['DEFVAR GF@i', 'DEFVAR GF@n', 'READ GF@n int', 'MOVE GF@i int@0', 'LABEL loop',
+                      'ADD GF@i GF@i int@1', 'JUMPIFNEQ loop GF@i GF@n', 'WRITE GF@i']).encode('utf-8')
+
+
+@pytest.fixture
+def server(tmp_path):
+    """
+    Starts the server with one worker.
+
+    :return: Process of server and path of its socket.
+    """
+    path = str(tmp_path / 'interpret.sock')
+    process = subprocess.Popen([sys.executable, os.path.join(root, 'interpret.py'), '--serve=' + path, '--jobs=1'])
+    deadline = time.monotonic() + 10
+    while not os.path.exists(path) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    yield process, path
+    # Server is drained, so its workers exit too
+    process.terminate()
+    process.wait(10)
+
+
+def test_submit(server):
+    process, path = server
+    for number in range(5):
+        assert submit(path, square, str(number).encode()) == (str(number * number), '', 0)
+
+
+def test_errors(server):
+    process, path = server
+    assert submit(path, b'<program', b'')[2] == 31
+    assert submit(path, createSource(['WRITE GF@x']).encode('utf-8'), b'')[2] == 54
+    # Worker keeps running after failed programs
+    assert submit(path, square, b'3') == ('9', '', 0)
+
+
+def test_drain(server):
+    process, path = server
+    result = list()
+    job = threading.Thread(target=lambda: result.append(submit(path, count, b'300000')))
+    job.start()
+    time.sleep(0.2)
+
+    assert job.is_alive()
+    process.send_signal(signal.SIGTERM)
+    job.join(60)
+    assert result == [('300000', '', 0)]
+    assert process.wait(10) == 0
+    assert not os.path.exists(path)
+
+
+@pytest.mark.parametrize('data', [b'', header.pack(b'S', 100) + b'<program'])
+def test_idle_client(tmp_path, data):
+    # Worker of server is forked, so the timeout can be short
+    path = str(tmp_path / 'interpret.sock')
+    process = multiprocessing.get_context('fork').Process(
+        target=lambda: Server(path, 1, cached=False, timeout=0.5).run())
+    process.start()
+    deadline = time.monotonic() + 10
+    while not os.path.exists(path) and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(path)
+        connection.sendall(data)
+        time.sleep(0.1)
+        os.kill(process.pid, signal.SIGTERM)
+        # Incomplete request is closed without response
+        connection.settimeout(10)
+        assert connection.recv(1) == b''
+
+    process.join(10)
+    assert process.exitcode == 0
@@ -0,0 +1,107 @@
+import io
+import json
+import zlib
+
+import pytest
+
+from benchmark.program import createSource
+from src.Interpret.Budget import Budget
+from src.Interpret.Runner import run
+from src.Interpret.Snapshot import Snapshot
+
+# Reads lines, calls functions in local frames and pushes lines to the data stack,
+# finally it writes lines from the stack until it is empty (error 56)
+program = ['DEFVAR GF@i', 'DEFVAR GF@n', 'DEFVAR GF@line', 'READ GF@n int', 'MOVE GF@i int@0',
+           'LABEL loop', 'JUMPIFEQ end GF@i GF@n', 'READ GF@line string', 'CREATEFRAME', 'DEFVAR TF@x',
+           'MOVE TF@x GF@i', 'PUSHFRAME', 'CALL f', 'POPFRAME', 'PUSHS GF@line', 'ADD GF@i GF@i int@1', 'JUMP loop',
+           'LABEL end', 'POPS GF@line', 'WRITE GF@line', 'WRITE string@\\010', 'JUMP end',
+           'LABEL f', 'CREATEFRAME', 'DEFVAR TF@y', 'MUL TF@y LF@x LF@x', 'PUSHFRAME', 'CALL g', 'POPFRAME',
+           'WRITE LF@x', 'WRITE string@:', 'RETURN',
+           'LABEL g', 'WRITE LF@y', 'WRITE string@\\032', 'RETURN']
+
+stdin = '50\n' + ''.join('line' + str(number) + '\n' for number in range(50))
+
+
+def execute(source: bytes, engine: str, optimize: bool, budget: Budget = None, snapshot: Snapshot = None,
+            resume: str = None) -> tuple:
+    """
+    Runs the program.
+
+    :param source:   XML source of program
+    :param engine:   Execution engine
+    :param optimize: True if the program is optimized
+    :param budget:   Execution budget or None
+    :param snapshot: Writer of snapshots or None
+    :param resume:   Path of resumed snapshot or None
+    :return: Exit code and standard output of program.
+    """
+    stdout = io.StringIO()
+    code = run(io.BytesIO(source), io.StringIO(stdin), stdout, io.StringIO(), engine, optimize=optimize,
+               budget=budget, snapshot=snapshot, resume=resume)
+    return code, stdout.getvalue()
+
+
+@pytest.mark.parametrize('steps', [1, 7, 500, 801])
+@pytest.mark.parametrize('optimize', [False, True])
+@pytest.mark.parametrize('engine', ['reference', 'compiled'])
+def test_resume(tmp_path, engine, optimize, steps):
+    source = createSource(program).encode('utf-8')
+    path = str(tmp_path / 'program.snap')
+    full = execute(source, engine, optimize)
+    assert full[0] == 56
+
+    # Snapshot is written right before the budget stops the program
+    code, prefix = execute(source, engine, optimize, Budget(steps=steps), Snapshot(path, steps))
+    assert code == 60
+    code, rest = execute(source, engine, optimize, resume=path)
+    assert (code, prefix + rest) == full
+
+
+
+@pytest.mark.parametrize('every', [25, 40])
+def test_resume_output_file(tmp_path, every):
+    # Output written after the snapshot (every=25) is dropped, the rest is appended
+    source = createSource(['DEFVAR GF@i', 'MOVE GF@i int@0', 'LABEL loop', 'WRITE GF@i', 'ADD GF@i GF@i int@1',
+                           'JUMPIFNEQ loop GF@i int@50']).encode('utf-8')
+    path = str(tmp_path / 'program.snap')
+    output = str(tmp_path / 'output.txt')
+    assert run(io.BytesIO(source), io.StringIO(''), output, io.StringIO(), budget=Budget(steps=40),
+               snapshot=Snapshot(path, every)) == 60
+    assert run(io.BytesIO(source), io.StringIO(''), output, io.StringIO(), resume=path) == 0
+    with open(output) as file:
+        assert file.read() == ''.join(str(number) for number in range(50))
+
+def test_snapshot_is_data(tmp_path):
+    source = createSource(program).encode('utf-8')
+    path = str(tmp_path / 'program.snap')
+    execute(source, 'reference', False, Budget(steps=100), Snapshot(path, 100))
+    with open(path, 'rb') as file:
+        state = json.loads(zlib.decompress(file.read()))
+    assert state['version'] == Snapshot.VERSION
+    assert state['counter'] == 100
+
+
+@pytest.mark.parametrize('change', [
+    lambda state: state.pop('frames'),
+    lambda state: state.update(position=10 ** 6),
+    lambda state: state.update(calls=[0]),
+    lambda state: state.update(stack=[['int', 'x']]),
+    lambda state: state.update(program='0' * 64),
+])
+def test_invalid_snapshot(tmp_path, change):
+    source = createSource(program).encode('utf-8')
+    path = str(tmp_path / 'program.snap')
+    execute(source, 'reference', False, Budget(steps=100), Snapshot(path, 100))
+    with open(path, 'rb') as file:
+        state = json.loads(zlib.decompress(file.read()))
+    change(state)
+    with open(path, 'wb') as file:
+        file.write(zlib.compress(json.dumps(state).encode('utf-8')))
+    assert execute(source, 'reference', False, resume=path) == (11, '')
+
+
+def test_pickle_is_rejected(tmp_path):
+    import pickle
+    path = tmp_path / 'program.snap'
+    path.write_bytes(zlib.compress(pickle.dumps({'version': Snapshot.VERSION})))
+    assert execute(createSource(program).encode('utf-8'), 'reference', False, resume=str(path)) == (11, '')